@@ -0,0 +1,21 @@
+"""
+DALAS (Determining Artistic Level and Aesthetic Significance).
+
+Subpackages:
+    color        Color metrics, feature extraction, similarity index, pixel cache.
+    composition  Layout metrics (rule of thirds, symmetry, edges, detail) on an image pyramid.
+    artist       Artist profile picture and biography analysis.
+    scrape       Artsper scrapers.
+    analysis     Dataset cleaning / EDA, tag index, duplicate detection.
+
+DalasScorer (dalas.scorer) combines their metrics into the three README
+pillar scores. dalas.profiling samples long runs (`--profile DIR`).
+
+Importing dalas is cheap: subpackages and heavy dependencies (cv2, scipy,
+seaborn, selenium, bs4...) are only loaded when first used.
+"""
+from ._lazy import lazy_exports
+
+__all__ = ['color', 'composition', 'artist', 'scrape', 'analysis']
+
+__getattr__, __dir__ = lazy_exports(__name__, {'DalasScorer': 'scorer'}, submodules=__all__)
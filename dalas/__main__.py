@@ -0,0 +1,316 @@
+"""
+Command line entry point: python -m dalas <command> [options]
+
+Each command imports its implementation only when it runs, so the CLI
+starts without loading numpy, scipy, cv2, seaborn or the scraping stack.
+"""
+import argparse
+
+
+def _duplicates(args):
+    from .analysis import duplicates
+    duplicates.main(args)
+
+
+def _tag_index(args):
+    from .analysis.tag_index import TagIndex
+    index = TagIndex.from_csv(args.csv)
+    index.save(args.output)
+    print(f"Indexed {index.n_artworks} artworks, {len(index.terms)} terms -> {args.output}")
+
+
+def _color_index(args):
+    from .color.color_index import build_index
+    index = build_index(args.image_dir, args.max_side)
+    index.save(args.output)
+    print(f"Indexed {index.size} images -> {args.output}")
+
+
+def _features(args):
+    import os
+    from .color.feature_stream import write_features_csv
+    paths = (os.path.join(args.image_dir, name) for name in sorted(os.listdir(args.image_dir)))
+    n_rows, n_errors = write_features_csv(paths, args.output, args.metrics, max_side=args.max_side,
+                                           approx=args.approx, use_derivatives=args.use_derivatives)
+    print(f"Wrote {n_rows} rows ({n_errors} with errors) to {args.output}")
+
+
+def _manifest(args):
+    from collections import Counter
+    from .analysis.manifest import build_manifest
+    records = build_manifest(args.image_dir, args.output, args.workers)
+    print(f"{len(records)} images -> {args.output}:", dict(Counter(r['status'] for r in records)))
+
+
+def _score(args):
+    from .analysis.scheduler import score_corpus
+    n_rows, n_errors, scheduler = score_corpus(args.image_dir, args.output, args.metrics, args.workers,
+                                               int(args.budget_mp * 1e6), args.max_side, args.manifest,
+                                               profile=args.profiler, approx=args.approx,
+                                               use_derivatives=args.use_derivatives)
+    print(f"Wrote {n_rows} rows ({n_errors} with errors) to {args.output}")
+    scheduler.report()
+
+
+def _derivatives(args):
+    from .analysis.derivatives import build_derivatives, derivatives_root
+    stats = build_derivatives(args.image_dir, root=args.root, workers=args.workers)
+    print(f"{stats} -> {args.root or derivatives_root(args.image_dir)}")
+
+
+def _ingest(args):
+    from .analysis.store import build_store
+    n_artworks, n_features = build_store(args.csv, args.db, args.features)
+    print(f"Ingested {n_artworks} records and {n_features} feature values -> {args.db}")
+
+
+def _snapshot(args):
+    from .analysis.snapshots import create_snapshot
+    manifest = create_snapshot(args.csv, args.root, args.message)
+    print(f"Snapshot {manifest['id']}: {manifest['rows']} rows, {manifest['added_rows']} stored, "
+          f"{manifest['removed_rows']} deleted, {manifest['changed_artworks']} changed artworks")
+
+
+def _snapshots(args):
+    from .analysis.snapshots import SnapshotStore
+    for m in SnapshotStore(args.root).snapshots():
+        print(f"{m['id']}  {m['created']}  {m['rows']:7d} rows  +{m['added_rows']} -{m['removed_rows']}  {m['message']}")
+
+
+def _bio_features(args):
+    import pandas as pd
+    from .artist.bio_features import update_biography_features
+    features = update_biography_features(pd.read_csv(args.csv)['artist'], args.output_dir)
+    print(f"{len(features)} artists, {len(features.vocabulary)} terms -> {args.output_dir}")
+
+
+def _eda(args):
+    from .analysis.eda import load_artworks, clean_artworks, run_eda
+    raw = load_artworks(args.csv)
+    if raw is not None:
+        run_eda(clean_artworks(raw), args.output_dir, show=not args.no_show)
+
+
+def _scrape_links(args):
+    from .scrape.artworks_links import scrape_artwork_links
+    scrape_artwork_links(args.base_url, args.output)
+
+
+def _scrape(args):
+    from .scrape.process_artworks import process_artwork_range
+    process_artwork_range(args.links_csv, args.start, args.end, args.output, args.image_dir)
+
+
+def _crawl(args):
+    from .scrape.adapters import get_adapter
+    from .scrape.engine import CrawlEngine
+    from .scrape.http_client import HttpClient
+    from .scrape import replay
+    client = None
+    if args.replay:
+        client = replay.replay_client(args.replay, latency=args.latency, error_rate=args.error_rate)
+    elif args.record:
+        client = HttpClient()
+        replay.record(client, args.record)
+    derivatives = None
+    if args.derivatives:
+        from .analysis.derivatives import DerivativeWriter
+        derivatives = DerivativeWriter()
+    engine = CrawlEngine(get_adapter(args.source), args.output, args.image_dir, workers=args.workers,
+                         delay=args.delay, cache_dir=args.cache_dir, client=client, derivatives=derivatives)
+    n_saved, n_failed = engine.crawl(args.max_pages)
+    if derivatives is not None:
+        print(f"Derivatives: {derivatives.close()}")
+    print(f"Saved {n_saved} artworks ({n_failed} failed) to {args.output}")
+    if args.replay:
+        print(f"Replay: {client.faults.stats}")
+
+
+def _replay_server(args):
+    import time
+    from .scrape.replay import serve
+    server = serve(args.archive, args.host, args.port, latency=args.latency, jitter=args.jitter,
+                   error_rate=args.error_rate, drop_rate=args.drop_rate, seed=args.seed)
+    print(f"Replaying {args.archive} on http://{args.host}:{args.port} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(server.faults.stats)
+
+
+def _reddit(args):
+    from .scrape.reddit import scrape_subreddit
+    derivatives = None
+    if args.derivatives:
+        from .analysis.derivatives import DerivativeWriter
+        derivatives = DerivativeWriter()
+    n_saved, n_failed = scrape_subreddit(args.subreddit, args.sort, args.time, args.pages, args.output,
+                                         args.image_dir, args.base_url, derivatives=derivatives)
+    if derivatives is not None:
+        print(f"Derivatives: {derivatives.close()}")
+    print(f"Saved {n_saved} posts ({n_failed} failed) to {args.output}")
+
+
+APPROX_HELP = "Estimate the global color metrics from a pixel sample, with 95%% confidence intervals (triage)"
+DERIVATIVES_HELP = "With --max-side, decode the 1024 px analysis copies when they exist (faster; re-encoded JPEG)"
+PROFILE_HELP = "Sample the run (workers included), write flame graphs and a per-stage top table to DIR"
+
+
+def build_parser():
+    from .paths import (ARTWORK_CSV, ARTWORK_DB, ARTWORK_LINKS_CSV, BIOGRAPHY_FEATURES_DIR, GRAPHS_DIR, PAINTINGS_DIR,
+                        REDDIT_CSV, REDDIT_IMAGES_DIR, SNAPSHOTS_DIR)
+
+    parser = argparse.ArgumentParser(prog="dalas", description="DALAS artwork analysis tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("duplicates", help="Cluster near-duplicate paintings (perceptual hashes)")
+    p.add_argument("image_dir", nargs='?', default=PAINTINGS_DIR)
+    p.add_argument("--max-distance", type=int, default=8, help="Max pHash Hamming distance (of 64 bits)")
+    p.set_defaults(func=_duplicates)
+
+    p = commands.add_parser("tag-index", help="Build the tag / technique index for the dashboard")
+    p.add_argument("--csv", default=ARTWORK_CSV)
+    p.add_argument("--output", default="tag_index")
+    p.set_defaults(func=_tag_index)
+
+    p = commands.add_parser("color-index", help="Build the color similarity index")
+    p.add_argument("image_dir", nargs='?', default=PAINTINGS_DIR)
+    p.add_argument("--max-side", type=int, default=512)
+    p.add_argument("--output", default="color_index.npz")
+    p.set_defaults(func=_color_index)
+
+    p = commands.add_parser("features", help="Stream color metrics of a directory into a CSV")
+    p.add_argument("image_dir", nargs='?', default=PAINTINGS_DIR)
+    p.add_argument("--metrics", nargs='+', default=None)
+    p.add_argument("--max-side", type=int, default=None)
+    p.add_argument("--output", default="color_features.csv")
+    p.add_argument("--approx", action="store_true", help=APPROX_HELP)
+    p.add_argument("--use-derivatives", action="store_true", help=DERIVATIVES_HELP)
+    p.add_argument("--profile", metavar="DIR", help=PROFILE_HELP)
+    p.set_defaults(func=_features)
+
+    p = commands.add_parser("manifest", help="Header-only scan: dimensions, format, validity of every image")
+    p.add_argument("image_dir", nargs='?', default=PAINTINGS_DIR)
+    p.add_argument("--output", default="image_manifest.csv")
+    p.add_argument("--workers", type=int, default=8)
+    p.set_defaults(func=_manifest)
+
+    p = commands.add_parser("score", help="Compute metrics on a worker pool, largest images first, within a memory budget")
+    p.add_argument("image_dir", nargs='?', default=PAINTINGS_DIR)
+    p.add_argument("--metrics", nargs='+', default=None)
+    p.add_argument("--max-side", type=int, default=None)
+    p.add_argument("--workers", type=int, default=None, help="Default: one per CPU")
+    p.add_argument("--budget-mp", type=float, default=64, help="Megapixels decoded at once across workers")
+    p.add_argument("--manifest", default=None, help="Manifest CSV to take image sizes from")
+    p.add_argument("--output", default="color_features.csv")
+    p.add_argument("--approx", action="store_true", help=APPROX_HELP)
+    p.add_argument("--use-derivatives", action="store_true", help=DERIVATIVES_HELP)
+    p.add_argument("--profile", metavar="DIR", help=PROFILE_HELP)
+    p.set_defaults(func=_score)
+
+    p = commands.add_parser("derivatives", help="Make the thumbnails, analysis copies and previews of a directory")
+    p.add_argument("image_dir", nargs='?', default=PAINTINGS_DIR)
+    p.add_argument("--root", default=None, help="Output directory (default: Derivatives next to image_dir)")
+    p.add_argument("--workers", type=int, default=4)
+    p.set_defaults(func=_derivatives)
+
+    p = commands.add_parser("ingest", help="Bulk load artwork records (and image metrics) into the SQLite store")
+    p.add_argument("--csv", default=ARTWORK_CSV)
+    p.add_argument("--features", default=None, help="Metrics CSV from the features / score commands")
+    p.add_argument("--db", default=ARTWORK_DB)
+    p.set_defaults(func=_ingest)
+
+    p = commands.add_parser("snapshot", help="Snapshot artwork_data.csv (only rows changed since the last snapshot are stored)")
+    p.add_argument("--csv", default=ARTWORK_CSV)
+    p.add_argument("--root", default=SNAPSHOTS_DIR)
+    p.add_argument("--message", default="")
+    p.set_defaults(func=_snapshot)
+
+    p = commands.add_parser("snapshots", help="List the dataset snapshots")
+    p.add_argument("--root", default=SNAPSHOTS_DIR)
+    p.set_defaults(func=_snapshots)
+
+    p = commands.add_parser("bio-features", help="Fetch new artists' biographies and update their text features")
+    p.add_argument("--csv", default=ARTWORK_CSV)
+    p.add_argument("--output-dir", default=BIOGRAPHY_FEATURES_DIR)
+    p.set_defaults(func=_bio_features)
+
+    p = commands.add_parser("eda", help="Clean artwork_data.csv and draw the EDA graphs")
+    p.add_argument("--csv", default=ARTWORK_CSV)
+    p.add_argument("--output-dir", default=GRAPHS_DIR)
+    p.add_argument("--no-show", action="store_true", help="Only save the graphs")
+    p.set_defaults(func=_eda)
+
+    p = commands.add_parser("scrape-links", help="Collect artwork links from Artsper listing pages")
+    p.add_argument("--base-url", default="https://www.artsper.com/fr/oeuvres-d-art-contemporain/peinture")
+    p.add_argument("--output", default=ARTWORK_LINKS_CSV)
+    p.set_defaults(func=_scrape_links)
+
+    p = commands.add_parser("scrape", help="Scrape artwork pages and images from a links CSV")
+    p.add_argument("--links-csv", default=ARTWORK_LINKS_CSV)
+    p.add_argument("--start", type=int, default=1)
+    p.add_argument("--end", type=int, default=1000)
+    p.add_argument("--output", default=ARTWORK_CSV)
+    p.add_argument("--image-dir", default=PAINTINGS_DIR)
+    p.add_argument("--profile", metavar="DIR", help=PROFILE_HELP)
+    p.set_defaults(func=_scrape)
+
+    p = commands.add_parser("crawl", help="Crawl a marketplace (listing pages, then artwork pages) with its adapter")
+    p.add_argument("--source", default="artsper", help="Registered source adapter")
+    p.add_argument("--max-pages", type=int, default=None, help="Listing pages to follow (default: all)")
+    p.add_argument("--workers", type=int, default=4)
+    p.add_argument("--delay", type=float, default=1.0, help="Seconds each worker waits between pages")
+    p.add_argument("--cache-dir", default=None, help="Keep downloaded pages here (re-parsing costs no requests)")
+    p.add_argument("--output", default=ARTWORK_CSV)
+    p.add_argument("--image-dir", default=PAINTINGS_DIR)
+    p.add_argument("--record", metavar="ARCHIVE", help="Save every response to this WARC archive")
+    p.add_argument("--replay", metavar="ARCHIVE", help="Answer from this WARC archive instead of the network")
+    p.add_argument("--latency", type=float, default=0.0, help="Replay: seconds added to every response")
+    p.add_argument("--error-rate", type=float, default=0.0, help="Replay: share of injected 503 responses")
+    p.add_argument("--derivatives", action="store_true", help="Make thumbnails / analysis copies while downloading")
+    p.add_argument("--profile", metavar="DIR", help=PROFILE_HELP)
+    p.set_defaults(func=_crawl)
+
+    p = commands.add_parser("replay-server", help="Serve a recorded WARC archive over HTTP, with latency and faults")
+    p.add_argument("archive")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8000)
+    p.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    p.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    p.add_argument("--error-rate", type=float, default=0.0, help="Share of injected 503 responses")
+    p.add_argument("--drop-rate", type=float, default=0.0, help="Share of connections closed without answer")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=_replay_server)
+
+    p = commands.add_parser("reddit", help="Scrape image posts and upvotes from a subreddit (default /r/Art)")
+    p.add_argument("--subreddit", default="Art")
+    p.add_argument("--sort", default="top", choices=["top", "hot", "new", "rising"])
+    p.add_argument("--time", default="all", help="Period of 'top' listings: hour, day, week, month, year, all")
+    p.add_argument("--pages", type=int, default=5, help="Listing pages of 100 posts")
+    p.add_argument("--output", default=REDDIT_CSV)
+    p.add_argument("--image-dir", default=REDDIT_IMAGES_DIR)
+    p.add_argument("--base-url", default="https://www.reddit.com", help="e.g. a local stand-in server")
+    p.add_argument("--derivatives", action="store_true", help="Make thumbnails / analysis copies while downloading")
+    p.add_argument("--profile", metavar="DIR", help=PROFILE_HELP)
+    p.set_defaults(func=_reddit)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.profiler = None
+    if getattr(args, 'profile', None):
+        from .profiling import Profile
+        args.profiler = Profile()
+        with args.profiler.sample():
+            args.func(args)
+        args.profiler.save(args.profile)
+    else:
+        args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+import importlib
+
+
+def lazy_exports(package, exports=None, submodules=()):
+    """
+    Builds module-level __getattr__ / __dir__ for a package so that its
+    public names are only imported on first access (PEP 562).
+
+    Args:
+        package: The package's __name__.
+        exports: Mapping of exported name -> submodule defining it. Export
+                 names must differ from submodule names.
+        submodules: Submodules exposed as attributes (e.g. subpackages).
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package's __init__.
+    """
+    exports = dict(exports or {})
+    submodules = set(submodules)
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module(f".{name}", package)
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{exports[name]}", package), name)
+        setattr(importlib.import_module(package), name, value)  # Later lookups skip __getattr__
+        return value
+
+    def __dir__():
+        return sorted(set(exports) | submodules | set(vars(importlib.import_module(package))))
+
+    return __getattr__, __dir__
@@ -0,0 +1,29 @@
+"""Dataset cleaning, EDA, tag index, SQLite store, duplicate detection, image
+dimensions, image derivatives, size-aware batch scheduling and dataset snapshots."""
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'load_artworks': 'eda',
+    'clean_artworks': 'eda',
+    'run_eda': 'eda',
+    'parse_artworks': 'parsing',
+    'TagIndex': 'tag_index',
+    'build_store': 'store',
+    'select_artworks': 'store',
+    'SnapshotStore': 'snapshots',
+    'create_snapshot': 'snapshots',
+    'read_snapshot': 'snapshots',
+    'find_duplicate_clusters': 'duplicates',
+    'read_image_header': 'manifest',
+    'build_manifest': 'manifest',
+    'DerivativeWriter': 'derivatives',
+    'build_derivatives': 'derivatives',
+    'SizeAwareScheduler': 'scheduler',
+    'score_corpus': 'scheduler',
+    'get_image_dimensions': 'image_dimensions',
+    'get_image_dimensions_cv2': 'image_dimensions',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
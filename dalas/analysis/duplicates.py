@@ -0,0 +1,218 @@
+import argparse
+import os
+
+import numpy as np
+from PIL import Image
+
+from ..paths import PAINTINGS_DIR
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+
+# --- 1. Perceptual hashes ---
+
+def _to_gray(image, size):
+    """Resizes a PIL image or an RGB/gray array to (size x size) grayscale float pixels."""
+    if isinstance(image, np.ndarray):
+        image = Image.fromarray(image)
+    return np.asarray(image.convert("L").resize(size, Image.LANCZOS), dtype=np.float64)
+
+
+def _bits_to_int(bits):
+    """Packs a boolean array into a Python int (first element = most significant bit)."""
+    return int(''.join('1' if bit else '0' for bit in bits.ravel()), 2)
+
+
+def dhash(image, hash_size=8):
+    """
+    Difference hash: compares each pixel with its right neighbour on a
+    (hash_size+1 x hash_size) thumbnail. Robust to scaling and recompression.
+
+    Args:
+        image: PIL image or pixel array.
+        hash_size: Hash is hash_size**2 bits long.
+
+    Returns:
+        The hash as an int.
+    """
+    gray = _to_gray(image, (hash_size + 1, hash_size))
+    return _bits_to_int(gray[:, 1:] > gray[:, :-1])
+
+
+def phash(image, hash_size=8, highfreq_factor=4):
+    """
+    DCT perceptual hash: keeps the low frequency DCT block of a 32x32
+    thumbnail and compares it with its median. Robust to re-photographing,
+    colour shifts and light crops.
+
+    Args:
+        image: PIL image or pixel array.
+        hash_size: Hash is hash_size**2 bits long.
+        highfreq_factor: Thumbnail side is hash_size * highfreq_factor.
+
+    Returns:
+        The hash as an int.
+    """
+    from scipy.fft import dctn  # Imported on first use to keep module import cheap
+
+    side = hash_size * highfreq_factor
+    gray = _to_gray(image, (side, side))
+    low_freq = dctn(gray, norm='ortho')[:hash_size, :hash_size]
+    return _bits_to_int(low_freq > np.median(low_freq))
+
+
+def image_hashes(image_path, hash_size=8):
+    """
+    Decodes an image once and computes both perceptual hashes from it.
+
+    JPEG decoding uses PIL draft mode, so only a reduced grayscale version
+    of the image is ever decoded (hashes need at most 32x32 pixels).
+
+    Args:
+        image_path: Path to the image file.
+        hash_size: Hash is hash_size**2 bits long.
+
+    Returns:
+        A tuple (phash, dhash) of ints, or None on error.
+    """
+    try:
+        with Image.open(image_path) as img:
+            img.draft('L', (hash_size * 16, hash_size * 16))
+            img = img.convert("L")
+            return phash(img, hash_size), dhash(img, hash_size)
+    except Exception as e:
+        print(f"Error processing image {image_path}: {e}")
+        return None
+
+
+def hamming(a, b):
+    """Number of differing bits between two int hashes."""
+    return bin(a ^ b).count('1')
+
+
+# --- 2. BK-tree for Hamming-radius queries ---
+
+class BKTree:
+    """
+    Burkhard-Keller tree over int hashes with the Hamming metric.
+
+    A radius-r query only descends into children whose edge distance lies
+    in [d - r, d + r] (triangle inequality), so small-radius lookups visit a
+    small fraction of the tree instead of comparing against every hash.
+    Several items can share one hash (exact duplicates).
+    """
+
+    def __init__(self):
+        self.root = None  # Node: [hash, [items], {distance: child_node}]
+        self.size = 0
+
+    def add(self, hash_value, item):
+        """Inserts item under hash_value."""
+        self.size += 1
+        if self.root is None:
+            self.root = [hash_value, [item], {}]
+            return
+        node = self.root
+        while True:
+            distance = hamming(hash_value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [hash_value, [item], {}]
+                return
+            node = child
+
+    def query(self, hash_value, radius):
+        """
+        Finds every stored item within `radius` bits of hash_value.
+
+        Returns:
+            A list of (distance, item) tuples.
+        """
+        results = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = hamming(hash_value, node[0])
+            if distance <= radius:
+                results.extend((distance, item) for item in node[1])
+            for edge, child in node[2].items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        return results
+
+
+# --- 3. Clustering ---
+
+def find_duplicate_clusters(image_paths, max_distance=8, hash_size=8):
+    """
+    Groups near-duplicate images (same painting re-photographed, re-uploaded
+    or listed under another title).
+
+    Each image is hashed once; pHash neighbours within max_distance are found
+    through a BK-tree, confirmed with dHash and merged with union-find.
+
+    Args:
+        image_paths: Iterable of image paths.
+        max_distance: Maximum Hamming distance (out of hash_size**2 bits).
+        hash_size: Hash side length.
+
+    Returns:
+        A list of clusters (lists of paths) with at least two images,
+        largest first.
+    """
+    hashes = {}
+    for path in image_paths:
+        result = image_hashes(path, hash_size)
+        if result is not None:
+            hashes[path] = result
+
+    paths = list(hashes)
+    parent = list(range(len(paths)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    tree = BKTree()
+    for i, path in enumerate(paths):
+        p_hash, d_hash = hashes[path]
+        for _, j in tree.query(p_hash, max_distance):
+            if hamming(d_hash, hashes[paths[j]][1]) <= max_distance * 2:
+                parent[find(i)] = find(j)
+        tree.add(p_hash, i)
+
+    clusters = {}
+    for i, path in enumerate(paths):
+        clusters.setdefault(find(i), []).append(path)
+    return sorted((c for c in clusters.values() if len(c) > 1), key=len, reverse=True)
+
+
+def list_images(image_dir):
+    """Lists the image files of a directory (e.g. Paintings/), sorted by name."""
+    return sorted(os.path.join(image_dir, name) for name in os.listdir(image_dir)
+                  if name.lower().endswith(IMAGE_EXTENSIONS))
+
+
+def main(args=None):
+    if args is None:
+        parser = argparse.ArgumentParser(description="Find near-duplicate paintings with perceptual hashes.")
+        parser.add_argument("image_dir", nargs='?', default=PAINTINGS_DIR, help="Directory of images (default: Paintings)")
+        parser.add_argument("--max-distance", type=int, default=8, help="Max pHash Hamming distance (of 64 bits)")
+        args = parser.parse_args()
+
+    clusters = find_duplicate_clusters(list_images(args.image_dir), args.max_distance)
+    if not clusters:
+        print("No near-duplicates found.")
+    for n, cluster in enumerate(clusters, start=1):
+        print(f"Cluster {n} ({len(cluster)} images):")
+        for path in cluster:
+            print(f"  {os.path.basename(path)}")
+
+
+if __name__ == '__main__':
+    main()
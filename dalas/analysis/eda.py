@@ -0,0 +1,221 @@
+import os
+from collections import Counter
+
+import pandas as pd
+
+from .parsing import parse_artworks
+from ..paths import ARTWORK_CSV, GRAPHS_DIR
+
+
+# --- 1. Load the Data ---
+def load_artworks(csv_file=ARTWORK_CSV):
+    """
+    Loads the scraped artwork data.
+
+    Args:
+        csv_file: Path to artwork_data.csv.
+
+    Returns:
+        A DataFrame, or None if the file is missing, empty or malformed.
+    """
+    try:
+        return pd.read_csv(csv_file)
+    except FileNotFoundError:
+        print(f"Error: {csv_file} not found.")
+    except pd.errors.EmptyDataError:
+        print(f"Error: {csv_file} is empty.")
+    except pd.errors.ParserError as e:
+        print(f"Error parsing CSV: {e}")
+        print("Check for issues like inconsistent number of columns.")
+    return None
+
+
+# --- 2. Data Cleaning and Preprocessing ---
+
+def clean_artworks(df, verbose=True):
+    """
+    Cleans the raw scraped data: fills missing values, drops duplicates,
+    converts year and price to numbers, extracts dimensions and splits tags.
+
+    Args:
+        df: Raw DataFrame from load_artworks().
+        verbose: Print missing values / dtypes before and after cleaning.
+
+    Returns:
+        The cleaned DataFrame (a new object).
+    """
+    df = df.copy()
+
+    # --- 2.1 Handle Missing Values ---
+    if verbose:
+        print("Missing Values Before Handling:\n", df.isnull().sum())
+
+    # Fill missing values with appropriate defaults.
+    df['Unframed Dimensions'] = df['Unframed Dimensions'].fillna('Unknown')
+    df['Unframed Dimensions (inch)'] = df['Unframed Dimensions (inch)'].fillna('Unknown')
+    df['support'] = df['support'].fillna('Unknown')
+    df['encadrement'] = df['encadrement'].fillna('Unknown')
+    df['tags'] = df['tags'].fillna('No Tags')
+    df['price'] = df['price'].fillna('Price Not Available')
+    df['techniques'] = df['techniques'].fillna('Not Specified')
+    df['year'] = df['year'].fillna('Not Found')
+
+    # Drop duplicate rows, keeping only the first occurrence.
+    df.drop_duplicates(inplace=True)
+
+    # Typed year, price, dimensions (cm, 2-D or 3-D) and framing in one vectorised pass.
+    # The inch column is redundant with the cm one and only used where the cm one is unreadable.
+    parsed = parse_artworks(df)
+    df['year'] = parsed['year'].astype(float)  # NaN for missing/invalid years
+    for column in ['price', 'currency', 'width_cm', 'height_cm', 'depth_cm', 'area_cm2', 'volume_cm3', 'framed']:
+        df[column] = parsed[column].array
+
+    # --- 2.4  Clean up the 'tags' column ---
+    # Convert tags to lowercase and split into lists of individual tags.
+    df['tags'] = df['tags'].str.lower().str.split(', ')
+
+    if verbose:
+        print("\nMissing Values After Handling:\n", df.isnull().sum())
+        print("\nData Types:\n", df.dtypes)
+        print("\nCleaned Data (First 5 Rows):\n", df.head())
+    return df
+
+
+# --- 3. Exploratory Data Analysis (EDA) ---
+def run_eda(df, output_dir=GRAPHS_DIR, show=True):
+    """
+    Prints summary statistics and draws the EDA graphs of a cleaned DataFrame.
+
+    Args:
+        df: DataFrame from clean_artworks().
+        output_dir: Directory the graphs are saved to (None = don't save).
+        show: Display each figure interactively.
+    """
+    # Imported here: matplotlib / seaborn are slow to import and only the plots need them.
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)  # Create the directory if it doesn't exist
+
+    def finish(filename):
+        if output_dir:
+            plt.savefig(os.path.join(output_dir, filename))  # Save the figure
+        if show:
+            plt.show()
+        plt.close()  # Close the figure to free memory
+
+    # --- 3.1 Univariate Analysis ---
+
+    # --- 3.1.1 Numerical Features ---
+    print("\n--- Summary Statistics (Numerical Features) ---")
+    print(df.describe())
+
+    # Histograms for numerical features
+    numerical_cols = ['year', 'price', 'width_cm', 'height_cm', 'depth_cm', 'area_cm2']
+    df[numerical_cols].hist(bins=20, figsize=(15, 10))
+    plt.suptitle("Histograms of Numerical Features")
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    finish("numerical_histograms.png")
+
+    # --- 3.1.2 Categorical Features ---
+    print("\n--- Value Counts (Categorical Features) ---")
+    categorical_cols = ['artist', 'techniques', 'support', 'encadrement']
+    for col in categorical_cols:
+        print(f"\n--- {col} ---")
+        print(df[col].value_counts())
+
+        # Bar plots for categorical features, save each as a separate PNG.
+        plt.figure(figsize=(12, 6))
+        df[col].value_counts().plot(kind='bar')
+        plt.title(f"Distribution of {col}")
+        plt.xticks(rotation=45, ha='right')
+        plt.tight_layout()
+        finish(f"barplot_{col}.png")
+
+    # --- 3.1.3  Technique Analysis ---
+    # Count occurrences of each individual technique.
+    all_techniques = []
+    for tech_list in df['techniques'].str.split(', '):
+        if isinstance(tech_list, list):
+            all_techniques.extend(tech_list)
+    technique_counts = Counter(all_techniques)
+
+    # Convert to DataFrame for easier plotting and sorting.
+    technique_counts_df = pd.DataFrame.from_dict(technique_counts, orient='index', columns=['Count'])
+    technique_counts_df.index.name = 'Technique'
+    technique_counts_df = technique_counts_df.sort_values('Count', ascending=False)
+
+    print("\n--- Artwork Counts per Technique ---")
+    print(technique_counts_df)
+
+    # Visualize technique counts (bar plot).
+    plt.figure(figsize=(14, 8))
+    technique_counts_df.plot(kind='bar', legend=False)
+    plt.title('Number of Artworks per Technique')
+    plt.xlabel('Technique')
+    plt.ylabel('Number of Artworks')
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    finish("technique_counts.png")
+
+    # --- 3.1.4  Tags Analysis (Special Case) ---
+    all_tags = []
+    for tag_list in df['tags']:
+        if isinstance(tag_list, list):
+            all_tags.extend(tag_list)
+    tag_counts = pd.Series(all_tags).value_counts()
+    print(f"\n----Most Common Tags ---\n{tag_counts}")
+
+    # --- 3.2 Bivariate Analysis ---
+
+    # --- 3.2.1  Scatter Plots (Numerical vs. Numerical) ---
+
+    # Example: price vs. width_cm
+    plt.figure(figsize=(8, 6))
+    plt.scatter(df['width_cm'], df['price'], alpha=0.5)
+    plt.title('Price vs. Width (cm)')
+    plt.xlabel('Width (cm)')
+    plt.ylabel('Price')
+    finish("scatter_price_vs_width.png")
+
+    # Example year vs price
+    plt.figure(figsize=(8, 6))
+    plt.scatter(df['year'], df['price'], alpha=0.5)
+    plt.title('Price vs. Year')
+    plt.xlabel('Year')
+    plt.ylabel('Price')
+    finish("scatter_price_vs_year.png")
+
+    # --- 3.2.2  Box Plots (Categorical vs. Numerical) ---
+
+    # Example: price vs. encadrement
+    plt.figure(figsize=(10, 6))
+    sns.boxplot(x='encadrement', y='price', data=df)
+    plt.title('Price vs. Encadrement')
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    finish("boxplot_price_vs_encadrement.png")
+
+    # --- 3.2.3 Correlation Matrix (Numerical Features) ---
+    correlation_matrix = df[numerical_cols].corr()
+    plt.figure(figsize=(10, 8))
+    sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', fmt=".2f")
+    plt.title("Correlation Matrix of Numerical Features")
+    finish("correlation_matrix.png")
+
+    # --- 4.  Insights and Conclusions (Example) ---
+
+    print("\n--- Example Insights and Conclusions ---")
+    print("- The dataset contains information on artwork, including dimensions, price, and materials.")
+    print("- There are some missing values. We filled these with appropriate defaults.")
+    print("- The most common support is 'Peinture sur toile sur chassis'.")
+    print("- The distribution of prices is right-skewed (more lower-priced artworks).")
+    print("- There's a weak positive correlation between width and price (larger works tend to be slightly more expensive).")
+    print("- Further analysis could explore the relationship between specific tags and price.")
+
+
+if __name__ == '__main__':
+    raw = load_artworks()
+    if raw is not None:
+        run_eda(clean_artworks(raw))
@@ -28,7 +28,11 @@ def get_image_dimensions(image_path):
 
 
 def get_image_dimensions_cv2(image_path):
-    """Gets image dimensions using OpenCV.  More robust handling of corrupted files."""
+    """
+    Gets image dimensions using OpenCV.  More robust handling of corrupted files,
+    but decodes the whole image: for bulk scans use manifest.read_image_header,
+    which only reads headers.
+    """
     import cv2  # Import inside the function to avoid unnecessary dependency if not used.
 
     try:
@@ -47,9 +51,11 @@ def get_image_dimensions_cv2(image_path):
 
 
 if __name__ == '__main__':
+    import os
+    from ..paths import COLOR_SAMPLES_DIR
+
     # Example usage:
-    image_file = "/2.1_Color/Color/original.jpg"  # Replace with the actual path to your image
-    img = "/Users/vibhu/PycharmProjects/art_proj/Test Cases/Color/3. Percent Colored/complimentary.png"
+    img = os.path.join(COLOR_SAMPLES_DIR, "original.jpg")  # Replace with the actual path to your image
     # --- Using PIL ---
     width, height = get_image_dimensions(img)
 
@@ -0,0 +1,150 @@
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from ..paths import PAINTINGS_DIR
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+EXIF_ORIENTATION = 0x0112
+
+# Resolution buckets (upper bound in pixels) used to group work of similar cost.
+RESOLUTION_BUCKETS = [('small', 1_000_000), ('medium', 4_000_000), ('large', 16_000_000), ('huge', float('inf'))]
+
+MANIFEST_FIELDS = ['filename', 'status', 'error', 'width', 'height', 'pixels', 'bucket',
+                   'format', 'mode', 'orientation', 'file_size']
+
+# Trailer bytes a complete file of each format ends with (truncated downloads don't).
+_TRAILERS = {'JPEG': b'\xff\xd9', 'PNG': b'IEND\xaeB`\x82'}
+
+
+def resolution_bucket(pixels):
+    """Name of the resolution bucket a pixel count falls in."""
+    for name, limit in RESOLUTION_BUCKETS:
+        if pixels < limit:
+            return name
+    return RESOLUTION_BUCKETS[-1][0]
+
+
+def _is_truncated(image_path, image_format, file_size):
+    """Checks the file trailer only (a few bytes), not the pixel data."""
+    trailer = _TRAILERS.get(image_format)
+    if trailer is None or file_size < len(trailer):
+        return False
+    with open(image_path, 'rb') as f:
+        f.seek(max(0, file_size - 32))
+        return trailer not in f.read()
+
+
+def read_image_header(image_path):
+    """
+    Reads an image's metadata without decoding its pixels.
+
+    PIL only parses the header on Image.open(); the pixel data is never read.
+    A missing end-of-image marker flags truncated downloads.
+
+    Args:
+        image_path: Path to the image file.
+
+    Returns:
+        A dictionary with the MANIFEST_FIELDS keys. 'status' is 'ok',
+        'truncated' or 'error' (with the reason in 'error'); errors are
+        reported in the record, not raised.
+    """
+    record = dict.fromkeys(MANIFEST_FIELDS)
+    record.update(filename=os.path.basename(image_path), status='error', error='')
+    try:
+        record['file_size'] = os.path.getsize(image_path)
+        if record['file_size'] == 0:
+            record['error'] = "Empty file"
+            return record
+        with Image.open(image_path) as img:
+            width, height = img.size
+            record.update(width=width, height=height, pixels=width * height,
+                          bucket=resolution_bucket(width * height),
+                          format=img.format, mode=img.mode,
+                          orientation=img.getexif().get(EXIF_ORIENTATION, 1))
+        truncated = _is_truncated(image_path, record['format'], record['file_size'])
+        record['status'] = 'truncated' if truncated else 'ok'
+        if truncated:
+            record['error'] = "Missing end-of-image marker (truncated download?)"
+    except FileNotFoundError:
+        record['error'] = "File not found"
+    except Exception as e:  # PIL raises UnidentifiedImageError / OSError on corrupt headers
+        record['error'] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def scan_images(image_dir=PAINTINGS_DIR, workers=8):
+    """
+    Reads the headers of every image in a directory, in parallel threads
+    (header reads are I/O bound).
+
+    Returns:
+        A list of records (see read_image_header), sorted by filename.
+    """
+    paths = sorted(os.path.join(image_dir, name) for name in os.listdir(image_dir)
+                   if name.lower().endswith(IMAGE_EXTENSIONS))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(read_image_header, paths))
+
+
+def write_manifest(records, output_csv):
+    """Writes header records to a manifest CSV."""
+    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=MANIFEST_FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def load_manifest(manifest_csv):
+    """
+    Reads a manifest CSV back, with numeric columns converted to int.
+
+    Returns:
+        A list of record dictionaries.
+    """
+    records = []
+    with open(manifest_csv, 'r', newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            for key in ('width', 'height', 'pixels', 'orientation', 'file_size'):
+                row[key] = int(row[key]) if row[key] not in ('', None) else None
+            records.append(row)
+    return records
+
+
+def schedulable(records, image_dir=None):
+    """
+    Valid images (status 'ok') sorted largest first, ready for the heavy pipeline.
+
+    Returns:
+        A list of (path or filename, pixels) tuples.
+    """
+    ok = [r for r in records if r['status'] == 'ok']
+    ok.sort(key=lambda r: r['pixels'], reverse=True)
+    return [(os.path.join(image_dir, r['filename']) if image_dir else r['filename'], r['pixels']) for r in ok]
+
+
+def build_manifest(image_dir=PAINTINGS_DIR, output_csv="image_manifest.csv", workers=8):
+    """
+    Header-only pre-pass over an image directory: validates every file and
+    writes the manifest.
+
+    Returns:
+        The list of records.
+    """
+    records = scan_images(image_dir, workers)
+    write_manifest(records, output_csv)
+    return records
+
+
+if __name__ == '__main__':
+    from collections import Counter
+
+    manifest = build_manifest()
+    print(f"{len(manifest)} images:", dict(Counter(r['status'] for r in manifest)))
+    print("Buckets:", dict(Counter(r['bucket'] for r in manifest if r['status'] == 'ok')))
+    for r in manifest:
+        if r['status'] != 'ok':
+            print(f"  {r['filename']}: {r['status']} {r['error']}")
@@ -0,0 +1,168 @@
+import re
+from datetime import date
+
+import pandas as pd
+
+# Typed parsing of the scraped text columns. Every parser works on a whole
+# Series with str.extract on a precompiled pattern (no Python loop per row).
+
+# --- 1. Patterns ---
+
+_NUMBER = r"\d+(?:[.,]\d+)?"
+_UNIT = r"cm|mm|m|inches|inch|in|\""
+_TIMES = r"\s*[x×X*]\s*"
+
+
+def _value(i):
+    """Value i of a size: "60", a range "60-80", each with an optional unit ("1.5 m", "10 in")."""
+    return (rf"(?:[HLPW]\s*)?(?P<value{i}>{_NUMBER})(?:\s*(?:-|–|à|to)\s*(?P<end{i}>{_NUMBER}))?"
+            rf"(?:\s*(?P<unit{i}>{_UNIT})(?![a-z]))?")
+
+
+# "60 x 40 cm", "60 x 40 x 1.5 cm", "60-80 x 40 cm", "23.6 x 15.7 inch", "H 60 x L 40 cm", "1.5 m x 2 m"
+DIMENSIONS_RE = re.compile(rf"{_value(0)}{_TIMES}{_value(1)}(?:{_TIMES}{_value(2)})?", re.IGNORECASE)
+
+# "1 200 €", "€1,200.50", "1.200,50 EUR", "$ 950", "CHF 1'500"
+_AMOUNT = r"(?P<amount>\d{1,3}(?:[\s  .,']\d{3})*(?:[.,]\d{1,2})?(?!\d)|\d+(?:[.,]\d{1,2})?)"
+_CURRENCY = r"€|EUR|\$|USD|£|GBP|CHF"
+PRICE_RE = re.compile(rf"(?:(?P<currency>{_CURRENCY})\s*)?{_AMOUNT}(?:\s*(?P<currency2>{_CURRENCY}))?",
+                      re.IGNORECASE)
+
+YEAR_RE = re.compile(r"\b(1[0-9]{3}|20[0-9]{2})\b")
+
+# Framing: Artsper writes "Non encadrée" for unframed works, and describes the frame otherwise.
+UNFRAMED_RE = re.compile(r"non encadr|unframed|sans cadre|not framed", re.IGNORECASE)
+FRAMED_RE = re.compile(r"encadr|cadre|caisse am[ée]ricaine|framed|frame", re.IGNORECASE)
+
+UNIT_TO_CM = {'cm': 1.0, 'mm': 0.1, 'm': 100.0, 'in': 2.54, 'inch': 2.54, 'inches': 2.54, '"': 2.54}
+CURRENCY_CODES = {'€': 'EUR', '$': 'USD', '£': 'GBP'}
+
+# Values outside these bounds are scraping errors and become NaN.
+MAX_SIDE_CM = 2000.0
+MAX_PRICE = 10_000_000.0
+MIN_YEAR = 1000
+
+
+# --- 2. Parsers ---
+
+def _to_float(numbers):
+    """Decimal commas -> floats (Series of strings, NaN kept)."""
+    return pd.to_numeric(numbers.str.replace(',', '.', regex=False), errors='coerce').astype(float)
+
+
+def parse_dimensions(series, default_unit='cm'):
+    """
+    Parses dimension strings into centimetres.
+
+    2-D ("60 x 40 cm") and 3-D ("60 x 40 x 1.5 cm") sizes are supported, ranges
+    ("60-80 x 40 cm") give the middle of the range, and mm, m and inches are
+    converted. A unit may follow each value ("1.5 m x 2 m"); values without
+    one take the unit written last.
+
+    Args:
+        series: Series of dimension strings (anything else gives NaN).
+        default_unit: Unit of strings that don't name one.
+
+    Returns:
+        A DataFrame (same index) with width_cm, height_cm, depth_cm, area_cm2,
+        volume_cm3 (NaN for 2-D works) and n_dims.
+    """
+    parts = series.astype('string').str.extract(DIMENSIONS_RE)
+    units = parts[['unit0', 'unit1', 'unit2']].apply(lambda unit: unit.str.lower())
+    trailing = units.ffill(axis=1)['unit2'].fillna(default_unit)
+
+    sides = []
+    for i in range(3):  # Each value in its own unit, else the trailing one
+        factor = units[f'unit{i}'].fillna(trailing).map(UNIT_TO_CM).astype(float)
+        start, end = _to_float(parts[f'value{i}']), _to_float(parts[f'end{i}'])
+        value = (start + end.fillna(start)) / 2 * factor
+        sides.append(value.where((value > 0) & (value <= MAX_SIDE_CM)))
+
+    frame = pd.DataFrame({'width_cm': sides[0].to_numpy(), 'height_cm': sides[1].to_numpy(),
+                          'depth_cm': sides[2].to_numpy()}, index=series.index)
+    frame['area_cm2'] = frame['width_cm'] * frame['height_cm']
+    frame['volume_cm3'] = frame['area_cm2'] * frame['depth_cm']
+    frame['n_dims'] = frame[['width_cm', 'height_cm', 'depth_cm']].notna().sum(axis=1)
+    return frame
+
+
+def parse_prices(series):
+    """
+    Parses price strings ("1 200 €", "€1,200.50", "1.200,50 EUR").
+
+    Spaces, non-breaking spaces, apostrophes and dots/commas are understood as
+    thousands separators, a final comma or dot followed by 1 or 2 digits as
+    the decimal separator. Texts without a number ("Prix sur demande") give NaN.
+
+    Returns:
+        A DataFrame (same index) with price (float) and currency (ISO code,
+        'EUR' when none is written).
+    """
+    parts = series.astype('string').str.extract(PRICE_RE)
+    amount = parts['amount'].str.replace(r"[\s  ']", '', regex=True)
+    decimal = amount.str.extract(r"[.,](\d{1,2})$")[0]
+    integer = amount.str.replace(r"[.,]\d{1,2}$", '', regex=True).str.replace(r"[.,]", '', regex=True)
+    price = pd.to_numeric(integer + '.' + decimal.fillna('0'), errors='coerce').astype(float)
+
+    currency = parts['currency'].fillna(parts['currency2']).str.upper()
+    currency = currency.replace(CURRENCY_CODES).fillna('EUR').where(price.notna())
+    return pd.DataFrame({'price': price.where((price > 0) & (price <= MAX_PRICE)).to_numpy(),
+                         'currency': currency.to_numpy()}, index=series.index)
+
+
+def parse_years(series):
+    """First plausible year (1000 to next year) in each string, as a nullable Int64 Series."""
+    years = pd.to_numeric(series.astype('string').str.extract(YEAR_RE)[0], errors='coerce')
+    return years.where((years >= MIN_YEAR) & (years <= date.today().year + 1)).astype('Int64')
+
+
+def parse_framing(series):
+    """True (framed), False (unframed) or <NA> (unknown) from the 'encadrement' text."""
+    text = series.astype('string')
+    framed = pd.Series(pd.NA, index=series.index, dtype='boolean')
+    framed[text.str.contains(FRAMED_RE, na=False).to_numpy()] = True
+    framed[text.str.contains(UNFRAMED_RE, na=False).to_numpy()] = False
+    return framed
+
+
+def parse_artworks(df):
+    """
+    Validated numeric view of the scraped artwork columns.
+
+    Dimensions come from 'Unframed Dimensions' (cm); the redundant inch column
+    is only used for rows where the cm one can't be parsed.
+
+    Args:
+        df: DataFrame with the artwork_data.csv columns.
+
+    Returns:
+        A DataFrame (same index) with year, price, currency, width_cm,
+        height_cm, depth_cm, area_cm2, volume_cm3, n_dims and framed.
+    """
+    # Columns are assigned positionally: the index may have duplicates (e.g. before drop_duplicates)
+    def column(name, parser, **kwargs):
+        return parser(df[name], **kwargs) if name in df.columns else parser(pd.Series([None] * len(df)), **kwargs)
+
+    frame = pd.DataFrame(index=df.index)
+    frame['year'] = column('year', parse_years).array
+    prices = column('price', parse_prices)
+    frame['price'] = prices['price'].to_numpy()
+    frame['currency'] = prices['currency'].array
+
+    dims = column('Unframed Dimensions', parse_dimensions)
+    if 'Unframed Dimensions (inch)' in df.columns:
+        missing = (dims['n_dims'] == 0).to_numpy()
+        if missing.any():
+            inches = parse_dimensions(df['Unframed Dimensions (inch)'][missing], default_unit='inch')
+            dims.iloc[missing] = inches.to_numpy()
+    for name in dims.columns:
+        frame[name] = dims[name].to_numpy()
+    frame['framed'] = column('encadrement', parse_framing).array
+    return frame
+
+
+if __name__ == '__main__':
+    examples = pd.Series(["60 x 40 x 1.5 cm", "60 x 40 cm", "60-80 x 40 cm", "23.6 x 15.7 inch", "1.5 m x 2 m",
+                          "Unknown", None])
+    print(parse_dimensions(examples))
+    print(parse_prices(pd.Series(["1 200 €", "€1,200.50", "1.200,50 EUR", "$ 950", "Prix sur demande"])))
@@ -0,0 +1,249 @@
+import heapq
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from .image_dimensions import get_image_dimensions
+from ..paths import PAINTINGS_DIR
+
+# Default budget of decoded pixels held by all workers at once (~200 MB of RGB uint8).
+DEFAULT_MAX_PIXELS = 64_000_000
+
+
+def image_sizes(paths):
+    """
+    Pixel count of every image, read from the headers only (get_image_dimensions).
+
+    Unreadable images get 0 pixels: they are still scheduled (last), so their
+    error is reported by the worker instead of being lost here.
+
+    Returns:
+        A list of (path, pixels) tuples.
+    """
+    sizes = []
+    for path in paths:
+        width, height = get_image_dimensions(path)
+        sizes.append((path, width * height if width > 0 else 0))
+    return sizes
+
+
+def plan_lpt(items, n_workers):
+    """
+    Static longest-processing-time-first plan: items sorted by cost, each one
+    given to the currently least loaded worker.
+
+    Args:
+        items: (key, cost) tuples, e.g. (path, pixels).
+        n_workers: Number of workers.
+
+    Returns:
+        (assignments, loads): a list of keys per worker and the total cost per worker.
+    """
+    assignments = [[] for _ in range(n_workers)]
+    loads = [0] * n_workers
+    heap = [(0, w) for w in range(n_workers)]
+    for key, cost in sorted(items, key=lambda item: item[1], reverse=True):
+        load, w = heapq.heappop(heap)
+        assignments[w].append(key)
+        loads[w] = load + cost
+        heapq.heappush(heap, (loads[w], w))
+    return assignments, loads
+
+
+def _timed(func, key, args):
+    """Runs func(key, *args) in a worker and records who ran it and for how long."""
+    start = time.perf_counter()
+    result = func(key, *args)
+    return (os.getpid(), threading.get_ident()), time.perf_counter() - start, result
+
+
+class SizeAwareScheduler:
+    """
+    Runs a function over images of very different sizes on a worker pool.
+
+    Work is handed out dynamically, largest image first (the online form of
+    LPT), so a giant scan starts early instead of leaving every other worker
+    idle at the end. A new image is only started while the pixels of all
+    images in flight stay within max_pixels, the largest pending image that
+    fits going first. One image always runs even if it alone exceeds the budget.
+
+    After map() finishes, `stats` holds per-worker busy time, wall time and
+    the peak number of pixels in flight (see report()).
+    """
+
+    def __init__(self, workers=None, max_pixels=DEFAULT_MAX_PIXELS, use_threads=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pixels = max_pixels
+        self.use_threads = use_threads
+        self.stats = None
+
+    def map(self, func, items, *args):
+        """
+        Applies func(key, *args) to every (key, pixels) item.
+
+        Args:
+            func: A picklable (module level) function when using processes.
+            items: (key, pixels) tuples, e.g. from image_sizes() or manifest.schedulable().
+            *args: Extra arguments passed to every call.
+
+        Yields:
+            (key, result) in completion order. Exceptions raised by func are
+            yielded as the result (and counted in stats['errors']). If the
+            pool breaks (a worker process died, e.g. killed for lack of
+            memory), nothing more is submitted: the jobs in flight and the
+            pending items are all yielded with the BrokenExecutor error.
+        """
+        pending = sorted(items, key=lambda item: item[1], reverse=True)
+        stats = {'busy': {}, 'jobs': {}, 'wall': 0.0, 'peak_pixels': 0, 'errors': 0,
+                 'plan_loads': plan_lpt(pending, self.workers)[1]}
+        self.stats = stats
+        executor_cls = ThreadPoolExecutor if self.use_threads else ProcessPoolExecutor
+        in_flight = {}  # future -> (key, pixels)
+        pixels_in_flight = 0
+        broken = None  # BrokenExecutor once the pool is unusable
+        start = time.perf_counter()
+
+        with executor_cls(max_workers=self.workers) as pool:
+            try:
+                while pending or in_flight:
+                    # Fill free workers with the largest items that fit the budget
+                    while pending and broken is None and len(in_flight) < self.workers:
+                        room = self.max_pixels - pixels_in_flight
+                        i = next((i for i, (_, pixels) in enumerate(pending) if pixels <= room),
+                                 0 if not in_flight else None)
+                        if i is None:
+                            break
+                        key, pixels = pending[i]
+                        try:
+                            future = pool.submit(_timed, func, key, args)
+                        except BrokenExecutor as e:
+                            broken = e
+                            break
+                        del pending[i]
+                        in_flight[future] = (key, pixels)
+                        pixels_in_flight += pixels
+                        stats['peak_pixels'] = max(stats['peak_pixels'], pixels_in_flight)
+
+                    if broken is not None and not in_flight:
+                        for key, _ in pending:  # Drain: these will never run
+                            stats['errors'] += 1
+                            yield key, broken
+                        pending = []
+                        break
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key, pixels = in_flight.pop(future)
+                        pixels_in_flight -= pixels
+                        try:
+                            worker, duration, result = future.result()
+                            stats['busy'][worker] = stats['busy'].get(worker, 0.0) + duration
+                            stats['jobs'][worker] = stats['jobs'].get(worker, 0) + 1
+                        except BrokenExecutor as e:
+                            stats['errors'] += 1
+                            broken = broken or e
+                            result = e
+                        except Exception as e:
+                            stats['errors'] += 1
+                            result = e
+                        yield key, result
+            finally:
+                for future in in_flight:  # Consumer stopped early
+                    future.cancel()
+                stats['wall'] = time.perf_counter() - start
+
+    def utilization(self):
+        """Fraction of the wall time each worker spent running jobs (worker id -> float)."""
+        if not self.stats or self.stats['wall'] == 0:
+            return {}
+        return {worker: busy / self.stats['wall'] for worker, busy in self.stats['busy'].items()}
+
+    def report(self):
+        """Prints per-worker utilization, peak memory use and the LPT plan balance."""
+        if not self.stats:
+            print("Nothing has been scheduled yet.")
+            return
+        stats = self.stats
+        print(f"Wall time: {stats['wall']:.2f}s on {self.workers} workers, "
+              f"peak {stats['peak_pixels'] / 1e6:.1f} MP in flight (budget {self.max_pixels / 1e6:.1f} MP)")
+        for n, (worker, share) in enumerate(sorted(self.utilization().items()), 1):
+            print(f"  worker {n}: {stats['jobs'][worker]:4d} images, "
+                  f"busy {stats['busy'][worker]:.2f}s ({share:.0%})")
+        loads = stats['plan_loads']
+        if loads and max(loads):
+            print(f"  LPT balance (mean / max worker load in pixels): {sum(loads) / len(loads) / max(loads):.0%}")
+        if stats['errors']:
+            print(f"  {stats['errors']} jobs raised an exception")
+
+
+def _score_image(path, metrics, max_side, approx=False, use_derivatives=False):
+    """Worker job: decodes one image and computes the metrics (never raises)."""
+    from ..color.color_features import load_rgb
+    from ..color.feature_stream import FeatureResult, compute_metrics
+
+    try:
+        rgb = load_rgb(path, max_side, use_derivatives)
+    except Exception as e:
+        return FeatureResult(path, {}, {'decode': f"{type(e).__name__}: {e}"})
+    return compute_metrics(path, rgb, metrics, approx)
+
+
+def score_corpus(image_dir=PAINTINGS_DIR, output_csv="color_features.csv", metrics=None,
+                 workers=None, max_pixels=DEFAULT_MAX_PIXELS, max_side=None, manifest_csv=None, profile=None,
+                 approx=False, use_derivatives=False):
+    """
+    Computes metrics over a whole image directory with the size-aware scheduler
+    and writes them to a CSV (rows in completion order).
+
+    Args:
+        image_dir: Directory with the images.
+        output_csv: Output CSV path.
+        metrics: Metric names (see feature_stream.METRICS). Default: all.
+        workers: Number of worker processes. Default: one per CPU.
+        max_pixels: Budget of decoded pixels across all workers.
+        max_side: Downscale images to this longest side before analysis.
+        manifest_csv: Optional manifest (python -m dalas manifest) to take the
+            sizes from instead of reading the headers again; invalid images are skipped.
+        profile: Optional profiling.Profile; every worker then samples its
+            jobs and the samples are merged into it.
+        approx: Estimate the global color metrics from a stratified pixel
+            sample, with confidence intervals (see color.sampling).
+        use_derivatives: Decode the images' analysis derivatives when they
+            exist (see color_features.load_rgb).
+
+    Returns:
+        (n_rows, n_errors, scheduler) - call scheduler.report() for utilization.
+    """
+    from ..color.feature_stream import FeatureResult, resolve_metrics, write_results_csv
+
+    metrics = resolve_metrics(metrics)
+    if manifest_csv:
+        from .manifest import load_manifest, schedulable
+        items = schedulable(load_manifest(manifest_csv), image_dir)
+    else:
+        items = image_sizes(os.path.join(image_dir, name) for name in sorted(os.listdir(image_dir)))
+
+    def as_result(key, result):
+        """A job that raised (or a dead worker) becomes an error row instead of ending the run."""
+        if isinstance(result, BaseException):
+            return FeatureResult(key, {}, {'worker': f"{type(result).__name__}: {result}"})
+        return result
+
+    scheduler = SizeAwareScheduler(workers, max_pixels)
+    if profile is None:
+        results = (as_result(key, result) for key, result in
+                   scheduler.map(_score_image, items, metrics, max_side, approx, use_derivatives))
+    else:
+        from ..profiling import ProfiledCall
+        job = ProfiledCall(_score_image, profile.interval)
+        results = (as_result(key, profile.unwrap(result)) for key, result in
+                   scheduler.map(job, items, metrics, max_side, approx, use_derivatives))
+    n_rows, n_errors = write_results_csv(results, output_csv, metrics)
+    return n_rows, n_errors, scheduler
+
+
+if __name__ == '__main__':
+    n_rows, n_errors, scheduler = score_corpus(metrics=['warmth', 'colorfulness', 'brightness'], workers=4)
+    print(f"Scored {n_rows} images ({n_errors} with errors)")
+    scheduler.report()
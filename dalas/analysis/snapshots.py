@@ -0,0 +1,331 @@
+"""
+Immutable, versioned snapshots of artwork_data.csv.
+
+Layout of a snapshot store (SNAPSHOTS_DIR by default):
+
+    chunks/<hash>.parquet     rows, named by the hash of their row ids (content addressed)
+    manifests/<id>.json       one per snapshot: its chunks and, per chunk, deleted row ids
+
+Every row gets an id hashed from its values (and its occurrence number, so
+exact duplicate lines stay distinct). A new snapshot compares the CSV with
+its parent: rows whose id is new are written to new chunks, rows that are
+gone are recorded as deleted in the manifest (tombstones), and everything
+else is inherited by reference. A day of scraping costs the changed and new
+rows only; a price change is a deletion plus a new row.
+
+Snapshots are opened lazily as a pyarrow dataset: filters on the typed
+columns (parsed_price, parsed_year, width_cm...) are pushed down to the
+Parquet row group statistics, and chunks are sorted by artist, title and
+year. Requires pyarrow.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from datetime import date, datetime
+
+import pandas as pd
+
+from .parsing import parse_artworks
+from ..paths import ARTWORK_CSV, SNAPSHOTS_DIR
+
+CHUNK_ROWS = 50_000       # Rows per chunk file
+ROW_GROUP_ROWS = 10_000   # Rows per Parquet row group (the unit of predicate pushdown)
+
+KEY_FIELDS = ('artist', 'title', 'year')  # Identity of an artwork across snapshots, as in store.py
+ROW_ID = '_row'
+KEY = '_key'
+# Typed columns stored next to the raw (string) CSV columns: name -> parse_artworks column
+TYPED_COLUMNS = {'parsed_year': 'year', 'parsed_price': 'price', 'currency': 'currency',
+                 'width_cm': 'width_cm', 'height_cm': 'height_cm', 'depth_cm': 'depth_cm'}
+
+
+def _hash(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _write_atomic(path, write):
+    """Calls write(temporary path), then moves the result into place."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def snapshot_frame(csv_file=ARTWORK_CSV):
+    """
+    Reads a scraped CSV as the rows of a snapshot: raw columns as strings,
+    the typed TYPED_COLUMNS, the artwork key and the row id.
+    """
+    raw = pd.read_csv(csv_file, dtype=str, keep_default_na=False)
+    raw = raw.mask(raw == '')  # Empty cells -> missing
+    columns = sorted(raw.columns)
+    contents = [json.dumps([[c, v] for c, v in zip(columns, values) if isinstance(v, str)], ensure_ascii=False)
+                for values in raw[columns].itertuples(index=False)]
+    occurrence = pd.Series(contents).groupby(contents).cumcount()
+    frame = raw.copy()
+    parsed = parse_artworks(raw)
+    for name, source in TYPED_COLUMNS.items():
+        frame[name] = parsed[source].to_numpy()
+    frame['parsed_year'] = frame['parsed_year'].astype('Int64')
+    frame[KEY] = raw.reindex(columns=list(KEY_FIELDS)).fillna('').agg("|".join, axis=1)
+    frame[ROW_ID] = [_hash(f"{content}\x00{n}") for content, n in zip(contents, occurrence)]
+    return frame
+
+
+class SnapshotStore:
+    """
+    A directory of dataset snapshots (see the module docstring).
+
+    Example:
+        store = SnapshotStore()
+        store.create(ARTWORK_CSV, message="daily scrape")
+        store.read("2026-09-01", filters=[('parsed_price', '<', 1500)])  # As of that day
+        store.price_history(filters=[('artist', '==', 'Nadia Zouari')])
+    """
+
+    def __init__(self, root=SNAPSHOTS_DIR):
+        self.root = root
+        self.chunks_dir = os.path.join(root, "chunks")
+        self.manifests_dir = os.path.join(root, "manifests")
+
+    # --- 1. Snapshots ---
+
+    def snapshots(self):
+        """Manifests of every snapshot, oldest first."""
+        if not os.path.isdir(self.manifests_dir):
+            return []
+        manifests = []
+        for name in os.listdir(self.manifests_dir):
+            if name.endswith('.json'):
+                with open(os.path.join(self.manifests_dir, name), encoding='utf-8') as f:
+                    manifests.append(json.load(f))
+        return sorted(manifests, key=lambda m: m['sequence'])
+
+    def resolve(self, snapshot=None):
+        """
+        Finds a snapshot's manifest.
+
+        Args:
+            snapshot: None (the latest), a snapshot id or unique id prefix, or
+                a date / datetime / ISO date string (the latest snapshot
+                created on or before it: time travel).
+
+        Raises:
+            KeyError if there is no such snapshot.
+        """
+        manifests = self.snapshots()
+        if snapshot is None:
+            if not manifests:
+                raise KeyError(f"No snapshots in {self.root}")
+            return manifests[-1]
+        if isinstance(snapshot, str):
+            matches = [m for m in manifests if m['id'].startswith(snapshot)]
+            if len(matches) == 1:
+                return matches[0]
+            try:
+                snapshot = (date.fromisoformat(snapshot) if len(snapshot) == 10  # YYYY-MM-DD: the whole day
+                            else datetime.fromisoformat(snapshot))
+            except ValueError:
+                raise KeyError(f"Unknown or ambiguous snapshot: {snapshot}") from None
+        if isinstance(snapshot, date) and not isinstance(snapshot, datetime):
+            snapshot = datetime.combine(snapshot, datetime.max.time())
+        cutoff = snapshot.isoformat(timespec='seconds')
+        earlier = [m for m in manifests if m['created'] <= cutoff]
+        if not earlier:
+            raise KeyError(f"No snapshot on or before {cutoff}")
+        return earlier[-1]
+
+    def _chunk_path(self, name):
+        return os.path.join(self.chunks_dir, name)
+
+    def _write_chunks(self, rows):
+        """Writes rows (sorted by key) as content addressed chunks. Returns their manifest entries."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        entries = []
+        for start in range(0, len(rows), CHUNK_ROWS):
+            part = rows.iloc[start:start + CHUNK_ROWS]
+            name = _hash("\n".join(part[ROW_ID])) + ".parquet"
+            path = self._chunk_path(name)
+            if not os.path.exists(path):  # Same rows, same file: already stored
+                table = pa.Table.from_pandas(part, preserve_index=False)
+                _write_atomic(path, lambda tmp: pq.write_table(table, tmp, row_group_size=ROW_GROUP_ROWS,
+                                                               compression='zstd'))
+            entries.append({'file': name, 'rows': len(part), 'deleted': []})
+        return entries
+
+    def _chunk_rows(self, name):
+        """(row ids, artwork keys) of a chunk, reading those two columns only."""
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(self._chunk_path(name), columns=[ROW_ID, KEY])
+        return table.column(ROW_ID).to_pylist(), table.column(KEY).to_pylist()
+
+    def create(self, csv_file=ARTWORK_CSV, message=""):
+        """
+        Snapshots a CSV, storing only the rows that changed since the latest snapshot.
+
+        Returns:
+            The new snapshot's manifest (the latest one if nothing changed).
+        """
+        os.makedirs(self.chunks_dir, exist_ok=True)
+        os.makedirs(self.manifests_dir, exist_ok=True)
+        frame = snapshot_frame(csv_file)
+        wanted = set(frame[ROW_ID])
+        history = self.snapshots()
+        parent = history[-1] if history else None
+
+        chunks, live = [], set()
+        parent_rows, parent_keys = set(), set()
+        for entry in (parent['chunks'] if parent else []):
+            ids, keys = self._chunk_rows(entry['file'])
+            deleted = set(entry['deleted'])
+            for row_id, key in zip(ids, keys):
+                if row_id not in deleted:
+                    parent_rows.add(row_id)
+                    parent_keys.add(key)
+            # Deletions are recomputed from scratch, so rows that come back are
+            # revived in their old chunk rather than written again
+            still_deleted = sorted(set(ids) - wanted)
+            live.update(row_id for row_id in ids if row_id in wanted)
+            if len(still_deleted) < len(ids):  # Chunks without any live row are dropped
+                chunks.append({**entry, 'deleted': still_deleted})
+
+        new_rows = frame[~frame[ROW_ID].isin(live)].sort_values([KEY, ROW_ID], kind='stable')
+        removed = parent_rows - wanted
+        if parent and new_rows.empty and not removed:
+            print(f"Nothing changed since snapshot {parent['id']}")
+            return parent
+        chunks += self._write_chunks(new_rows)
+
+        manifest = {
+            'parent': parent['id'] if parent else None,
+            'sequence': parent['sequence'] + 1 if parent else 0,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'source': os.path.abspath(csv_file),
+            'message': message,
+            'rows': len(frame),
+            'columns': list(frame.columns),
+            'added_rows': len(new_rows),
+            'removed_rows': len(removed),
+            'changed_artworks': int(new_rows[KEY].isin(parent_keys).sum()),
+            'chunks': chunks,
+        }
+        manifest['id'] = _hash(json.dumps([manifest['parent'], manifest['created'], chunks]))[:12]
+        path = os.path.join(self.manifests_dir, f"{manifest['id']}.json")
+        _write_atomic(path, lambda tmp: _dump_json(manifest, tmp))
+        return manifest
+
+    # --- 2. Reading (lazy, with predicate pushdown) ---
+
+    def open(self, snapshot=None):
+        """
+        A snapshot as a lazy pyarrow dataset: nothing is read until it is
+        scanned, e.g. dataset.to_table(columns=[...], filter=pc.field('parsed_price') < 1500).
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        manifest = self.resolve(snapshot)
+        paths = [self._chunk_path(entry['file']) for entry in manifest['chunks']]
+        schema = pa.unify_schemas([pq.read_schema(path) for path in paths]) if paths else pa.schema([])
+        dataset = ds.dataset(paths, schema=schema, format='parquet')
+        deleted = [row_id for entry in manifest['chunks'] for row_id in entry['deleted']]
+        if deleted:  # A row id is live in at most one chunk, so the tombstones can be applied globally
+            dataset = dataset.filter(~pc.field(ROW_ID).isin(pa.array(deleted, pa.string())))
+        return dataset
+
+    def read(self, snapshot=None, columns=None, filters=None):
+        """
+        Reads a snapshot into a DataFrame.
+
+        Args:
+            snapshot: See resolve().
+            columns: Columns to read (default: all, without the _key / _row bookkeeping).
+            filters: A pyarrow expression or pandas-style filters, e.g.
+                [('parsed_price', '<', 1500), ('parsed_year', '>=', 2020)].
+
+        Returns:
+            A pandas DataFrame.
+        """
+        dataset = self.open(snapshot)
+        if columns is None:
+            columns = [name for name in dataset.schema.names if name not in (KEY, ROW_ID)]
+        return dataset.to_table(columns=columns, filter=_expression(filters)).to_pandas()
+
+    def price_history(self, filters=None, manifests=None):
+        """
+        Price of every artwork in every snapshot. Each chunk is read once,
+        whatever the number of snapshots sharing it.
+
+        Args:
+            filters: As in read() (applied to each chunk).
+            manifests: Snapshots to include (default: all, see snapshots()).
+
+        Returns:
+            A DataFrame with snapshot, created, artist, title, parsed_year,
+            parsed_price and currency, one row per artwork and snapshot.
+        """
+        import pyarrow.dataset as ds
+
+        columns = ['artist', 'title', 'parsed_year', 'parsed_price', 'currency', ROW_ID]
+        expression = _expression(filters)
+        tables = {}
+        frames = []
+        for manifest in manifests or self.snapshots():
+            for entry in manifest['chunks']:
+                if entry['file'] not in tables:
+                    chunk = ds.dataset(self._chunk_path(entry['file']), format='parquet')
+                    names = [c for c in columns if c in chunk.schema.names]
+                    tables[entry['file']] = chunk.to_table(columns=names, filter=expression).to_pandas()
+                rows = tables[entry['file']]
+                if entry['deleted']:
+                    rows = rows[~rows[ROW_ID].isin(entry['deleted'])]
+                frames.append(rows.assign(snapshot=manifest['id'], created=manifest['created']))
+        if not frames:
+            return pd.DataFrame(columns=['snapshot', 'created'] + columns[:-1])
+        history = pd.concat(frames, ignore_index=True).reindex(columns=['snapshot', 'created'] + columns)
+        return history.drop(columns=[ROW_ID])
+
+
+def _expression(filters):
+    """pyarrow expression from pandas-style filters (or an expression, or None)."""
+    if filters is None or not isinstance(filters, list):
+        return filters
+    import pyarrow.parquet as pq
+
+    return pq.filters_to_expression(filters)
+
+
+def _dump_json(data, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+
+
+def create_snapshot(csv_file=ARTWORK_CSV, root=SNAPSHOTS_DIR, message=""):
+    """Snapshots a CSV into the store at root (see SnapshotStore.create). Returns the manifest."""
+    return SnapshotStore(root).create(csv_file, message)
+
+
+def read_snapshot(snapshot=None, root=SNAPSHOTS_DIR, columns=None, filters=None):
+    """Reads a snapshot of the store at root (see SnapshotStore.read), or returns None if there is none."""
+    try:
+        return SnapshotStore(root).read(snapshot, columns, filters)
+    except KeyError as e:
+        print(f"Error: {e.args[0]}")
+        return None
+
+
+if __name__ == '__main__':
+    store = SnapshotStore()
+    manifest = store.create(message="example")
+    print(f"Snapshot {manifest['id']}: {manifest['rows']} rows, {manifest['added_rows']} stored")
+    print(store.read(filters=[('parsed_price', '<', 1500)])[['title', 'artist', 'parsed_price']].head())
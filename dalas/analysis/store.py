@@ -0,0 +1,261 @@
+import csv
+import os
+import sqlite3
+from itertools import islice
+
+import pandas as pd
+
+from .parsing import parse_artworks
+from .tag_index import INDEXED_FIELDS, MULTI_VALUED_FIELDS, split_terms
+from ..paths import ARTWORK_CSV, ARTWORK_DB
+
+BATCH_SIZE = 500  # Rows per executemany call (and per "IN (...)" lookup, under SQLite's 999 variables)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artworks (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,          -- artist|title|year as scraped, for re-ingestion
+    title TEXT,
+    artist TEXT,
+    year INTEGER,
+    price REAL,                        -- euros
+    width_cm REAL,
+    height_cm REAL,
+    depth_cm REAL,
+    support TEXT,
+    encadrement TEXT,
+    image_filename TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_artworks_artist ON artworks(artist);
+CREATE INDEX IF NOT EXISTS idx_artworks_year ON artworks(year);
+CREATE INDEX IF NOT EXISTS idx_artworks_price ON artworks(price);
+CREATE INDEX IF NOT EXISTS idx_artworks_image ON artworks(image_filename);
+
+-- Normalised tags / techniques / support / encadrement terms (see tag_index.split_terms)
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    field TEXT NOT NULL,
+    term TEXT NOT NULL,
+    UNIQUE (field, term)
+);
+CREATE TABLE IF NOT EXISTS artwork_terms (
+    artwork_id INTEGER NOT NULL REFERENCES artworks(id) ON DELETE CASCADE,
+    term_id INTEGER NOT NULL REFERENCES terms(id),
+    PRIMARY KEY (artwork_id, term_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_artwork_terms_term ON artwork_terms(term_id, artwork_id);
+
+-- Image metrics in long form (one row per image and metric, tuples as name_0, name_1, ...)
+CREATE TABLE IF NOT EXISTS image_features (
+    image_filename TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (image_filename, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_image_features_name ON image_features(name, value);
+"""
+
+
+def connect(db_path=ARTWORK_DB):
+    """
+    Opens (and creates if needed) the artwork database.
+
+    Returns:
+        A sqlite3.Connection with the schema in place.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _batches(rows, size=BATCH_SIZE):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _artwork_rows(batch):
+    """Typed database rows of a batch of scraped records (rows of artwork_data.csv), parsed at once."""
+    raw = pd.DataFrame.from_records(batch)
+    parsed = parse_artworks(raw)[['year', 'price', 'width_cm', 'height_cm', 'depth_cm']].astype(object)
+    parsed = parsed.where(parsed.notna(), None)  # NaN / <NA> -> NULL
+    rows = []
+    for record, (year, price, width, height, depth) in zip(batch, parsed.itertuples(index=False)):
+        key = "|".join(str(record.get(k) or '') for k in ('artist', 'title', 'year'))
+        rows.append((key, record.get('title'), record.get('artist'), year, price, width, height, depth,
+                     record.get('support'), record.get('encadrement'), record.get('image_filename')))
+    return rows
+
+
+def ingest_artworks(conn, records, fields=INDEXED_FIELDS):
+    """
+    Bulk loads scraped artwork records (dictionaries with the artwork_data.csv
+    columns) in one transaction, with batched executemany calls.
+
+    Records already in the store (same artist, title and year) are updated
+    and their terms replaced, so re-running an ingestion is safe.
+
+    Args:
+        conn: Connection from connect().
+        records: Iterable of dictionaries (consumed lazily).
+        fields: Columns stored as normalised terms.
+
+    Returns:
+        The number of records ingested.
+    """
+    n = 0
+    with conn:
+        for batch in _batches(records):
+            rows = _artwork_rows(batch)
+            conn.executemany(
+                """INSERT INTO artworks (key, title, artist, year, price, width_cm, height_cm, depth_cm,
+                                         support, encadrement, image_filename)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(key) DO UPDATE SET
+                       title = excluded.title, artist = excluded.artist, year = excluded.year,
+                       price = excluded.price, width_cm = excluded.width_cm,
+                       height_cm = excluded.height_cm, depth_cm = excluded.depth_cm,
+                       support = excluded.support, encadrement = excluded.encadrement,
+                       image_filename = excluded.image_filename""", rows)
+
+            keys = [row[0] for row in rows]
+            ids = dict(conn.execute(f"SELECT key, id FROM artworks WHERE key IN ({','.join('?' * len(keys))})",
+                                    keys))
+            links = {(ids[key], field, term)
+                     for key, record in zip(keys, batch)
+                     for field in fields
+                     for term in split_terms(record.get(field), field in MULTI_VALUED_FIELDS)}
+            conn.executemany("INSERT OR IGNORE INTO terms (field, term) VALUES (?, ?)",
+                             {(field, term) for _, field, term in links})
+            conn.executemany("DELETE FROM artwork_terms WHERE artwork_id = ?", [(i,) for i in set(ids.values())])
+            conn.executemany("""INSERT OR IGNORE INTO artwork_terms (artwork_id, term_id)
+                                SELECT ?, id FROM terms WHERE field = ? AND term = ?""", links)
+            n += len(batch)
+    return n
+
+
+def ingest_csv(conn, csv_file=ARTWORK_CSV):
+    """Streams artwork_data.csv into the store (see ingest_artworks). Returns the row count."""
+    with open(csv_file, 'r', newline='', encoding='utf-8') as csvfile:
+        return ingest_artworks(conn, csv.DictReader(csvfile))
+
+
+def ingest_features(conn, features_csv):
+    """
+    Loads a metrics CSV (python -m dalas features / score) into image_features,
+    keyed by image file name. Empty cells (failed metrics) are skipped.
+
+    Returns:
+        The number of (image, metric) values stored.
+    """
+    def values(reader):
+        for row in reader:
+            image_filename = os.path.basename(row.pop('path'))
+            row.pop('error', None)
+            for name, value in row.items():
+                if value not in ('', None):
+                    yield image_filename, name, float(value)
+
+    n = 0
+    with open(features_csv, 'r', newline='', encoding='utf-8') as csvfile, conn:
+        for batch in _batches(values(csv.DictReader(csvfile))):
+            conn.executemany("INSERT OR REPLACE INTO image_features (image_filename, name, value) VALUES (?, ?, ?)",
+                             batch)
+            n += len(batch)
+    return n
+
+
+# --- Queries pushed down to the store ---
+
+def select_artworks(conn, techniques=None, tags=None, artist=None, min_year=None, max_year=None,
+                    min_price=None, max_price=None, features=()):
+    """
+    Filters artworks in SQL, using the indexes, and returns the matches as a DataFrame.
+
+    Example: all acrylic works from 2020 on under 1500 €:
+        select_artworks(conn, techniques='acrylique', min_year=2020, max_price=1500)
+
+    Args:
+        techniques, tags: A term or list of terms; an artwork must have all of them.
+        artist: Exact artist name.
+        min_year, max_year, min_price, max_price: Inclusive bounds.
+        features: Metric names (image_features) to add as columns.
+
+    Returns:
+        A pandas DataFrame with the artworks columns (plus the requested features).
+    """
+    where, params = [], []
+    for field, wanted in (('techniques', techniques), ('tags', tags)):
+        for term in [wanted] if isinstance(wanted, str) else (wanted or []):
+            where.append("""a.id IN (SELECT at.artwork_id FROM artwork_terms at JOIN terms t ON t.id = at.term_id
+                                     WHERE t.field = ? AND t.term = ?)""")
+            params += [field, term.lower()]
+    for clause, value in (("a.artist = ?", artist), ("a.year >= ?", min_year), ("a.year <= ?", max_year),
+                          ("a.price >= ?", min_price), ("a.price <= ?", max_price)):
+        if value is not None:
+            where.append(clause)
+            params.append(value)
+
+    columns = ["a.*"] + [f"(SELECT value FROM image_features f WHERE f.image_filename = a.image_filename "
+                         f"AND f.name = ?) AS \"{name}\"" for name in features]
+    sql = f"SELECT {', '.join(columns)} FROM artworks a"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return pd.read_sql_query(sql + " ORDER BY a.id", conn, params=list(features) + params)
+
+
+def term_price_stats(conn, field='techniques', min_count=1):
+    """
+    Count and price statistics per term of a field, aggregated in SQL.
+
+    Returns:
+        A DataFrame with columns term, count, mean_price, min_price, max_price,
+        sorted by count.
+    """
+    return pd.read_sql_query(
+        """SELECT t.term, COUNT(*) AS count, AVG(a.price) AS mean_price,
+                  MIN(a.price) AS min_price, MAX(a.price) AS max_price
+           FROM terms t
+           JOIN artwork_terms at ON at.term_id = t.id
+           JOIN artworks a ON a.id = at.artwork_id
+           WHERE t.field = ?
+           GROUP BY t.id HAVING COUNT(*) >= ?
+           ORDER BY count DESC, t.term""", conn, params=[field, min_count])
+
+
+def artwork_terms(conn, field):
+    """Terms of every artwork for one field, as a dictionary artwork id -> list of terms."""
+    terms = {}
+    for artwork_id, term in conn.execute(
+            """SELECT at.artwork_id, t.term FROM artwork_terms at JOIN terms t ON t.id = at.term_id
+               WHERE t.field = ? ORDER BY at.artwork_id, t.term""", (field,)):
+        terms.setdefault(artwork_id, []).append(term)
+    return terms
+
+
+def build_store(csv_file=ARTWORK_CSV, db_path=ARTWORK_DB, features_csv=None):
+    """
+    Ingests artwork_data.csv (and optionally a metrics CSV) into the database.
+
+    Returns:
+        (n_artworks, n_feature_values).
+    """
+    conn = connect(db_path)
+    try:
+        n_artworks = ingest_csv(conn, csv_file)
+        n_features = ingest_features(conn, features_csv) if features_csv else 0
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    return n_artworks, n_features
+
+
+if __name__ == '__main__':
+    build_store()
+    db = connect()
+    print(select_artworks(db, techniques='acrylique', min_year=2020, max_price=1500)[['title', 'artist', 'year', 'price']])
+    print(term_price_stats(db).head(10))
+    db.close()
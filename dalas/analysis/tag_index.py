@@ -0,0 +1,214 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .parsing import parse_prices
+from ..paths import ARTWORK_CSV
+
+# Columns indexed, and the placeholder values the scraper / EDA scripts write
+# when a field is missing (they must not become searchable terms).
+INDEXED_FIELDS = ['tags', 'techniques', 'support', 'encadrement']
+MULTI_VALUED_FIELDS = {'tags', 'techniques'}  # support/encadrement may contain commas themselves
+MISSING_TERMS = {
+    'no tags', 'no tags found', 'techniques not found', 'not specified',
+    'not found', 'unknown', '',
+}
+
+
+def split_terms(value, multi_valued=True):
+    """
+    Splits a comma separated cell ("Abstrait, noir, bleu foncé") into a list
+    of normalised (lowercase, stripped) terms, dropping missing placeholders.
+    Single valued cells are normalised but not split.
+    """
+    if not isinstance(value, str):
+        return []
+    parts = value.split(',') if multi_valued else [value]
+    terms = (term.strip().rstrip(',').lower() for term in parts)
+    return [term for term in terms if term not in MISSING_TERMS]
+
+
+def parse_price(price_str):
+    """Converts a scraped price ("1 200 €") to a float, NaN if not numeric (see parsing.parse_prices)."""
+    if not isinstance(price_str, str):
+        return np.nan if price_str is None else float(price_str)
+    return float(parse_prices(pd.Series([price_str]))['price'].iloc[0])
+
+
+class TagIndex:
+    """
+    Inverted index over the categorical columns of artwork_data.csv.
+
+    Postings are stored as a sparse CSR matrix of shape (n_terms, n_artworks):
+    row i is the posting list of term i, so every query is a handful of row
+    selections and a vectorised sum instead of a rescan of the DataFrame.
+    Terms are keyed as "field:term", e.g. "tags:abstrait".
+    """
+
+    def __init__(self, postings, terms, prices, titles=None):
+        self.postings = sparse.csr_matrix(postings, dtype=np.uint8)
+        self.terms = list(terms)
+        self.term_ids = {term: i for i, term in enumerate(self.terms)}
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.titles = list(titles) if titles is not None else None
+
+    @property
+    def n_artworks(self):
+        return self.postings.shape[1]
+
+    @classmethod
+    def from_dataframe(cls, df, fields=INDEXED_FIELDS):
+        """
+        Builds the index from a raw (or cleaned) artwork DataFrame.
+
+        Args:
+            df: DataFrame with the columns produced by one_painting.py.
+            fields: Columns to index. Each cell may hold a comma separated list.
+
+        Returns:
+            A TagIndex.
+        """
+        term_ids = {}
+        rows, cols = [], []
+        for field in fields:
+            if field not in df.columns:
+                continue
+            multi_valued = field in MULTI_VALUED_FIELDS
+            for doc_id, value in enumerate(df[field].tolist()):
+                for term in set(split_terms(value, multi_valued)):
+                    key = f"{field}:{term}"
+                    rows.append(term_ids.setdefault(key, len(term_ids)))
+                    cols.append(doc_id)
+
+        data = np.ones(len(rows), dtype=np.uint8)
+        postings = sparse.csr_matrix((data, (rows, cols)), shape=(len(term_ids), len(df)))
+        terms = sorted(term_ids, key=term_ids.get)
+        prices = parse_prices(df['price'])['price'].to_numpy() if 'price' in df.columns else np.full(len(df), np.nan)
+        titles = df['title'].tolist() if 'title' in df.columns else None
+        return cls(postings, terms, prices, titles)
+
+    @classmethod
+    def from_csv(cls, csv_file=ARTWORK_CSV, fields=INDEXED_FIELDS):
+        """Loads artwork_data.csv, drops duplicate rows (as the EDA does) and indexes it."""
+        df = pd.read_csv(csv_file).drop_duplicates().reset_index(drop=True)
+        return cls.from_dataframe(df, fields)
+
+    # --- Queries ---
+
+    def _term_rows(self, query):
+        """Resolves {field: term or [terms]} into distinct posting-list row ids (a repeated term counts once)."""
+        row_ids = []
+        for field, values in query.items():
+            if isinstance(values, str):
+                values = [values]
+            for value in values:
+                key = f"{field}:{value.strip().lower()}"
+                if key not in self.term_ids:
+                    return None  # Unknown term: nothing can match the conjunction
+                row_ids.append(self.term_ids[key])
+        return sorted(set(row_ids))
+
+    def select(self, **query):
+        """
+        Returns a boolean mask over artworks matching *all* the given terms.
+
+        Example:
+            index.select(tags='abstrait', techniques=['acrylique', 'fusain'])
+        """
+        row_ids = self._term_rows(query)
+        if row_ids is None:
+            return np.zeros(self.n_artworks, dtype=bool)
+        if not row_ids:
+            return np.ones(self.n_artworks, dtype=bool)
+        hits = np.asarray(self.postings[row_ids].sum(axis=0)).ravel()
+        return hits == len(row_ids)
+
+    def count(self, **query):
+        """Number of artworks carrying all the given terms."""
+        return int(self.select(**query).sum())
+
+    def price_stats(self, **query):
+        """
+        Price aggregates over the artworks matching all the given terms.
+
+        Returns:
+            A dict with count, priced (rows with a numeric price), median,
+            mean, min and max. Aggregates are NaN when nothing is priced.
+        """
+        mask = self.select(**query)
+        prices = self.prices[mask]
+        prices = prices[~np.isnan(prices)]
+        stats = {'count': int(mask.sum()), 'priced': int(prices.size)}
+        if prices.size:
+            stats.update(median=float(np.median(prices)), mean=float(prices.mean()),
+                         min=float(prices.min()), max=float(prices.max()))
+        else:
+            stats.update(median=np.nan, mean=np.nan, min=np.nan, max=np.nan)
+        return stats
+
+    def term_counts(self, field=None):
+        """Document frequency of every term (optionally of one field), most common first."""
+        counts = np.asarray(self.postings.sum(axis=1)).ravel()
+        series = pd.Series(counts, index=self.terms, name='Count')
+        if field is not None:
+            prefix = f"{field}:"
+            series = series[series.index.str.startswith(prefix)]
+            series.index = series.index.str[len(prefix):]
+        return series.sort_values(ascending=False)
+
+    def cooccurrence(self, field_a, field_b=None, min_count=1):
+        """
+        Co-occurrence counts between the terms of two fields (or one field with itself).
+
+        Computed as a single sparse product P_a @ P_b.T.
+
+        Returns:
+            A DataFrame (terms of field_a x terms of field_b), restricted to
+            terms appearing in at least min_count artworks.
+        """
+        field_b = field_b or field_a
+        counts = np.asarray(self.postings.sum(axis=1)).ravel()
+
+        def rows_of(field):
+            prefix = f"{field}:"
+            ids = [i for i, term in enumerate(self.terms)
+                   if term.startswith(prefix) and counts[i] >= min_count]
+            return ids, [self.terms[i][len(prefix):] for i in ids]
+
+        ids_a, names_a = rows_of(field_a)
+        ids_b, names_b = rows_of(field_b)
+        product = (self.postings[ids_a].astype(np.int32) @ self.postings[ids_b].T.astype(np.int32)).toarray()
+        return pd.DataFrame(product, index=names_a, columns=names_b)
+
+    # --- Persistence ---
+
+    def save(self, directory):
+        """Writes the index to a directory (postings.npz, terms.json, prices.npy)."""
+        os.makedirs(directory, exist_ok=True)
+        sparse.save_npz(os.path.join(directory, "postings.npz"), self.postings)
+        np.save(os.path.join(directory, "prices.npy"), self.prices)
+        with open(os.path.join(directory, "terms.json"), 'w', encoding='utf-8') as f:
+            json.dump({'terms': self.terms, 'titles': self.titles}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory):
+        """Loads an index written by save()."""
+        postings = sparse.load_npz(os.path.join(directory, "postings.npz"))
+        prices = np.load(os.path.join(directory, "prices.npy"))
+        with open(os.path.join(directory, "terms.json"), encoding='utf-8') as f:
+            meta = json.load(f)
+        return cls(postings, meta['terms'], prices, meta.get('titles'))
+
+
+if __name__ == '__main__':
+    # Example usage: build the index from the scraped data and save it for the dashboard.
+    index = TagIndex.from_csv(ARTWORK_CSV)
+    index.save("tag_index")
+    print(f"Indexed {index.n_artworks} artworks, {len(index.terms)} terms.")
+    print("\n--- Most Common Techniques ---")
+    print(index.term_counts('techniques').head(10))
+    print("\n--- Abstrait + acrylique ---")
+    print(index.price_stats(tags='abstrait', techniques='acrylique'))
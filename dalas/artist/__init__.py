@@ -0,0 +1,16 @@
+"""Artist analysis (3.1): profile pictures (face detection), biographies and biography text features."""
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'detect_face': 'profilepic',
+    'detect_faces': 'face_detection',
+    'FaceDetector': 'face_detection',
+    'get_artist_biography': 'biography',
+    'get_artist_profile_link': 'biography',
+    'BiographyFeatures': 'bio_features',
+    'update_biography_features': 'bio_features',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+from scipy import sparse
+
+from ..paths import BIOGRAPHY_FEATURES_DIR
+
+TOKEN_RE = re.compile(r"[^\W\d_]{2,}")  # Words of 2+ letters (accents included), no digits
+SENTENCE_RE = re.compile(r"[.!?]+")
+
+# A few very frequent function words per language: enough to tell the Artsper
+# biographies apart (mostly French and English) without an extra dependency.
+STOPWORDS = {
+    'fr': {'le', 'la', 'les', 'des', 'du', 'et', 'est', 'une', 'dans', 'pour', 'par', 'sur', 'au', 'aux',
+           'qui', 'que', 'avec', 'son', 'ses', 'elle', 'il', 'en', 'de', 'un', 'ont', 'sont'},
+    'en': {'the', 'and', 'is', 'in', 'of', 'to', 'his', 'her', 'with', 'for', 'on', 'by', 'as', 'was',
+           'has', 'at', 'from', 'an', 'she', 'he', 'which', 'are', 'works'},
+    'es': {'el', 'los', 'las', 'del', 'y', 'es', 'una', 'por', 'con', 'para', 'su', 'sus', 'como', 'se', 'lo'},
+    'de': {'der', 'die', 'das', 'und', 'ist', 'ein', 'eine', 'mit', 'von', 'zu', 'den', 'im', 'sich', 'auf'},
+    'it': {'il', 'della', 'di', 'che', 'è', 'per', 'con', 'gli', 'nel', 'delle', 'sono', 'una', 'dei'},
+}
+STOPWORD_SET = set().union(*STOPWORDS.values())
+
+# Story & Concept keywords (French and English), counted per biography.
+KEYWORDS = {
+    'exhibitions': re.compile(r"\b(?:expos\w*|exhibit\w*|salons?|biennale\w*)", re.IGNORECASE),
+    'awards': re.compile(r"\b(?:prix|awards?|prizes?|laur[ée]at\w*|m[ée]dailles?|medals?)\b", re.IGNORECASE),
+    'education': re.compile(r"(?:beaux[- ]arts|[ée]cole|academ\w*|acad[ée]mie|universit\w*|dipl[ôo]m\w*|school)",
+                            re.IGNORECASE),
+    'galleries': re.compile(r"\b(?:galeries?|galler\w*)", re.IGNORECASE),
+    'museums': re.compile(r"\b(?:mus[ée]es?|museums?|collections?)\b", re.IGNORECASE),
+}
+
+STAT_NAMES = ['n_chars', 'n_words', 'n_sentences'] + [f'kw_{name}' for name in KEYWORDS]
+
+
+def tokenize(text):
+    """Lowercase word tokens of a biography (empty for missing / "N/A" texts)."""
+    if not isinstance(text, str) or text == "N/A":
+        return []
+    return TOKEN_RE.findall(text.lower())
+
+
+def detect_language(tokens, min_hits=3):
+    """
+    Guesses the language from stopword counts.
+
+    Returns:
+        'fr', 'en', 'es', 'de', 'it' or 'unknown' (fewer than min_hits stopwords).
+    """
+    hits = {lang: sum(token in words for token in tokens) for lang, words in STOPWORDS.items()}
+    best = max(hits, key=hits.get)
+    return best if hits[best] >= min_hits else 'unknown'
+
+
+def text_stats(text, tokens):
+    """Length and keyword counts of one biography, ordered as STAT_NAMES."""
+    text = text if isinstance(text, str) and text != "N/A" else ""
+    sentences = [part for part in SENTENCE_RE.split(text) if part.strip()]
+    return [len(text), len(tokens), len(sentences),
+            *(len(pattern.findall(text)) for pattern in KEYWORDS.values())]
+
+
+def _digest(text):
+    return hashlib.sha1((text or "").encode('utf-8')).hexdigest()
+
+
+class BiographyFeatures:
+    """
+    Text features of artist biographies, updated incrementally.
+
+    Term counts are kept as a sparse CSR matrix (artists x vocabulary) with a
+    growing vocabulary: adding artists only tokenizes their biographies and
+    appends rows (and new columns). TF-IDF weights are derived from the counts
+    on demand, so they always reflect the whole corpus without refitting.
+    """
+
+    def __init__(self, artists=None, vocabulary=None, counts=None, stats=None, languages=None, digests=None):
+        self.artists = list(artists or [])
+        self.vocabulary = list(vocabulary or [])
+        self.counts = counts if counts is not None else sparse.csr_matrix((0, 0), dtype=np.int32)
+        self.stats = stats if stats is not None else np.zeros((0, len(STAT_NAMES)))
+        self.languages = list(languages or [])
+        self.digests = list(digests or [])
+        self._rows = {artist: i for i, artist in enumerate(self.artists)}
+        self._terms = {term: j for j, term in enumerate(self.vocabulary)}
+
+    def __len__(self):
+        return len(self.artists)
+
+    def __contains__(self, artist):
+        return artist in self._rows
+
+    def update(self, biographies):
+        """
+        Adds or refreshes artists.
+
+        Args:
+            biographies: Mapping artist name -> biography text. Artists whose
+                text is unchanged are skipped; changed ones are replaced.
+
+        Returns:
+            The number of artists (re)vectorized.
+        """
+        todo = {artist: text for artist, text in biographies.items()
+                if artist not in self._rows or self.digests[self._rows[artist]] != _digest(text)}
+        if not todo:
+            return 0
+
+        rows, cols, stats, languages = [], [], [], []
+        for i, text in enumerate(todo.values()):
+            tokens = tokenize(text)
+            for token in tokens:
+                if token not in STOPWORD_SET:
+                    rows.append(i)
+                    cols.append(self._terms.setdefault(token, len(self._terms)))
+            stats.append(text_stats(text, tokens))
+            languages.append(detect_language(tokens))
+        self.vocabulary = sorted(self._terms, key=self._terms.get)
+
+        n_terms = len(self.vocabulary)
+        new_counts = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                                       shape=(len(todo), n_terms))  # Duplicates are summed
+        keep = [i for i, artist in enumerate(self.artists) if artist not in todo]
+        old_counts = self.counts[keep]
+        old_counts.resize((len(keep), n_terms))
+
+        self.counts = sparse.vstack([old_counts, new_counts], format='csr')
+        self.stats = np.vstack([self.stats[keep], np.array(stats, dtype=float)])
+        self.artists = [self.artists[i] for i in keep] + list(todo)
+        self.languages = [self.languages[i] for i in keep] + languages
+        self.digests = [self.digests[i] for i in keep] + [_digest(text) for text in todo.values()]
+        self._rows = {artist: i for i, artist in enumerate(self.artists)}
+        return len(todo)
+
+    def tfidf(self, artists=None):
+        """
+        L2-normalised TF-IDF matrix (sublinear tf, smoothed idf).
+
+        Args:
+            artists: Rows to return, in this order (default: all, in self.artists order).
+
+        Returns:
+            A CSR matrix of shape (n_artists, len(vocabulary)).
+        """
+        n_docs = self.counts.shape[0]
+        doc_freq = np.bincount(self.counts.indices, minlength=self.counts.shape[1])
+        idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1
+
+        counts = self.counts if artists is None else self.counts[[self._rows[a] for a in artists]]
+        weights = counts.astype(np.float64)
+        weights.data = (1 + np.log(weights.data)) * idf[weights.indices]
+        norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=1))).ravel()
+        norms[norms == 0] = 1
+        return (sparse.diags(1 / norms) @ weights).tocsr()
+
+    def top_terms(self, artist, n=10):
+        """The n highest weighted TF-IDF terms of an artist's biography."""
+        row = self.tfidf([artist])
+        order = np.argsort(row.data)[::-1][:n]
+        return [(self.vocabulary[row.indices[i]], float(row.data[i])) for i in order]
+
+    def frame(self):
+        """Dense per-artist features (STAT_NAMES and 'language') as a DataFrame indexed by artist."""
+        import pandas as pd
+
+        df = pd.DataFrame(self.stats, index=pd.Index(self.artists, name='artist'), columns=STAT_NAMES)
+        df['language'] = self.languages
+        return df
+
+    # --- Persistence ---
+
+    def save(self, directory=BIOGRAPHY_FEATURES_DIR):
+        """Writes the features to a directory (counts.npz, stats.npy, meta.json)."""
+        os.makedirs(directory, exist_ok=True)
+        sparse.save_npz(os.path.join(directory, "counts.npz"), self.counts)
+        np.save(os.path.join(directory, "stats.npy"), self.stats)
+        with open(os.path.join(directory, "meta.json"), 'w', encoding='utf-8') as f:
+            json.dump({'artists': self.artists, 'vocabulary': self.vocabulary,
+                       'languages': self.languages, 'digests': self.digests}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory=BIOGRAPHY_FEATURES_DIR):
+        """Loads features written by save(), or returns an empty instance if there are none yet."""
+        if not os.path.exists(os.path.join(directory, "meta.json")):
+            return cls()
+        with open(os.path.join(directory, "meta.json"), encoding='utf-8') as f:
+            meta = json.load(f)
+        return cls(meta['artists'], meta['vocabulary'], sparse.load_npz(os.path.join(directory, "counts.npz")),
+                   np.load(os.path.join(directory, "stats.npy")), meta['languages'], meta['digests'])
+
+
+def fetch_biography(artist_name):
+    """Looks an artist up on Artsper and returns their biography ("N/A" if not found)."""
+    from .biography import get_artist_biography, get_artist_profile_link
+
+    try:
+        url = get_artist_profile_link(artist_name)
+        return get_artist_biography(url) if url else "N/A"
+    except Exception as e:
+        print(f"Error fetching the biography of {artist_name}: {e}")
+        return None
+
+
+def update_biography_features(artists, directory=BIOGRAPHY_FEATURES_DIR, fetch=fetch_biography):
+    """
+    Resolves the biographies of artists not cached yet and updates the saved features.
+
+    Args:
+        artists: Iterable of artist names (e.g. the 'artist' column of artwork_data.csv).
+        directory: Cache directory of the features.
+        fetch: Function artist name -> biography text (None on failure: retried next run).
+
+    Returns:
+        The updated BiographyFeatures.
+    """
+    features = BiographyFeatures.load(directory)
+    new = [artist for artist in dict.fromkeys(artists) if isinstance(artist, str) and artist not in features]
+    biographies = {}
+    for artist in new:
+        text = fetch(artist)
+        if text is not None:
+            biographies[artist] = text
+    if features.update(biographies):
+        features.save(directory)
+    return features
+
+
+if __name__ == '__main__':
+    import pandas as pd
+    from ..paths import ARTWORK_CSV
+
+    features = update_biography_features(pd.read_csv(ARTWORK_CSV)['artist'])
+    print(features.frame().head())
+    if len(features):
+        print(features.top_terms(features.artists[0]))
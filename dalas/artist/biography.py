@@ -1,7 +1,6 @@
-import requests
-from bs4 import BeautifulSoup
 import re
 
+
 def get_artist_biography(url: str) -> str:
     """
     Extracts and returns the biography of an artist from an Artsper URL.
@@ -12,8 +11,11 @@ def get_artist_biography(url: str) -> str:
     Returns:
         The artist's biography as a string, or "N/A" if not found.
     """
+    from bs4 import BeautifulSoup
+    from ..scrape.http_client import get_client
+
     # Request the page
-    response = requests.get(url)
+    response = get_client().get(url)
     soup = BeautifulSoup(response.content, "html.parser")
 
     try:
@@ -24,11 +26,6 @@ def get_artist_biography(url: str) -> str:
     return biography
 
 
-import requests
-from bs4 import BeautifulSoup
-import re
-
-
 def get_artist_profile_link(artist_name: str) -> str:
     """
     Searches for an artist on Artsper and returns their profile link.
@@ -39,11 +36,14 @@ def get_artist_profile_link(artist_name: str) -> str:
     Returns:
         The artist's profile link on Artsper, or None if not found.
     """
+    from bs4 import BeautifulSoup
+    from ..scrape.http_client import get_client
+
     # Construct the search URL
     search_url = f"https://www.artsper.com/fr/oeuvres-d-art-contemporain?query={artist_name.replace(' ', '%20')}"
 
     # Request the search page
-    response = requests.get(search_url)
+    response = get_client().get(search_url)
     response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
 
     soup = BeautifulSoup(response.content, "html.parser")
@@ -60,8 +60,9 @@ def get_artist_profile_link(artist_name: str) -> str:
 
 
 
-# Example usage (using the same URL as before):
-Name = 'Sophie Petetin'
-url = get_artist_profile_link(Name)
-biography = get_artist_biography(url)
-print(biography)
\ No newline at end of file
+if __name__ == '__main__':
+    # Example usage (using the same URL as before):
+    Name = 'Sophie Petetin'
+    url = get_artist_profile_link(Name)
+    biography = get_artist_biography(url)
+    print(biography)
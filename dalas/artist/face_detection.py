@@ -0,0 +1,277 @@
+"""
+Face detection cascade for profile pictures.
+
+1. Coarse Haar pass on a small grayscale copy (COARSE_SIDE px), largest
+   faces first: profile pictures usually show one big face, so most images
+   stop after the first scale band. A face found by many overlapping
+   windows (CONFIDENT_NEIGHBORS) ends the search at once.
+2. Only ambiguous images (weak Haar hits, or no hit at all since Haar
+   misses painted and turned faces) go to OpenCV's DNN face detector (ResNet-10
+   SSD, 300x300 input, CPU).
+
+The DNN model (about 10 MB) is read from FACE_MODELS_DIR, downloaded there
+on first use if missing, and only loaded if every file matches its SHA-256
+in DNN_SHA256: a file without a pinned digest is never loaded. Without the
+DNN, the Haar answer is returned, flagged as ambiguous.
+"""
+import hashlib
+import os
+import threading
+from typing import NamedTuple
+
+from ..paths import ARTIST_SAMPLES_DIR, FACE_MODELS_DIR
+
+HAAR_CASCADE = "haarcascade_frontalface_default.xml"
+COARSE_SIDE = 320           # Longest side of the image the Haar pass runs on
+LARGE_FACE = 0.3            # First scale band: faces at least this share of the short side
+HAAR_MIN_NEIGHBORS = 3      # Lenient: weak hits are kept as "ambiguous"
+CONFIDENT_NEIGHBORS = 10    # Overlapping windows that make a Haar hit certain
+DNN_THRESHOLD = 0.5         # SSD confidence of a face
+
+DNN_PROTOTXT = "deploy.prototxt"
+DNN_WEIGHTS = "res10_300x300_ssd_iter_140000.caffemodel"
+DNN_URLS = {
+    DNN_PROTOTXT: "https://raw.githubusercontent.com/opencv/opencv/4.10.0/samples/dnn/face_detector/deploy.prototxt",
+    DNN_WEIGHTS: "https://raw.githubusercontent.com/opencv/opencv_3rdparty/"
+                 "dnn_samples_face_detector_20170830/res10_300x300_ssd_iter_140000.caffemodel",
+}
+# Expected SHA-256 of each model file. A file whose digest differs is deleted
+# and the DNN is not used. None (not pinned): the DNN stage is disabled; pin
+# the digests of a verified copy of the model to enable it.
+DNN_SHA256 = {
+    DNN_PROTOTXT: None,
+    DNN_WEIGHTS: None,
+}
+
+_dnn_lock = threading.Lock()
+_dnn_available = {}     # models_dir -> whether the model is there and verified (once per process)
+
+
+class FaceResult(NamedTuple):
+    """Faces found in an image: boxes (x, y, w, h) in original pixels, their confidences and the deciding stage."""
+    boxes: list
+    confidences: list
+    stage: str          # 'haar' (early exit) or 'dnn'
+    ambiguous: bool     # Haar was unsure and the DNN could not be run
+
+    @property
+    def count(self):
+        return len(self.boxes)
+
+    @property
+    def has_face(self):
+        return bool(self.boxes)
+
+
+def _sha256(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _fetch_model(models_dir, download):
+    """
+    Downloads the missing model files and verifies them all. Nothing is
+    downloaded or loaded unless every file has a pinned digest.
+
+    Returns:
+        True if the model can be loaded.
+    """
+    unpinned = [name for name in DNN_URLS if DNN_SHA256[name] is None]
+    if unpinned:
+        print(f"No SHA-256 pinned for {', '.join(unpinned)} in DNN_SHA256: the DNN face detector is disabled")
+        return False
+    paths = {name: os.path.join(models_dir, name) for name in DNN_URLS}
+    missing = [name for name, path in paths.items() if not os.path.exists(path)]
+    if missing and not download:
+        return False
+    if missing:
+        import requests
+        from ..scrape.http_client import get_client
+
+        os.makedirs(models_dir, exist_ok=True)
+        try:
+            for name in missing:
+                get_client().download(DNN_URLS[name], paths[name])
+        except (requests.exceptions.RequestException, OSError) as e:
+            print(f"Could not download the face detection model: {e}")
+            return False
+    for name, path in paths.items():
+        if _sha256(path) != DNN_SHA256[name]:
+            print(f"Checksum mismatch for {path}, deleting it")
+            os.remove(path)
+            return False
+    return True
+
+
+def load_dnn(models_dir=FACE_MODELS_DIR, download=True):
+    """
+    The DNN face detector, downloading the model on first use.
+
+    The download and the checksums are done once per process: a failed
+    download is not retried by every thread.
+
+    Returns:
+        A cv2.dnn.Net, or None if the model is missing and can't be
+        downloaded, or doesn't match its pinned digests.
+    """
+    import cv2
+
+    with _dnn_lock:
+        available = _dnn_available.get(models_dir)
+        if available is None:
+            available = _fetch_model(models_dir, download)
+            if available or download:
+                _dnn_available[models_dir] = available
+        if not available:
+            return None
+    return cv2.dnn.readNetFromCaffe(os.path.join(models_dir, DNN_PROTOTXT), os.path.join(models_dir, DNN_WEIGHTS))
+
+
+class FaceDetector:
+    """
+    Haar -> DNN cascade (see the module docstring). Holds the loaded models,
+    so create one per thread and reuse it (get_detector() does that).
+
+    Args:
+        escalate_misses: Send images without any Haar hit to the DNN too
+            (catches painted and profile faces; costs a DNN pass per negative).
+        models_dir: Directory of the DNN model.
+        use_dnn: Set False for the Haar pass only.
+    """
+
+    def __init__(self, escalate_misses=True, models_dir=FACE_MODELS_DIR, use_dnn=True):
+        import cv2
+
+        cascade_path = os.path.join(cv2.data.haarcascades, HAAR_CASCADE)
+        if not os.path.exists(cascade_path):
+            raise FileNotFoundError("Haar cascade file not found.  Check your OpenCV installation.")
+        self.cascade = cv2.CascadeClassifier(cascade_path)
+        self.escalate_misses = escalate_misses
+        self.models_dir = models_dir
+        self.use_dnn = use_dnn
+        self._net = None
+        self.stats = {'haar': 0, 'dnn': 0, 'ambiguous': 0}
+
+    @property
+    def net(self):
+        if self._net is None:
+            self._net = (self.use_dnn and load_dnn(self.models_dir)) or False
+        return self._net or None
+
+    def haar(self, image):
+        """
+        Coarse pass: scale bands from large to small faces, stopping at the first confident face.
+
+        Returns:
+            (boxes, neighbor counts) in original pixels.
+        """
+        import cv2
+
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        scale = min(1.0, COARSE_SIDE / max(gray.shape))
+        if scale < 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        gray = cv2.equalizeHist(gray)
+        large = max(24, int(LARGE_FACE * min(gray.shape)))
+        boxes, neighbors = [], []
+        for min_size, max_size in (((large, large), (0, 0)), ((24, 24), (large, large))):
+            found, counts = self.cascade.detectMultiScale2(gray, scaleFactor=1.15, minNeighbors=HAAR_MIN_NEIGHBORS,
+                                                           minSize=min_size, maxSize=max_size)
+            boxes += [tuple(int(round(v / scale)) for v in box) for box in found]
+            neighbors += [int(n) for n in counts]
+            if neighbors and max(neighbors) >= CONFIDENT_NEIGHBORS:
+                break  # Early exit: smaller scales can't change the answer
+        return boxes, neighbors
+
+    def dnn(self, image, net):
+        """DNN pass. Returns (boxes, confidences) in original pixels."""
+        import cv2
+
+        height, width = image.shape[:2]
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        blob = cv2.dnn.blobFromImage(cv2.resize(image, (300, 300)), 1.0, (300, 300), (104.0, 177.0, 123.0))
+        net.setInput(blob)
+        detections = net.forward()[0, 0]
+        boxes, confidences = [], []
+        for _, _, confidence, x1, y1, x2, y2 in detections:
+            if confidence < DNN_THRESHOLD:
+                continue
+            x1, x2 = max(0, int(x1 * width)), min(width, int(x2 * width))
+            y1, y2 = max(0, int(y1 * height)), min(height, int(y2 * height))
+            if x2 > x1 and y2 > y1:
+                boxes.append((x1, y1, x2 - x1, y2 - y1))
+                confidences.append(float(confidence))
+        return boxes, confidences
+
+    def detect(self, image):
+        """
+        Args:
+            image: Path to an image file, or a BGR (or grayscale) array.
+
+        Returns:
+            A FaceResult.
+
+        Raises:
+            FileNotFoundError if the image can't be read, cv2.error.
+        """
+        import cv2
+
+        if isinstance(image, (str, os.PathLike)):
+            path, image = image, cv2.imread(str(image))
+            if image is None:
+                raise FileNotFoundError(f"Could not open or read image file: {path}")
+        boxes, neighbors = self.haar(image)
+        strongest = max(neighbors, default=0)
+        confident = strongest >= CONFIDENT_NEIGHBORS or (not boxes and not self.escalate_misses)
+        net = None if confident else self.net
+        if net is None:
+            self.stats['haar'] += 1
+            self.stats['ambiguous'] += not confident
+            return FaceResult(boxes, [min(1.0, n / CONFIDENT_NEIGHBORS) for n in neighbors], 'haar', not confident)
+        self.stats['dnn'] += 1
+        boxes, confidences = self.dnn(image, net)
+        return FaceResult(boxes, confidences, 'dnn', False)
+
+
+_local = threading.local()
+
+
+def get_detector():
+    """This thread's FaceDetector (models are loaded once per thread)."""
+    if getattr(_local, 'detector', None) is None:
+        _local.detector = FaceDetector()
+    return _local.detector
+
+
+def detect_faces(image_path):
+    """
+    Finds the faces of an image with the cascade.
+
+    Returns:
+        A FaceResult (boxes, confidences, count), or None on error.
+    """
+    import cv2
+
+    try:
+        return get_detector().detect(image_path)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return None
+    except cv2.error as e:
+        print(f"OpenCV error: {e}")
+        return None
+
+
+if __name__ == '__main__':
+    import time
+
+    for name in ('face_img.jpg', 'fake_face.jpeg', 'house.jpeg'):
+        start = time.perf_counter()
+        result = detect_faces(os.path.join(ARTIST_SAMPLES_DIR, '1. ProfilePicture', name))
+        print(f"{name}: {result.count} face(s), stage={result.stage}, ambiguous={result.ambiguous} "
+              f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+    print(get_detector().stats)
@@ -0,0 +1,30 @@
+import os
+
+from ..paths import ARTIST_SAMPLES_DIR
+
+
+def detect_face(image_path):
+    """
+    Detects if a face is present in an image.
+
+    Uses the face_detection cascade: a coarse Haar pass that stops at the
+    first confident face, and OpenCV's DNN detector for ambiguous images
+    only (see face_detection.detect_faces for the boxes and counts).
+
+    Args:
+        image_path: Path to the image file.
+
+    Returns:
+        True if at least one face is detected, False otherwise.
+        Returns None on error.
+    """
+    from .face_detection import detect_faces  # Imports OpenCV: slow to import and only needed here.
+
+    result = detect_faces(image_path)
+    return None if result is None else result.has_face
+
+
+if __name__ == '__main__':
+    print(detect_face(os.path.join(ARTIST_SAMPLES_DIR, '1. ProfilePicture/face_img.jpg')))
+    print(detect_face(os.path.join(ARTIST_SAMPLES_DIR, '1. ProfilePicture/fake_face.jpeg')))
+    print(detect_face(os.path.join(ARTIST_SAMPLES_DIR, '1. ProfilePicture/house.jpeg')))
@@ -0,0 +1,31 @@
+"""Color metrics (2.1) and the feature extraction built on them."""
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'image_warmth': 'warmth',
+    'count_colors': 'colors_count',
+    'percent_colored': 'percent_color',
+    'image_saturation_score': 'saturation',
+    'image_brightness_score': 'brightness',
+    'image_colorfulness': 'colorfulness',
+    'dominant_color_proportions': 'dominant_color',
+    'color_variance': 'variance',
+    'color_gradient_magnitude': 'color_gradients',
+    'color_texture': 'texture',
+    'load_rgb': 'color_features',
+    'extract_color_features': 'color_features',
+    'METRICS': 'color_features',
+    'Moments': 'moments',
+    'pixel_moments': 'color_features',
+    'stratified_sample': 'sampling',
+    'approx_color_metrics': 'sampling',
+    'color_harmony': 'harmony',
+    'ColorIndex': 'color_index',
+    'PixelCache': 'pixel_cache',
+    'iter_features': 'feature_stream',
+    'FeatureResult': 'feature_stream',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
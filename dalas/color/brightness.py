@@ -0,0 +1,43 @@
+import os
+
+from PIL import Image
+import numpy as np
+
+from .color_features import saturation_brightness
+from ..paths import COLOR_SAMPLES_DIR
+
+# Adjust the parameter of target brightness
+# Our aim will be to find the brighteness that yields the most money
+
+def image_brightness_score(image_path, target_brightness=0.65, std_dev=0.25):
+    """
+    Calculates an image brightness score, favoring a specified target brightness.
+
+    Args:
+        image_path: Path to the image file.
+        target_brightness: The ideal brightness level (0.0 to 1.0). Default: 0.5
+        std_dev: Standard deviation for the Gaussian. Larger = more lenient.
+
+    Returns:
+        A float between 0.0 and 100.0. Higher scores are closer to the target.
+        Returns None on error.
+    """
+    try:
+        img = Image.open(image_path).convert("RGB")
+        pixels = np.asarray(img).reshape(-1, 3)
+
+        # --- Average 5. Brightness (HSV value), from the mergeable pixel moments ---
+        _, avg_brightness = saturation_brightness(pixels)
+
+        # --- Gaussian Scoring ---
+        score = 100 * np.exp(-((avg_brightness - target_brightness) ** 2) / (2 * std_dev ** 2))
+        return score
+
+    except Exception as e:
+        print(f"Error processing image: {e}")
+        return None
+
+if __name__ == '__main__':
+    print("Colors  ", image_brightness_score(os.path.join(COLOR_SAMPLES_DIR, '5. Brightness/normal.jpg')))
+    print("Too bright ", image_brightness_score(os.path.join(COLOR_SAMPLES_DIR, '5. Brightness/inc_normal.png')))
+    print("Less bright ", image_brightness_score(os.path.join(COLOR_SAMPLES_DIR, '5. Brightness/dec_normal.png')))
@@ -0,0 +1,202 @@
+import os
+
+from PIL import Image
+import numpy as np
+
+from .fused import fused_moments
+from .moments import Moments
+from ..paths import COLOR_SAMPLES_DIR
+
+# Vectorised versions of the 2.1_Color metrics that work on an already decoded
+# pixel array, so one decode can feed every metric (and the similarity index).
+
+SOBEL_X = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]])
+SOBEL_Y = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]])
+
+PALETTE_LEVELS = 4  # Quantisation levels per channel for the palette histogram (4**3 = 64 bins)
+
+SCALAR_FEATURES = ['warmth', 'colorfulness', 'saturation', 'brightness',
+                   'r_var', 'g_var', 'b_var', 'gradient', 'texture']
+PALETTE_FEATURES = [f'palette_{i}' for i in range(PALETTE_LEVELS ** 3)]
+FEATURE_NAMES = SCALAR_FEATURES + PALETTE_FEATURES
+
+
+def load_rgb(image, max_side=None, use_derivatives=False):
+    """
+    Returns the RGB pixels of an image as a (height, width, 3) uint8 array.
+
+    Args:
+        image: Path to an image file, a PIL image or an existing pixel array.
+        max_side: If given, the image is downscaled so its longest side is at
+                  most max_side (JPEGs are decoded directly at reduced size).
+        use_derivatives: With max_side, start from the image's 'analysis'
+                  derivative when it exists and is large enough (see
+                  analysis.derivatives). It decodes faster, but it is a
+                  re-encoded JPEG: metrics then differ slightly from the
+                  original's, so only use it consistently across a corpus.
+    """
+    if isinstance(image, np.ndarray):
+        return image
+    if isinstance(image, Image.Image):
+        img = image
+    else:
+        if max_side is not None and use_derivatives:
+            from ..analysis.derivatives import derivative_for
+            image = derivative_for(image, max_side) or image
+        img = Image.open(image)
+    if max_side is not None:
+        img.draft("RGB", (max_side, max_side))
+        img = img.convert("RGB")
+        img.thumbnail((max_side, max_side))
+    return np.asarray(img.convert("RGB"))
+
+
+# --- Per-metric kernels (pixels: (N, 3) array) ---
+
+# Channels derived from every pixel in pixel_moments' single pass. 'spread'
+# is max - min of R, G, B and 'colored' flags pixels whose spread exceeds the
+# grayscale tolerance (the test of 2.1.3_percent_color).
+MOMENT_CHANNELS = ['r', 'g', 'b', 'rg', 'yb', 'value', 'saturation', 'spread', 'colored']
+_R, _G, _B, _RG, _YB, _VALUE, _SATURATION, _SPREAD, _COLORED = range(len(MOMENT_CHANNELS))
+GRAYSCALE_TOLERANCE = 10
+
+
+def _moment_channels(chunk, tolerance=GRAYSCALE_TOLERANCE):
+    c = chunk.astype(np.float64)
+    r, g, b = c[:, 0], c[:, 1], c[:, 2]
+    max_c = np.maximum(np.maximum(r, g), b)  # Element-wise: much faster than max(axis=1) over 3 columns
+    spread = max_c - np.minimum(np.minimum(r, g), b)
+    s = np.divide(spread, max_c, out=np.zeros_like(max_c), where=max_c != 0)
+    return np.column_stack([r, g, b, np.abs(r - g), np.abs(0.5 * (r + g) - b), max_c, s, spread,
+                            spread > tolerance])
+
+
+def pixel_moments(pixels, tolerance=GRAYSCALE_TOLERANCE):
+    """
+    Moments of the MOMENT_CHANNELS of an (N, 3) pixel array, from one pass.
+    Warmth, colorfulness, saturation, brightness, channel variance and the
+    colored share are all read from it (pass it as `moments` to compute several).
+
+    With numba installed, uint8 pixels go through the fused parallel kernel
+    (fused.py); otherwise through a chunked NumPy pass.
+    """
+    moments = fused_moments(pixels, tolerance)
+    if moments is None:
+        moments = Moments.of(pixels, transform=lambda chunk: _moment_channels(chunk, tolerance))
+    return moments
+
+
+def warmth(pixels, moments=None):
+    """Warmth score from 0 (coolest) to 100 (warmest), as in 2.1.1_image_warmth."""
+    m = moments or pixel_moments(pixels)
+    # mean((r - (g + b) / 2) - (b - (r + g) / 2)) == 1.5 * (mean(r) - mean(b))
+    score = 1.5 * (m.mean[_R] - m.mean[_B]) / 255
+    return float(np.clip((score + 1.0) * 50.0, 0.0, 100.0))
+
+
+def colorfulness(pixels, moments=None):
+    """Hasler and Süsstrunk colorfulness, as in 2.1.6_colorfulness."""
+    m = moments or pixel_moments(pixels)
+    variance = m.variance
+    std_root = np.sqrt(variance[_RG] + variance[_YB])
+    mean_root = np.sqrt(m.mean[_RG] ** 2 + m.mean[_YB] ** 2)
+    return float(std_root + 0.3 * mean_root)
+
+
+def saturation_brightness(pixels, moments=None):
+    """Mean HSV saturation and value (0.0-1.0), as used by 2.1.4 / 2.1.5."""
+    m = moments or pixel_moments(pixels)
+    return float(m.mean[_SATURATION]), float(m.mean[_VALUE] / 255.0)
+
+
+def channel_variance(pixels, moments=None):
+    """Variance of the R, G and B channels, as in 2.1.8_color_variance."""
+    if moments is None:
+        return tuple(float(v) for v in Moments.of(pixels).variance)
+    return tuple(float(v) for v in moments.variance[[_R, _G, _B]])
+
+
+def percent_colored(pixels, moments=None, tolerance=GRAYSCALE_TOLERANCE):
+    """Share (0-100) of pixels whose R, G and B differ by more than tolerance, as meant by 2.1.3."""
+    m = moments or pixel_moments(pixels, tolerance)
+    return float(m.mean[_COLORED] * 100.0)
+
+
+def gradient_stats(rgb):
+    """
+    Mean gradient magnitude (2.1.9_color_gradients) and color texture
+    (2.1.10_color_texture) from one set of Sobel convolutions.
+
+    Args:
+        rgb: (height, width, 3) pixel array.
+    """
+    from scipy.signal import convolve2d  # Imported on first use: scipy.signal is slow to import
+
+    magnitudes = np.zeros(rgb.shape[:2])
+    for channel in range(3):
+        channel_data = rgb[:, :, channel].astype(np.float64)
+        gradient_x = convolve2d(channel_data, SOBEL_X, mode='same', boundary='symm')
+        gradient_y = convolve2d(channel_data, SOBEL_Y, mode='same', boundary='symm')
+        magnitudes += np.sqrt(gradient_x ** 2 + gradient_y ** 2)
+    magnitudes /= 3.0
+    m = Moments.of(magnitudes.reshape(-1))
+    return float(m.mean[0]), float(m.std[0])
+
+
+def palette_histogram(pixels, levels=PALETTE_LEVELS):
+    """Normalised coarse RGB histogram (levels**3 bins) describing the palette."""
+    q = (pixels.astype(np.uint16) * levels) >> 8
+    bins = (q[:, 0] * levels + q[:, 1]) * levels + q[:, 2]
+    return np.bincount(bins, minlength=levels ** 3) / len(pixels)
+
+
+# Metrics usable by name in batch / streaming extraction. Each takes a
+# (height, width, 3) RGB array and returns a float or a tuple of floats.
+METRICS = {
+    'warmth': lambda rgb: warmth(rgb.reshape(-1, 3)),
+    'colorfulness': lambda rgb: colorfulness(rgb.reshape(-1, 3)),
+    'saturation': lambda rgb: saturation_brightness(rgb.reshape(-1, 3))[0],
+    'brightness': lambda rgb: saturation_brightness(rgb.reshape(-1, 3))[1],
+    'color_variance': lambda rgb: channel_variance(rgb.reshape(-1, 3)),
+    'percent_colored': lambda rgb: percent_colored(rgb.reshape(-1, 3)),
+    'gradient': lambda rgb: gradient_stats(rgb)[0],
+    'texture': lambda rgb: gradient_stats(rgb)[1],
+}
+
+
+def extract_color_features(image, max_side=512, cache=None):
+    """
+    Computes the color feature vector of an image from a single decode.
+
+    Args:
+        image: Path, PIL image or RGB pixel array.
+        max_side: Longest side the image is reduced to before analysis, so
+                  features are comparable across resolutions. None = full size.
+        cache: Optional PixelCache; paths are then read from its memmapped
+               rasters instead of being decoded (the cache's max_side applies).
+
+    Returns:
+        A float64 array ordered as FEATURE_NAMES, or None on error.
+    """
+    try:
+        if cache is not None and isinstance(image, (str, os.PathLike)):
+            rgb = cache.get(image)
+        else:
+            rgb = load_rgb(image, max_side)
+        pixels = rgb.reshape(-1, 3)
+        moments = pixel_moments(pixels)
+        saturation, brightness = saturation_brightness(pixels, moments)
+        gradient, texture = gradient_stats(rgb)
+        scalars = [warmth(pixels, moments), colorfulness(pixels, moments), saturation, brightness,
+                   *channel_variance(pixels, moments), gradient, texture]
+        return np.concatenate([scalars, palette_histogram(pixels)])
+    except Exception as e:
+        print(f"Error processing image: {e}")
+        return None
+
+
+if __name__ == '__main__':
+    features = extract_color_features(os.path.join(COLOR_SAMPLES_DIR, 'original.jpg'))
+    if features is not None:
+        for name, value in zip(SCALAR_FEATURES, features):
+            print(f"{name}: {value:.3f}")
@@ -1,6 +1,5 @@
 from PIL import Image
 import numpy as np
-from scipy.signal import convolve2d
 
 def color_gradient_magnitude(image_path):
     """
@@ -14,6 +13,8 @@ def color_gradient_magnitude(image_path):
         A float representing the average gradient magnitude. Higher
         values indicate stronger color edges.  Returns None on error.
     """
+    from scipy.signal import convolve2d  # Imported on first use: scipy.signal is slow to import
+
     try:
         img = Image.open(image_path).convert("RGB")
         pixels = np.array(img).astype(np.float64)  # Use float64 for calculations
@@ -42,4 +43,4 @@ def color_gradient_magnitude(image_path):
 
     except Exception as e:
         print(f"Error processing image: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,237 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .color_features import extract_color_features, FEATURE_NAMES, SCALAR_FEATURES
+from ..paths import ARTWORK_CSV, PAINTINGS_DIR
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+
+def _kmeans(vectors, n_clusters, n_iter=15, seed=0):
+    """Plain Lloyd's k-means in NumPy. Returns the (n_clusters, dim) centroids."""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)].copy()
+    for _ in range(n_iter):
+        labels = _nearest(vectors, centroids)
+        for c in range(n_clusters):
+            members = vectors[labels == c]
+            if len(members):
+                centroids[c] = members.mean(axis=0)
+    return centroids
+
+
+def _sq_distances(a, b):
+    """Squared euclidean distances between the rows of a and b, (len(a), len(b))."""
+    d = (a ** 2).sum(axis=1)[:, None] - 2 * a @ b.T + (b ** 2).sum(axis=1)[None, :]
+    return np.maximum(d, 0)
+
+
+def _nearest(vectors, centroids, chunk=4096):
+    """Index of the closest centroid for each vector, computed in chunks."""
+    return np.concatenate([_sq_distances(vectors[i:i + chunk], centroids).argmin(axis=1)
+                           for i in range(0, len(vectors), chunk)]) if len(vectors) else np.zeros(0, int)
+
+
+class ColorIndex:
+    """
+    Nearest-neighbour index over color feature vectors (see color_features.py).
+
+    IVF layout: vectors are standardised, split into n_lists k-means cells and
+    a query only scans the nprobe closest cells. Inserts are incremental (new
+    vectors go into their closest existing cell); below brute_force_below
+    vectors a single cell is used, which is an exact search.
+
+    Standardisation gives the scalar block (warmth, colorfulness, texture...)
+    and the palette histogram block the same total weight.
+    """
+
+    def __init__(self, dim=len(FEATURE_NAMES), n_scalar=len(SCALAR_FEATURES)):
+        self.dim = dim
+        self.n_scalar = n_scalar
+        self.keys = []
+        self._vectors = np.zeros((0, dim))
+        self._assignments = np.zeros(0, dtype=np.int64)
+        self.size = 0
+        self.mean = np.zeros(dim)
+        self.scale = np.ones(dim)
+        self.centroids = np.zeros((1, dim))
+        self._lists = None  # Cached per-cell id arrays, rebuilt after inserts
+
+    # --- Building ---
+
+    def _transform(self, features):
+        return (np.atleast_2d(features) - self.mean) / self.scale
+
+    def train(self, features, n_lists=None, brute_force_below=2048):
+        """
+        Fits standardisation and IVF cells on a sample of raw feature vectors.
+        Vectors already added are moved to the new standardised space and
+        reassigned, so train() can be called again as the collection grows.
+
+        Args:
+            features: (n, dim) raw feature array.
+            n_lists: Number of cells. Default: about sqrt(n).
+            brute_force_below: Use a single (exact) cell for smaller samples.
+        """
+        features = np.atleast_2d(np.asarray(features, dtype=np.float64))
+        std = features.std(axis=0)
+        std[std == 0] = 1.0
+        block_weight = np.ones(self.dim)
+        n_palette = self.dim - self.n_scalar
+        if n_palette:
+            block_weight[self.n_scalar:] = np.sqrt(n_palette / self.n_scalar)
+        if self.size:  # Stored vectors are standardised: back to raw with the old parameters
+            raw = self._vectors[:self.size] * self.scale + self.mean
+        self.mean = features.mean(axis=0)
+        self.scale = std * block_weight
+        if self.size:
+            self._vectors[:self.size] = self._transform(raw)
+
+        if n_lists is None:
+            n_lists = 1 if len(features) < brute_force_below else int(np.sqrt(len(features)))
+        vectors = self._transform(features)
+        self.centroids = vectors.mean(axis=0, keepdims=True) if n_lists <= 1 else _kmeans(vectors, n_lists)
+        if self.size:
+            self._assignments = _nearest(self._vectors[:self.size], self.centroids)
+        self._lists = None
+
+    def add(self, keys, features):
+        """
+        Inserts vectors (raw features) under the given keys, e.g. image filenames.
+        """
+        features = np.atleast_2d(np.asarray(features, dtype=np.float64))
+        if isinstance(keys, str):
+            keys = [keys]
+        vectors = self._transform(features)
+        needed = self.size + len(vectors)
+        if needed > len(self._vectors):  # Amortised growth for cheap incremental inserts
+            capacity = max(needed, 2 * len(self._vectors), 1024)
+            grown = np.zeros((capacity, self.dim))
+            grown[:self.size] = self._vectors[:self.size]
+            self._vectors = grown
+        self._vectors[self.size:needed] = vectors
+        self._assignments = np.concatenate([self._assignments, _nearest(vectors, self.centroids)])
+        self.keys.extend(keys)
+        self.size = needed
+        self._lists = None
+
+    def _cell_lists(self):
+        if self._lists is None:
+            order = np.argsort(self._assignments, kind='stable')
+            bounds = np.searchsorted(self._assignments[order], np.arange(len(self.centroids) + 1))
+            self._lists = [order[bounds[c]:bounds[c + 1]] for c in range(len(self.centroids))]
+        return self._lists
+
+    # --- Queries ---
+
+    def search(self, features, k=20, nprobe=8):
+        """
+        Batched k-nearest-neighbour search.
+
+        Args:
+            features: (n_queries, dim) raw feature array (or a single vector).
+            k: Number of neighbours per query.
+            nprobe: Number of IVF cells scanned per query.
+
+        Returns:
+            (distances, ids): two (n_queries, k) arrays, closest first. Missing
+            neighbours are padded with inf / -1. keys[id] gives the key.
+        """
+        queries = self._transform(features)
+        lists = self._cell_lists()
+        nprobe = min(nprobe, len(self.centroids))
+        probes = np.argsort(_sq_distances(queries, self.centroids), axis=1)[:, :nprobe]
+
+        distances = np.full((len(queries), k), np.inf)
+        ids = np.full((len(queries), k), -1, dtype=np.int64)
+        vectors = self._vectors[:self.size]
+        for q, cells in enumerate(probes):
+            candidates = np.concatenate([lists[c] for c in cells])
+            if not len(candidates):
+                continue
+            d = _sq_distances(queries[q:q + 1], vectors[candidates])[0]
+            top = np.argpartition(d, k - 1)[:k] if len(d) > k else np.arange(len(d))
+            top = top[np.argsort(d[top])]
+            distances[q, :len(top)] = np.sqrt(d[top])
+            ids[q, :len(top)] = candidates[top]
+        return distances, ids
+
+    def search_key(self, key, k=20, nprobe=8):
+        """Neighbours of an already indexed item, excluding the item itself."""
+        i = self.keys.index(key)
+        raw = self._vectors[i] * self.scale + self.mean
+        distances, ids = self.search(raw, k + 1, nprobe)
+        keep = ids[0] != i
+        return distances[0][keep][:k], ids[0][keep][:k]
+
+    # --- Persistence ---
+
+    def save(self, path):
+        """Saves the index to a single .npz file."""
+        np.savez(path, vectors=self._vectors[:self.size], assignments=self._assignments,
+                 keys=np.array(self.keys, dtype=object), mean=self.mean, scale=self.scale,
+                 centroids=self.centroids, n_scalar=self.n_scalar)
+
+    @classmethod
+    def load(cls, path):
+        """Loads an index written by save()."""
+        data = np.load(path, allow_pickle=True)
+        index = cls(dim=data['vectors'].shape[1], n_scalar=int(data['n_scalar']))
+        index._vectors = data['vectors']
+        index._assignments = data['assignments']
+        index.size = len(index._vectors)
+        index.keys = list(data['keys'])
+        index.mean, index.scale, index.centroids = data['mean'], data['scale'], data['centroids']
+        return index
+
+
+def build_index(image_dir=PAINTINGS_DIR, max_side=512, cache=None):
+    """
+    Extracts color features for every image of a directory and indexes them
+    by filename. An optional PixelCache skips decoding on repeated builds.
+
+    Returns:
+        A ColorIndex.
+    """
+    keys, features = [], []
+    for name in sorted(os.listdir(image_dir)):
+        if name.lower().endswith(IMAGE_EXTENSIONS):
+            vector = extract_color_features(os.path.join(image_dir, name), max_side, cache)
+            if vector is not None:
+                keys.append(name)
+                features.append(vector)
+    index = ColorIndex()
+    if features:
+        index.train(features)
+        index.add(keys, features)
+    return index
+
+
+def similar_artworks(index, image_filename, artwork_csv=ARTWORK_CSV, k=20):
+    """
+    Finds the k artworks closest in palette and texture to an indexed one and
+    joins them with their scraped metadata.
+
+    Args:
+        index: A ColorIndex keyed by image filename.
+        image_filename: The image_filename of the reference artwork.
+        artwork_csv: Path to artwork_data.csv.
+        k: Number of similar artworks.
+
+    Returns:
+        A DataFrame (image_filename, distance, title, artist, price), closest first.
+    """
+    distances, ids = index.search_key(image_filename, k)
+    result = pd.DataFrame({'image_filename': [index.keys[i] for i in ids], 'distance': distances})
+    artworks = pd.read_csv(artwork_csv).drop_duplicates('image_filename')
+    return result.merge(artworks[['image_filename', 'title', 'artist', 'price']],
+                        on='image_filename', how='left')
+
+
+if __name__ == '__main__':
+    # Example usage: index the scraped paintings and show the closest works to one of them.
+    color_index = build_index(PAINTINGS_DIR)
+    color_index.save('color_index.npz')
+    print(similar_artworks(color_index, 'Evasion_Nadia Zouari_2025.jpg', k=10))
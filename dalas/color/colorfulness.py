@@ -0,0 +1,50 @@
+from PIL import Image
+import numpy as np
+
+from .moments import Moments
+from .sampling import stratified_sample
+
+
+def _opponent_channels(chunk):
+    """rg and yb of a chunk of pixels (as defined in the paper), in float64: no uint8 wrap-around."""
+    c = chunk.astype(np.float64)
+    r, g, b = c[:, 0], c[:, 1], c[:, 2]
+    return np.column_stack([np.abs(r - g), np.abs(0.5 * (r + g) - b)])
+
+def image_colorfulness(image_path, approx=False):
+    """
+    Calculates the colorfulness of an image using the Hasler and
+    Süsstrunk method. Measure of the intensity and vibrancy of colors in an image.
+
+    Args:
+        image_path: Path to the image file.
+        approx: Estimate it from a stratified pixel sample and return a
+                sampling.Estimate with its 95% confidence interval.
+
+    Returns:
+        A float representing the colorfulness. Higher values indicate
+        more colorful images. Returns None on error.
+    """
+    try:
+        img = Image.open(image_path).convert("RGB")
+        if approx:
+            return stratified_sample(np.asarray(img)).estimate(_colorfulness)
+        return _colorfulness(np.array(img).reshape(-1, 3))
+
+    except Exception as e:
+        print(f"Error processing image: {e}")
+        return None
+
+
+def _colorfulness(pixels):
+    """Colorfulness of an (N, 3) RGB pixel array."""
+    # Mean and standard deviation of rg and yb, in one pass
+    moments = Moments.of(pixels, transform=_opponent_channels)
+    (rg_mean, yb_mean), (rg_std, yb_std) = moments.mean, moments.std
+
+    # Combine the mean and standard deviation
+    std_root = np.sqrt((rg_std ** 2) + (yb_std ** 2))
+    mean_root = np.sqrt((rg_mean ** 2) + (yb_mean ** 2))
+
+    colorfulness = std_root + (0.3 * mean_root)
+    return colorfulness
@@ -1,6 +1,10 @@
+import os
+
 from PIL import Image
 import numpy as np
 
+from ..paths import COLOR_SAMPLES_DIR
+
 def count_colors(image_path):
     """
     Efficiently counts the number of unique colors in an image.
@@ -19,6 +23,7 @@ def count_colors(image_path):
         print(f"Error: {e}")  # Log the specific error
         return -1
 
-print(count_colors('Color/2. Count/blue.jpg'))
-print(count_colors('Color/2. Count/monochrome_blue.png'))
-print(count_colors('Color/original.jpg'))
\ No newline at end of file
+if __name__ == '__main__':
+    print(count_colors(os.path.join(COLOR_SAMPLES_DIR, '2. Count/blue.jpg')))
+    print(count_colors(os.path.join(COLOR_SAMPLES_DIR, '2. Count/monochrome_blue.png')))
+    print(count_colors(os.path.join(COLOR_SAMPLES_DIR, 'original.jpg')))
@@ -1,15 +1,20 @@
 from PIL import Image
 import numpy as np
 from collections import Counter
-# ... (other functions: rgb_to_hsv, hue_distance, etc. - from harmony code) ...
 
-def dominant_color_proportions(image_path, num_dominant_colors=5):
+from .sampling import stratified_sample
+# rgb_to_hsv, hue_distance and the harmony scoring live in harmony.py
+
+def dominant_color_proportions(image_path, num_dominant_colors=5, approx=False):
     """
     Calculates the proportions of the image occupied by the dominant colors.
 
     Args:
         image_path: Path to the image file.
         num_dominant_colors: The number of dominant colors to consider.
+        approx: Find the colors in a stratified pixel sample and estimate
+                their proportions: the values are then sampling.Estimate
+                tuples with 95% confidence intervals.
 
     Returns:
         A dictionary where keys are RGB tuples (representing the
@@ -19,6 +24,8 @@ def dominant_color_proportions(image_path, num_dominant_colors=5):
     """
     try:
         img = Image.open(image_path).convert("RGB")
+        if approx:
+            return _approx_proportions(np.asarray(img), num_dominant_colors)
         pixels = np.array(img).reshape(-1, 3)
 
         counts = Counter(map(tuple, pixels))  # 2. Count occurrences of each unique color
@@ -37,9 +44,29 @@ def dominant_color_proportions(image_path, num_dominant_colors=5):
         return None
 
 
+def _color_keys(pixels):
+    """One integer per RGB color (0xRRGGBB)."""
+    return pixels.astype(np.uint32) @ np.array([1 << 16, 1 << 8, 1], dtype=np.uint32)
+
+
+def _approx_proportions(rgb, num_dominant_colors):
+    """The most frequent colors of a stratified sample, with estimated proportions."""
+    sample = stratified_sample(rgb)
+    colors, counts = np.unique(_color_keys(sample.pixels), return_counts=True)
+    dominant = colors[np.argsort(-counts, kind='stable')[:num_dominant_colors]]
+
+    def proportions(pixels):
+        return (_color_keys(pixels)[:, None] == dominant).mean(axis=0)
+
+    estimates = sample.estimate(proportions)
+    return {(int(key >> 16), int(key >> 8 & 255), int(key & 255)):
+            estimate._replace(low=max(0.0, estimate.low), high=min(1.0, estimate.high))
+            for key, estimate in zip(dominant, estimates)}
+
+
 if __name__ == '__main__':
     image_path = "your_image.jpg"  # Replace with your image
     proportions = dominant_color_proportions(image_path)
     if proportions:
         for color, prop in proportions.items():
-            print(f"Color: {color}, Proportion: {prop:.4f}")
\ No newline at end of file
+            print(f"Color: {color}, Proportion: {prop:.4f}")
@@ -0,0 +1,196 @@
+import csv
+import os
+import queue
+import threading
+from typing import NamedTuple, Optional
+
+from .color_features import load_rgb, METRICS as COLOR_METRICS
+from .harmony import HARMONY_METRICS
+from .sampling import APPROX_METRICS, Estimate, stratified_sample
+from ..composition.layout import COMPOSITION_METRICS
+from ..paths import PAINTINGS_DIR
+
+# Every metric the extractor can compute by name: RGB array -> float or tuple.
+METRICS = {**COLOR_METRICS, **HARMONY_METRICS, **COMPOSITION_METRICS}
+
+_DONE = object()  # Sentinel closing the prefetch queue
+
+
+class FeatureResult(NamedTuple):
+    """One image's metrics. Failures are reported as values, never printed."""
+    path: str
+    values: dict  # metric name -> float or tuple (only successful metrics)
+    errors: dict  # metric name (or 'decode') -> error message
+    shape: Optional[tuple] = None  # (height, width) of the analysed raster
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+def _put(out_queue, item, stop):
+    """Blocking put that gives up once the consumer has stopped. Returns False then."""
+    while not stop.is_set():
+        try:
+            out_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _prefetch(paths, out_queue, stop, max_side, cache, use_derivatives=False):
+    """Background thread: decodes the next images while the consumer computes."""
+    try:
+        for path in paths:
+            try:
+                if cache is not None:
+                    item = (path, cache.get(path), None)
+                else:
+                    item = (path, load_rgb(path, max_side, use_derivatives), None)
+            except Exception as e:
+                item = (path, None, f"{type(e).__name__}: {e}")
+            if not _put(out_queue, item, stop):
+                return
+    except Exception as e:  # The paths iterable itself failed
+        _put(out_queue, (None, None, f"{type(e).__name__}: {e}"), stop)
+    finally:
+        _put(out_queue, _DONE, stop)
+
+
+def resolve_metrics(metrics):
+    """Validates metric names (None = every metric) and returns them as a list."""
+    metrics = list(METRICS) if metrics is None else list(metrics)
+    unknown = [name for name in metrics if name not in METRICS]
+    if unknown:
+        raise ValueError(f"Unknown metrics: {unknown}. Available: {list(METRICS)}")
+    return metrics
+
+
+def compute_metrics(path, rgb, metrics, approx=False):
+    """
+    Runs the named metrics on one decoded image and wraps them in a FeatureResult.
+
+    With approx=True, the metrics of sampling.APPROX_METRICS are estimated
+    from one stratified pixel sample (values are then sampling.Estimate);
+    the others are computed exactly.
+    """
+    values, errors = {}, {}
+    sample = None
+    for name in metrics:
+        try:
+            if approx and name in APPROX_METRICS:
+                if sample is None:
+                    sample = stratified_sample(rgb)
+                values[name] = APPROX_METRICS[name](sample)
+            else:
+                values[name] = METRICS[name](rgb)
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+    return FeatureResult(path, values, errors, rgb.shape[:2])
+
+
+def iter_features(paths, metrics=None, chunk_size=4, max_side=None, cache=None, approx=False,
+                  use_derivatives=False):
+    """
+    Lazily computes metrics over an iterable of image paths.
+
+    Images are decoded on a background thread (PIL releases the GIL while
+    decoding) at most chunk_size images ahead, so memory stays flat however
+    long `paths` is, and decoding overlaps with metric computation.
+
+    Args:
+        paths: Any iterable of image paths (consumed lazily, e.g. a generator).
+        metrics: Metric names from METRICS (color, harmony and composition). Default: all.
+        chunk_size: Maximum number of decoded images waiting in memory.
+        max_side: Downscale images to this longest side before analysis.
+        cache: Optional PixelCache to read memmapped rasters from.
+        approx: Estimate the global color metrics from a pixel sample (see compute_metrics).
+        use_derivatives: Decode the images' analysis derivatives when they exist (see load_rgb).
+
+    Yields:
+        A FeatureResult per image, in input order.
+    """
+    metrics = resolve_metrics(metrics)
+    decoded = queue.Queue(maxsize=max(1, chunk_size))
+    stop = threading.Event()
+    worker = threading.Thread(target=_prefetch, args=(iter(paths), decoded, stop, max_side, cache, use_derivatives),
+                              daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = decoded.get()
+            if item is _DONE:
+                break
+            path, rgb, error = item
+            if rgb is None:
+                yield FeatureResult(path, {}, {'decode': error})
+                continue
+            yield compute_metrics(path, rgb, metrics, approx)
+    finally:
+        stop.set()  # Lets the thread exit if the consumer stops early
+
+
+def write_features_csv(paths, output_csv="color_features.csv", metrics=None, **kwargs):
+    """
+    Streams iter_features() results into a CSV file, one row per image.
+
+    Returns:
+        (n_rows, n_errors).
+    """
+    metrics = resolve_metrics(metrics)
+    return write_results_csv(iter_features(paths, metrics, **kwargs), output_csv, metrics)
+
+
+def _columns(name, value):
+    """CSV columns of one metric value."""
+    if isinstance(value, Estimate):
+        return {name: value.value, f"{name}_low": value.low, f"{name}_high": value.high}
+    if isinstance(value, tuple):
+        return {column: v for i, item in enumerate(value) for column, v in _columns(f"{name}_{i}", item).items()}
+    return {name: value}
+
+
+def write_results_csv(results, output_csv, metrics):
+    """
+    Writes an iterable of FeatureResult to a CSV file as they arrive.
+
+    Tuple-valued metrics are expanded into name_0, name_1, ... columns,
+    estimates into name, name_low and name_high columns, and errors are
+    written to an 'error' column.
+
+    Returns:
+        (n_rows, n_errors).
+    """
+    n_rows = n_errors = 0
+    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = None
+        pending = []  # Rows seen before the first fully successful one fixes the columns
+
+        def flush(fieldnames):
+            nonlocal writer
+            if writer is None:
+                writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore', restval='')
+                writer.writeheader()
+            writer.writerows(pending)
+            pending.clear()
+
+        for result in results:
+            row = {'path': result.path}
+            for name in metrics:
+                row.update(_columns(name, result.values.get(name)))
+            row['error'] = "; ".join(f"{k}: {v}" for k, v in result.errors.items())
+            pending.append(row)
+            if writer is not None or result.ok:
+                flush(list(row))
+            n_rows += 1
+            n_errors += not result.ok
+        if pending:
+            flush(list(dict.fromkeys(key for row in pending for key in row)))
+    return n_rows, n_errors
+
+
+if __name__ == '__main__':
+    image_paths = (os.path.join(PAINTINGS_DIR, name) for name in sorted(os.listdir(PAINTINGS_DIR)))
+    for result in iter_features(image_paths, metrics=['warmth', 'colorfulness', 'brightness'], max_side=512):
+        print(os.path.basename(result.path), result.values if result.ok else result.errors)
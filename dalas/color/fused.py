@@ -0,0 +1,123 @@
+"""
+Fused per-pixel statistics kernel.
+
+One walk over the uint8 RGB buffer accumulates, per block of pixels, the sum
+and sum of squares of every channel color_features.pixel_moments needs, in
+registers: no float copy of the image, no per-channel temporaries. Blocks
+run in parallel (numba prange) and are combined into a Moments.
+
+numba is optional: without it (or if compilation fails) pixel_moments keeps
+using the chunked NumPy path, which gives the same results.
+"""
+import numpy as np
+
+from .moments import Moments
+
+BLOCK_PIXELS = 4096   # Pixels per parallel block
+N_CHANNELS = 9        # r, g, b, rg, yb, value, saturation, spread, colored (see color_features.MOMENT_CHANNELS)
+
+_kernel = None  # None: not tried yet, False: numba unavailable or the kernel failed to compile
+
+
+def _compile(numba):
+    @numba.njit(parallel=True, cache=True)
+    def block_sums(pixels, tolerance, sums, squares):
+        n = pixels.shape[0]
+        for block in numba.prange(sums.shape[0]):
+            s_r = s_g = s_b = s_rg = s_yb = s_v = s_s = s_sp = s_c = 0.0
+            q_r = q_g = q_b = q_rg = q_yb = q_v = q_s = q_sp = 0.0
+            for i in range(block * BLOCK_PIXELS, min(n, (block + 1) * BLOCK_PIXELS)):
+                r = float(pixels[i, 0])
+                g = float(pixels[i, 1])
+                b = float(pixels[i, 2])
+                rg = abs(r - g)
+                yb = abs(0.5 * (r + g) - b)
+                v = max(r, g, b)
+                spread = v - min(r, g, b)
+                s = spread / v if v != 0 else 0.0
+                s_r += r
+                q_r += r * r
+                s_g += g
+                q_g += g * g
+                s_b += b
+                q_b += b * b
+                s_rg += rg
+                q_rg += rg * rg
+                s_yb += yb
+                q_yb += yb * yb
+                s_v += v
+                q_v += v * v
+                s_s += s
+                q_s += s * s
+                s_sp += spread
+                q_sp += spread * spread
+                if spread > tolerance:
+                    s_c += 1.0  # Indicator: its square is itself
+            sums[block, 0] = s_r
+            sums[block, 1] = s_g
+            sums[block, 2] = s_b
+            sums[block, 3] = s_rg
+            sums[block, 4] = s_yb
+            sums[block, 5] = s_v
+            sums[block, 6] = s_s
+            sums[block, 7] = s_sp
+            sums[block, 8] = s_c
+            squares[block, 0] = q_r
+            squares[block, 1] = q_g
+            squares[block, 2] = q_b
+            squares[block, 3] = q_rg
+            squares[block, 4] = q_yb
+            squares[block, 5] = q_v
+            squares[block, 6] = q_s
+            squares[block, 7] = q_sp
+            squares[block, 8] = s_c
+
+    return block_sums
+
+
+def get_kernel():
+    """The kernel (compiled lazily by numba on its first call), or None if numba is unavailable."""
+    global _kernel
+    if _kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _kernel = False
+        else:
+            _kernel = _compile(numba)
+    return _kernel or None
+
+
+def fused_moments(pixels, tolerance):
+    """
+    Moments of the N_CHANNELS channels of an (N, 3) uint8 pixel array in
+    one pass, or None if numba is unavailable or the input isn't uint8.
+
+    Per block, M2 = sum of squares - sum**2 / n is exact enough: the values
+    are bounded by 255 and a block has at most BLOCK_PIXELS pixels. Blocks
+    are then combined with the parallel Welford formula.
+    """
+    global _kernel
+    kernel = get_kernel()
+    if kernel is None or pixels.dtype != np.uint8 or len(pixels) == 0:
+        return None
+    pixels = np.ascontiguousarray(pixels)
+    n_blocks = -(-len(pixels) // BLOCK_PIXELS)
+    sums = np.empty((n_blocks, N_CHANNELS))
+    squares = np.empty((n_blocks, N_CHANNELS))
+    try:
+        kernel(pixels, float(tolerance), sums, squares)
+    except Exception as e:  # numba compiles on the first call: typing / LLVM errors surface here
+        _kernel = False
+        print(f"numba kernel unavailable, using the NumPy pass: {type(e).__name__}: {e}")
+        return None
+
+    counts = np.full(n_blocks, BLOCK_PIXELS, dtype=np.float64)
+    counts[-1] = len(pixels) - BLOCK_PIXELS * (n_blocks - 1)
+    block_means = sums / counts[:, None]
+    block_m2 = np.maximum(squares - sums * block_means, 0.0)
+    moments = Moments(N_CHANNELS)
+    moments.count = len(pixels)
+    moments.mean = sums.sum(axis=0) / len(pixels)
+    moments.m2 = block_m2.sum(axis=0) + (counts[:, None] * (block_means - moments.mean) ** 2).sum(axis=0)
+    return moments
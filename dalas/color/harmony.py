@@ -0,0 +1,161 @@
+import numpy as np
+
+from .color_features import load_rgb
+
+HUE_BINS = 360          # 1 degree per bin
+MIN_HUE_MASS = 0.01     # Mean saturation * value below which an image has no meaningful hue
+TIE_TOLERANCE = 1e-3    # Scores closer than this don't single out a best template
+
+# Harmony templates as hue sectors (centre offset in degrees, width in degrees),
+# relative to a free rotation found by the circular cross-correlation.
+TEMPLATES = {
+    'complementary': [(0, 30), (180, 30)],
+    'analogous': [(0, 60)],
+    'triadic': [(0, 30), (120, 30), (240, 30)],
+    'split_complementary': [(0, 30), (150, 30), (210, 30)],
+}
+
+
+def rgb_to_hsv(pixels):
+    """
+    Vectorised RGB -> HSV conversion.
+
+    Args:
+        pixels: (N, 3) uint8 array.
+
+    Returns:
+        (h, s, v) float arrays: hue in degrees [0, 360), saturation and value in [0, 1].
+    """
+    rgb = pixels.astype(np.float32) / 255.0
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    max_c = rgb.max(axis=1)
+    diff = max_c - rgb.min(axis=1)
+    safe = np.where(diff == 0, 1, diff)
+
+    h = np.where(max_c == r, (g - b) / safe,
+                 np.where(max_c == g, (b - r) / safe + 2, (r - g) / safe + 4))
+    h = np.where(diff == 0, 0, (h * 60) % 360)
+    s = np.divide(diff, max_c, out=np.zeros_like(max_c), where=max_c != 0)
+    return h, s, max_c
+
+
+def hue_distance(h1, h2):
+    """Circular distance between hues in degrees (0 to 180)."""
+    d = np.abs(np.asarray(h1) - np.asarray(h2)) % 360
+    return np.minimum(d, 360 - d)
+
+
+def hue_histogram(pixels, bins=HUE_BINS, min_saturation=0.1, min_value=0.1, normalize=True):
+    """
+    Circular hue histogram weighted by saturation * value, in one bincount pass.
+
+    Near-gray and near-black pixels carry almost no hue and are left out.
+
+    Args:
+        normalize: Scale the histogram to sum to 1. Otherwise it sums to the
+            hue mass of the image (total saturation * value weight).
+
+    Returns:
+        A (bins,) float array summing to 1 (all zeros for a grayscale image).
+    """
+    h, s, v = rgb_to_hsv(pixels)
+    weights = s * v
+    weights[(s < min_saturation) | (v < min_value)] = 0
+    idx = (h * bins / 360).astype(np.int64) % bins
+    hist = np.bincount(idx, weights=weights, minlength=bins)
+    if not normalize:
+        return hist
+    total = hist.sum()
+    return hist / total if total > 0 else hist
+
+
+def template_mask(sectors, bins=HUE_BINS):
+    """Indicator vector over the hue circle of a template's sectors."""
+    centres = (np.arange(bins) + 0.5) * 360 / bins
+    mask = np.zeros(bins)
+    for offset, width in sectors:
+        mask[hue_distance(centres, offset) <= width / 2] = 1.0
+    return mask
+
+
+_TEMPLATE_FFTS = {name: np.conj(np.fft.rfft(template_mask(sectors))) for name, sectors in TEMPLATES.items()}
+# Share of the hue circle each template covers: what a uniform hue spread scores
+_TEMPLATE_COVERAGE = {name: template_mask(sectors).mean() for name, sectors in TEMPLATES.items()}
+
+
+def harmony_scores(hist):
+    """
+    Scores a hue histogram against every harmony template at every rotation.
+
+    For each template, the circular cross-correlation of the histogram with
+    the template mask (one FFT product) gives, for all 360 rotations at once,
+    the share of color mass falling inside the template's sectors. Wider
+    templates catch more mass by chance, so the share is rescaled against a
+    uniform hue spread: (share - coverage) / (1 - coverage), where coverage
+    is the share of the circle the template covers. A uniform spread scores
+    0 on every template, a perfect fit 1.
+
+    Returns:
+        A dictionary template name -> (score in [0, 1], best rotation in degrees).
+    """
+    hist_fft = np.fft.rfft(hist)
+    scores = {}
+    for name, template_fft in _TEMPLATE_FFTS.items():
+        correlation = np.fft.irfft(hist_fft * template_fft, n=len(hist))
+        rotation = int(np.argmax(correlation))
+        coverage = _TEMPLATE_COVERAGE[name]
+        score = (correlation[rotation] - coverage) / (1 - coverage)
+        scores[name] = (float(np.clip(score, 0.0, 1.0)), rotation * 360 / len(hist))
+    return scores
+
+
+def best_template(scores, hue_mass=1.0):
+    """
+    Name of the best fitting template, or None when there is none: too little
+    hue in the image (hue_mass below MIN_HUE_MASS, e.g. grayscale), or a tie
+    between the best scores (e.g. a single flat hue fits every template).
+    """
+    ranked = sorted(scores, key=lambda name: scores[name][0], reverse=True)
+    if hue_mass < MIN_HUE_MASS or scores[ranked[0]][0] - scores[ranked[1]][0] < TIE_TOLERANCE:
+        return None
+    return ranked[0]
+
+
+def color_harmony(image_path):
+    """
+    Measures how well an image's hues fit the classic color harmonies.
+
+    Args:
+        image_path: Path to the image file.
+
+    Returns:
+        A dictionary with one (score, rotation) entry per template plus
+        'best' (name of the best fitting template, None if no template stands
+        out, see best_template()) and 'score' (the best score). Grayscale
+        images score 0. Returns None on error.
+    """
+    try:
+        pixels = load_rgb(image_path).reshape(-1, 3)
+        hist = hue_histogram(pixels, normalize=False)
+        mass = hist.sum()
+        scores = harmony_scores(hist / mass if mass > 0 else hist)
+        best = best_template(scores, mass / len(pixels))
+        return {**scores, 'best': best, 'score': max(score for score, _ in scores.values())}
+    except Exception as e:
+        print(f"Error processing image: {e}")
+        return None
+
+
+# Metrics for the batch / streaming extractor: best template score, and the
+# score of every template in TEMPLATES order.
+HARMONY_METRICS = {
+    'harmony': lambda rgb: max(s for s, _ in harmony_scores(hue_histogram(rgb.reshape(-1, 3))).values()),
+    'harmony_templates': lambda rgb: tuple(s for s, _ in harmony_scores(hue_histogram(rgb.reshape(-1, 3))).values()),
+}
+
+
+if __name__ == '__main__':
+    import os
+    from ..paths import COLOR_SAMPLES_DIR
+
+    print(color_harmony(os.path.join(COLOR_SAMPLES_DIR, 'original.jpg')))
@@ -0,0 +1,127 @@
+import numpy as np
+
+# Rows per chunk: a chunk of a few derived float64 channels stays in the CPU
+# cache, so the centred second pass over it costs no extra memory traffic.
+CHUNK_ROWS = 16384
+
+
+class Moments:
+    """
+    Count, mean and sum of squared deviations (M2) of several channels.
+
+    Moments.of() fills it in one pass over a buffer, chunk by chunk; chunks
+    (and tiles, images, worker processes...) are combined with the parallel
+    form of Welford's update (Chan et al.), which, unlike summing raw
+    squares, stays accurate when the mean is large compared to the spread.
+    Instances are plain picklable objects, so workers can return them and
+    the parent merges them.
+
+    Example:
+        m = Moments.of(pixels)                    # (N, 3) -> per channel stats
+        m.mean, m.variance, m.std
+        total = Moments.merge_all([m1, m2, m3])   # e.g. from several tiles
+    """
+
+    def __init__(self, n_channels=1):
+        self.count = 0
+        self.mean = np.zeros(n_channels)
+        self.m2 = np.zeros(n_channels)
+
+    @classmethod
+    def of(cls, values, transform=None, chunk_rows=CHUNK_ROWS):
+        """
+        Moments of the columns of an array.
+
+        Args:
+            values: (N, C) array, or (N,) for one channel. Any dtype.
+            transform: Optional function mapping a chunk of rows to the
+                (n, K) float array of channels to accumulate (derived
+                channels are then never materialised for the whole array).
+            chunk_rows: Rows per chunk.
+        """
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values[:, None]
+        moments = None
+        for start in range(0, len(values), chunk_rows):
+            chunk = values[start:start + chunk_rows]
+            chunk = transform(chunk) if transform is not None else chunk.astype(np.float64)
+            if moments is None:
+                moments = cls(chunk.shape[1])
+            moments.update(chunk)
+        if moments is None:  # Empty input
+            moments = cls(values.shape[1] if transform is None else 1)
+        return moments
+
+    def update(self, chunk):
+        """Adds an (n, C) float chunk (two passes over the chunk, then a merge)."""
+        n = len(chunk)
+        if n == 0:
+            return self
+        mean = chunk.mean(axis=0)
+        centred = chunk - mean
+        other = Moments(len(mean))
+        other.count, other.mean, other.m2 = n, mean, np.einsum('ij,ij->j', centred, centred)
+        return self.merge(other)
+
+    def merge(self, other):
+        """Adds another Moments of the same channels (in place). Returns self."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean.copy(), other.m2.copy()
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / count)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * (self.count * other.count / count)
+        self.count = count
+        return self
+
+    def __add__(self, other):
+        return self.copy().merge(other)
+
+    def copy(self):
+        moments = Moments(len(self.mean))
+        moments.count, moments.mean, moments.m2 = self.count, self.mean.copy(), self.m2.copy()
+        return moments
+
+    @staticmethod
+    def merge_all(parts):
+        """Merges an iterable of Moments (e.g. per tile or per worker)."""
+        total = None
+        for part in parts:
+            total = part.copy() if total is None else total.merge(part)
+        return total
+
+    @property
+    def sum(self):
+        return self.mean * self.count
+
+    @property
+    def sum_squares(self):
+        return self.m2 + self.count * self.mean ** 2
+
+    def var(self, ddof=0):
+        """Per channel variance (ddof=0: population variance, as np.var)."""
+        return self.m2 / max(self.count - ddof, 1)
+
+    @property
+    def variance(self):
+        return self.var()
+
+    @property
+    def std(self):
+        return np.sqrt(self.var())
+
+    def __repr__(self):
+        return f"Moments(count={self.count}, mean={self.mean}, std={self.std})"
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    data = rng.normal(1e6, 2.0, size=(100_000, 3))  # Large mean, small spread
+    tiles = [Moments.of(part) for part in np.array_split(data, 7)]
+    merged = Moments.merge_all(tiles)
+    print(merged)
+    print("max |var - np.var|:", np.abs(merged.variance - data.var(axis=0)).max())
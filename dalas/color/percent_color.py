@@ -1,6 +1,10 @@
+import os
+
 from PIL import Image
 import numpy as np
 
+from ..paths import COLOR_SAMPLES_DIR
+
 # NOT WORKING ~~~~~~~~~~
 
 def percent_colored(image_path, tolerance=10):
@@ -74,7 +78,7 @@ def main():
         print("-" * 20) #separator for readability
 
 
-
-print(percent_colored('Color/3. Percent Colored/b&w.jpg'))
-print(percent_colored('Color/3. Percent Colored/b&w_with_red.jpg'))
-print(percent_colored('Color/3. Percent Colored/colored.jpg'))
\ No newline at end of file
+if __name__ == '__main__':
+    print(percent_colored(os.path.join(COLOR_SAMPLES_DIR, '3. Percent Colored/b&w.jpg')))
+    print(percent_colored(os.path.join(COLOR_SAMPLES_DIR, '3. Percent Colored/b&w_with_red.jpg')))
+    print(percent_colored(os.path.join(COLOR_SAMPLES_DIR, '3. Percent Colored/colored.jpg')))
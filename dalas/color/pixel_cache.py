@@ -0,0 +1,126 @@
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from .color_features import load_rgb
+from ..paths import COLOR_SAMPLES_DIR
+
+
+class PixelCache:
+    """
+    Opt-in on-disk cache of decoded RGB rasters.
+
+    Each image is decoded once and stored as a .npy file named after the
+    SHA-1 of the image file (plus the resolution cap). Later runs, and every
+    worker process, get read-only np.memmap views of it: no JPEG decode and
+    no copy, pages are shared through the OS page cache.
+
+    The cache directory is kept under max_bytes with LRU eviction: a hit
+    touches the file's mtime, and eviction removes the oldest files first.
+    Entries are written to a temporary file and renamed, so concurrent
+    processes never see a half-written array.
+
+    Example:
+        cache = PixelCache("pixel_cache", max_bytes=2 * 1024 ** 3, max_side=1024)
+        pixels = cache.get("Paintings/Evasion_Nadia Zouari_2025.jpg")
+    """
+
+    def __init__(self, cache_dir="pixel_cache", max_bytes=2 * 1024 ** 3, max_side=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_side = max_side
+        self._digests = {}  # (path, size, mtime) -> digest, avoids re-hashing in one process
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _digest(self, image_path):
+        stat = os.stat(image_path)
+        memo_key = (os.path.abspath(image_path), stat.st_size, stat.st_mtime_ns)
+        digest = self._digests.get(memo_key)
+        if digest is None:
+            sha = hashlib.sha1()
+            with open(image_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    sha.update(block)
+            digest = sha.hexdigest()
+            self._digests[memo_key] = digest
+        return digest
+
+    def entry_path(self, image_path):
+        """Path of the .npy file caching image_path at this cache's resolution."""
+        suffix = f"_{self.max_side}" if self.max_side else ""
+        return os.path.join(self.cache_dir, f"{self._digest(image_path)}{suffix}.npy")
+
+    def get(self, image_path):
+        """
+        Returns the RGB pixels of image_path as a read-only (height, width, 3)
+        uint8 memmap, decoding and caching the image on a miss.
+        """
+        entry = self.entry_path(image_path)
+        try:
+            pixels = np.load(entry, mmap_mode='r')
+            os.utime(entry)  # Mark as recently used
+            return pixels
+        except (FileNotFoundError, ValueError, OSError):
+            pass
+
+        pixels = np.ascontiguousarray(load_rgb(image_path, self.max_side), dtype=np.uint8)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, pixels)
+            os.replace(tmp_path, entry)
+        except OSError as e:
+            print(f"Error writing pixel cache entry: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return pixels
+        self.evict(keep=entry)
+        try:
+            return np.load(entry, mmap_mode='r')
+        except (FileNotFoundError, ValueError, OSError):
+            return pixels  # Evicted by another process meanwhile
+
+    def size_bytes(self):
+        """Total size of the cached arrays."""
+        return sum(entry.stat().st_size for entry in os.scandir(self.cache_dir)
+                   if entry.name.endswith('.npy'))
+
+    def evict(self, keep=None):
+        """
+        Removes least recently used entries until the cache fits in max_bytes.
+
+        Args:
+            keep: Entry path never removed (the one just written), even if it
+                alone exceeds max_bytes.
+        """
+        entries = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                   for entry in os.scandir(self.cache_dir) if entry.name.endswith('.npy')]
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)  # Existing memmaps of this entry stay valid on POSIX
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Removes every cached array."""
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(('.npy', '.tmp')):
+                os.remove(entry.path)
+
+
+if __name__ == '__main__':
+    import time
+
+    cache = PixelCache("pixel_cache", max_side=1024)
+    for attempt in ("cold", "warm"):
+        start = time.perf_counter()
+        pixels = cache.get(os.path.join(COLOR_SAMPLES_DIR, 'original.jpg'))
+        print(f"{attempt}: {pixels.shape} in {time.perf_counter() - start:.4f}s")
@@ -0,0 +1,207 @@
+"""
+Approximate global color statistics from a stratified pixel sample.
+
+Warmth, colorfulness, channel variance, the colored share, dominant color
+proportions... are means (or smooth functions of means) over every pixel,
+so a few thousand well spread pixels estimate them closely, whatever the
+size of the image: after the decode, an image costs the same as any other.
+
+The image is cut into a grid of about SAMPLE_PIXELS cells and one pixel is
+drawn at random in each (jittered grid): every region is represented, which
+a plain random draw does not guarantee. The cells are dealt at random into
+GROUPS groups, and the confidence interval comes from the delete-a-group
+jackknife: the statistic is recomputed without each group in turn and the
+spread of those replicates gives its standard error. Draws use a fixed seed,
+so the same image always gives the same estimate.
+"""
+import functools
+import os
+from typing import NamedTuple
+
+import numpy as np
+
+from .color_features import (channel_variance, colorfulness, load_rgb, percent_colored, pixel_moments,
+                             saturation_brightness, warmth)
+from .moments import Moments
+from ..paths import COLOR_SAMPLES_DIR
+
+SAMPLE_PIXELS = 4096   # Grid cells, i.e. pixels drawn per image
+GROUPS = 16            # Jackknife groups
+CONFIDENCE = 0.95
+SEED = 0
+
+
+class Estimate(NamedTuple):
+    """An estimated value with its confidence interval, from n sampled pixels."""
+    value: float
+    low: float
+    high: float
+    n: int
+
+    @property
+    def margin(self):
+        return (self.high - self.low) / 2
+
+
+@functools.lru_cache(maxsize=None)
+def _t_quantile(confidence, df):
+    from scipy.stats import t  # Imported on first use: scipy.stats is slow to import
+
+    return float(t.ppf((1 + confidence) / 2, df))
+
+
+class PixelSample:
+    """
+    Stratified sample of an image's pixels, split into jackknife groups.
+
+    Use stratified_sample() to draw one. An image with no more pixels than
+    the sample size is taken whole (exhaustive): estimates are then exact
+    and their intervals have zero width.
+    """
+
+    def __init__(self, pixels, groups, n_groups, exhaustive=False):
+        self.pixels = pixels      # (n, 3) array
+        self.groups = groups      # (n,) group of each pixel
+        self.n_groups = n_groups
+        self.exhaustive = exhaustive
+        self._moments = None
+
+    def __len__(self):
+        return len(self.pixels)
+
+    def _interval(self, full, replicates, confidence):
+        """Jackknife interval(s) around full from the leave-one-group-out replicates."""
+        full = np.asarray(full, dtype=np.float64)
+        if self.exhaustive or self.n_groups < 2:
+            margin = np.zeros_like(full)
+        else:
+            replicates = np.asarray(replicates, dtype=np.float64)
+            g = len(replicates)
+            se = np.sqrt((g - 1) / g * ((replicates - replicates.mean(axis=0)) ** 2).sum(axis=0))
+            margin = _t_quantile(confidence, g - 1) * se
+        if full.ndim == 0:
+            return Estimate(float(full), float(full - margin), float(full + margin), len(self))
+        return tuple(Estimate(float(v), float(v - m), float(v + m), len(self)) for v, m in zip(full, margin))
+
+    def estimate(self, statistic, confidence=CONFIDENCE):
+        """
+        Estimates statistic(pixels) over the whole image.
+
+        Args:
+            statistic: Function of an (n, 3) pixel array returning a float
+                or a sequence of floats.
+            confidence: Confidence level of the interval.
+
+        Returns:
+            An Estimate, or a tuple of Estimates for a sequence-valued statistic.
+        """
+        full = statistic(self.pixels)
+        replicates = [] if self.exhaustive else [statistic(self.pixels[self.groups != g])
+                                                 for g in range(self.n_groups)]
+        return self._interval(full, replicates, confidence)
+
+    def moments(self):
+        """
+        pixel_moments of the sample and of each leave-one-group-out replicate,
+        from one pass per group: replicates are merges of the other groups'
+        Moments (prefix and suffix merges), not new passes over the pixels.
+        """
+        if self._moments is None:
+            parts = [pixel_moments(self.pixels[self.groups == g]) for g in range(self.n_groups)]
+            prefix = [Moments(len(parts[0].mean))]
+            for part in parts:
+                prefix.append(prefix[-1] + part)
+            suffix = [Moments(len(parts[0].mean))]
+            for part in reversed(parts):
+                suffix.append(suffix[-1] + part)
+            suffix.reverse()
+            self._moments = prefix[-1], [prefix[g] + suffix[g + 1] for g in range(self.n_groups)]
+        return self._moments
+
+    def estimate_moments(self, statistic, confidence=CONFIDENCE):
+        """Like estimate(), for a statistic of pixel_moments (e.g. lambda m: warmth(None, m))."""
+        full, replicates = self.moments()
+        return self._interval(statistic(full), [] if self.exhaustive else [statistic(m) for m in replicates],
+                              confidence)
+
+
+def stratified_sample(rgb, n_pixels=SAMPLE_PIXELS, groups=GROUPS, seed=SEED):
+    """
+    Draws one pixel at random in each cell of a grid of about n_pixels cells
+    with the image's aspect ratio.
+
+    Args:
+        rgb: (height, width, 3) pixel array.
+        n_pixels: Sample size.
+        groups: Number of jackknife groups the cells are dealt into.
+        seed: Seed of the draws (the same image always gives the same sample).
+
+    Returns:
+        A PixelSample.
+    """
+    height, width = rgb.shape[:2]
+    rng = np.random.default_rng(seed)
+    if height * width <= n_pixels:
+        pixels = rgb.reshape(-1, rgb.shape[-1])
+        return PixelSample(pixels, rng.permutation(len(pixels)) % groups, groups, exhaustive=True)
+
+    rows = min(height, max(1, round(np.sqrt(n_pixels * height / width))))
+    cols = min(width, max(1, round(n_pixels / rows)))
+    row_edges = np.arange(rows + 1) * height // rows
+    col_edges = np.arange(cols + 1) * width // cols
+    # Cell (i, j) spans rows row_edges[i]:row_edges[i + 1] and columns col_edges[j]:col_edges[j + 1]
+    i, j = np.divmod(np.arange(rows * cols), cols)
+    y = row_edges[i] + (rng.random(rows * cols) * (row_edges[i + 1] - row_edges[i])).astype(np.intp)
+    x = col_edges[j] + (rng.random(rows * cols) * (col_edges[j + 1] - col_edges[j])).astype(np.intp)
+    return PixelSample(rgb[y, x], rng.permutation(rows * cols) % groups, groups)
+
+
+# Approximate versions of the global metrics of color_features.METRICS, by
+# name. Each takes a PixelSample and returns an Estimate (or a tuple of them).
+APPROX_METRICS = {
+    'warmth': lambda sample: sample.estimate_moments(lambda m: warmth(None, m)),
+    'colorfulness': lambda sample: sample.estimate_moments(lambda m: colorfulness(None, m)),
+    'saturation': lambda sample: sample.estimate_moments(lambda m: saturation_brightness(None, m)[0]),
+    'brightness': lambda sample: sample.estimate_moments(lambda m: saturation_brightness(None, m)[1]),
+    'color_variance': lambda sample: sample.estimate_moments(lambda m: channel_variance(None, m)),
+    'percent_colored': lambda sample: sample.estimate_moments(lambda m: percent_colored(None, m)),
+}
+
+
+def approx_color_metrics(image, metrics=None, n_pixels=SAMPLE_PIXELS, max_side=None):
+    """
+    Estimates global color metrics of an image from a stratified sample.
+
+    Args:
+        image: Path, PIL image or RGB pixel array.
+        metrics: Names from APPROX_METRICS. Default: all.
+        n_pixels: Sample size.
+        max_side: Downscale the image to this longest side when decoding.
+
+    Returns:
+        A dict of metric name -> Estimate (tuple of Estimates for
+        color_variance), or None on error.
+    """
+    try:
+        sample = stratified_sample(load_rgb(image, max_side), n_pixels)
+        return {name: APPROX_METRICS[name](sample) for name in (metrics or APPROX_METRICS)}
+    except Exception as e:
+        print(f"Error processing image: {e}")
+        return None
+
+
+if __name__ == '__main__':
+    import time
+
+    from .color_features import METRICS
+
+    rgb = load_rgb(os.path.join(COLOR_SAMPLES_DIR, 'original.jpg'))
+    start = time.perf_counter()
+    estimates = approx_color_metrics(rgb)
+    elapsed = time.perf_counter() - start
+    for name, estimate in estimates.items():
+        exact = METRICS[name](rgb)
+        for e, x in zip(estimate if name == 'color_variance' else [estimate],
+                        exact if name == 'color_variance' else [exact]):
+            print(f"{name:16s} {e.value:10.3f}  [{e.low:10.3f}, {e.high:10.3f}]  exact {x:10.3f}")
+    print(f"{rgb.shape[0] * rgb.shape[1]} pixels, estimated from {SAMPLE_PIXELS} in {elapsed * 1000:.1f} ms")
@@ -0,0 +1,50 @@
+import os
+
+from PIL import Image
+import numpy as np
+
+from .color_features import saturation_brightness
+from ..paths import COLOR_SAMPLES_DIR
+
+
+def image_saturation_score(image_path, target_saturation=0.6, std_dev=0.25):
+    """
+    Calculates an image saturation score, favoring a specified target saturation.
+
+    Args:
+        image_path: Path to the image file.
+        target_saturation: The ideal saturation level (0.0 to 1.0). Default: 0.6
+        std_dev: The standard deviation for the Gaussian scoring function.
+                 Larger values are more lenient. Default: 0.25
+
+    Returns:
+        A float between 0.0 and 100.0, where higher scores indicate better
+        saturation (closer to the target saturation level).  Returns None on
+        error.
+    """
+    try:
+        img = Image.open(image_path).convert("RGB")
+        pixels = np.asarray(img).reshape(-1, 3)
+
+        # Average HSV saturation, from the mergeable pixel moments (one pass)
+        avg_saturation, _ = saturation_brightness(pixels)
+
+        # --- Scoring Function (Gaussian) ---
+        score = 100 * np.exp(-((avg_saturation - target_saturation) ** 2) / (2 * std_dev ** 2))
+
+        return score
+
+    except FileNotFoundError:
+        print(f"Error: File not found at {image_path}")
+        return None
+    except OSError:
+        print(f"Error: Could not open or read image file at {image_path}")
+        return None
+    except Exception as e:
+        print(f"Error processing image: {e}")  # More specific error message
+        return None
+
+
+if __name__ == '__main__':
+    print("colors - ", image_saturation_score(os.path.join(COLOR_SAMPLES_DIR, '5. Brightness/normal.jpg')))
+    print("saturated - ", image_saturation_score(os.path.join(COLOR_SAMPLES_DIR, '4. Saturation/sat_normal.png')))
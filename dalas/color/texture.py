@@ -1,6 +1,7 @@
 from PIL import Image
 import numpy as np
-from scipy.signal import convolve2d
+
+from .moments import Moments
 
 def color_texture(image_path):
     """
@@ -14,6 +15,8 @@ def color_texture(image_path):
         A float representing the color texture. Higher values indicate
         more textured color variations. Returns None on error.
     """
+    from scipy.signal import convolve2d  # Imported on first use: scipy.signal is slow to import
+
     try:
         img = Image.open(image_path).convert("RGB")
         pixels = np.array(img).astype(np.float64)
@@ -21,20 +24,18 @@ def color_texture(image_path):
         sobel_x = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]])
         sobel_y = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]])
 
-        gradient_magnitudes = []
+        # Combine gradient magnitudes from all channels (running sum, no stacked copy)
+        combined_gradient_magnitude = np.zeros(pixels.shape[:2])
 
         for channel in range(3):
             channel_data = pixels[:, :, channel]
             gradient_x = convolve2d(channel_data, sobel_x, mode='same', boundary='symm')
             gradient_y = convolve2d(channel_data, sobel_y, mode='same', boundary='symm')
-            gradient_magnitude = np.sqrt(gradient_x**2 + gradient_y**2)
-            gradient_magnitudes.append(gradient_magnitude)
-
-        # Combine gradient magnitudes from all channels
-        combined_gradient_magnitude = np.mean(np.stack(gradient_magnitudes), axis=0)
+            combined_gradient_magnitude += np.sqrt(gradient_x**2 + gradient_y**2)
+        combined_gradient_magnitude /= 3
 
         # Calculate the standard deviation of the combined gradient magnitude
-        texture_measure = np.std(combined_gradient_magnitude)
+        texture_measure = Moments.of(combined_gradient_magnitude.reshape(-1)).std[0]
         return texture_measure
 
     except Exception as e:
@@ -1,12 +1,17 @@
 from PIL import Image
 import numpy as np
 
-def color_variance(image_path):
+from .moments import Moments
+from .sampling import stratified_sample
+
+def color_variance(image_path, approx=False):
     """
     Calculates the variance of the R, G, and B channels.
 
     Args:
         image_path: Path to the image file.
+        approx: Estimate them from a stratified pixel sample: the tuple
+                then holds sampling.Estimate values with 95% confidence intervals.
 
     Returns:
         A tuple (r_var, g_var, b_var) representing the variance of
@@ -15,14 +20,14 @@ def color_variance(image_path):
     """
     try:
         img = Image.open(image_path).convert("RGB")
+        if approx:
+            return stratified_sample(np.asarray(img)).estimate(lambda pixels: Moments.of(pixels).variance)
         pixels = np.array(img).reshape(-1, 3)
 
-        r_var = np.var(pixels[:, 0])
-        g_var = np.var(pixels[:, 1])
-        b_var = np.var(pixels[:, 2])
+        r_var, g_var, b_var = Moments.of(pixels).variance  # The three channels in one pass
 
         return (r_var, g_var, b_var)
 
     except Exception as e:
         print(f"Error processing image: {e}")
-        return None
\ No newline at end of file
+        return None
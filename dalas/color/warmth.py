@@ -0,0 +1,65 @@
+import os
+
+from PIL import Image
+import numpy as np
+
+from .sampling import stratified_sample
+from ..paths import COLOR_SAMPLES_DIR
+
+
+def image_warmth(image_path, approx=False):
+    """
+    Calculates a warmth score for an image, scaled from 0 (coolest) to 100(warmest).
+
+    Args:
+        image_path: Path to the image file.
+        approx: Estimate the score from a stratified pixel sample (see
+                sampling.py) and return a sampling.Estimate (value, low,
+                high, n) with its 95% confidence interval.
+
+    Returns:
+        A float between 0.0 and 100.0:
+        -   0.0 represents an extremely cool image.
+        -  50.0 represents a neutral image (balanced warm and cool).
+        - 100.0 represents an extremely warm image.
+        Returns None on error.
+    """
+    try:
+        img = Image.open(image_path).convert("RGB")
+        if approx:
+            return stratified_sample(np.asarray(img)).estimate(_warmth_score)
+        return _warmth_score(np.array(img).reshape(-1, 3))
+
+    except Exception as e:
+        print(f"Error processing image: {e}")
+        return None
+
+
+def _warmth_score(pixels):
+    """Warmth score (0-100) of an (N, 3) RGB pixel array."""
+    c = pixels.astype(np.float64)  # uint8 sums like g + b would wrap around
+    r, g, b = c[:, 0], c[:, 1], c[:, 2]
+
+    # More robust warmth/coolness calculation
+    warmth = r - (g + b) / 2
+    coolness = b - (r + g) / 2
+
+    warmth_coolness_score = np.mean(warmth - coolness)
+
+    # Normalize
+    max_abs_score = 255  # Maximum absolute value the score could have
+    normalized_score = warmth_coolness_score / max_abs_score
+
+    # Scale and shift to 0-100 range
+    scaled_score = (normalized_score + 1.0) * 50.0
+
+    # Clip to 0-100 (important for edge cases)
+    scaled_score = np.clip(scaled_score, 0.0, 100.0)
+
+    return scaled_score
+
+
+if __name__ == '__main__':
+    print(image_warmth(os.path.join(COLOR_SAMPLES_DIR, '1. Warmth/cool.jpeg')))
+    print(image_warmth(os.path.join(COLOR_SAMPLES_DIR, '1. Warmth/warm.jpeg')))
+    print(image_warmth(os.path.join(COLOR_SAMPLES_DIR, 'original.jpg')))
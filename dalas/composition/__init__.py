@@ -0,0 +1,15 @@
+"""Composition and Detail & Intricacy metrics computed on a shared Gaussian pyramid."""
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'GaussianPyramid': 'pyramid',
+    'rule_of_thirds': 'layout',
+    'symmetry': 'layout',
+    'edge_density': 'layout',
+    'detail_energy': 'layout',
+    'composition_scores': 'layout',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
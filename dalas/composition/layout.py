@@ -0,0 +1,150 @@
+import numpy as np
+
+from .pyramid import GaussianPyramid, blur, pyramid_for
+
+# Working resolution (shorter side, in px) each metric needs. Each metric runs
+# on the coarsest pyramid level that still has at least this many pixels.
+THIRDS_MIN_SIDE = 48
+SYMMETRY_MIN_SIDE = 64
+EDGE_MIN_SIDE = 192
+DETAIL_BANDS = 4  # Finest Laplacian bands reported by detail_energy
+
+
+def rule_of_thirds(pyramid):
+    """
+    Share of the image's saliency lying near the four rule-of-thirds points.
+
+    Saliency is a centre-surround contrast (a pyramid level minus its blurred
+    version two octaves coarser); it is weighted by Gaussians centred on the
+    thirds intersections.
+
+    Returns:
+        A float between 0.0 and 1.0. Around 0.2 for evenly spread detail,
+        higher when the subject sits on the thirds.
+    """
+    i = pyramid.level_for(THIRDS_MIN_SIDE)
+    centre = pyramid.level(i)
+    surround = centre
+    for _ in range(2):
+        surround = blur(blur(surround))
+    saliency = np.abs(centre - surround)
+
+    h, w = saliency.shape
+    y = (np.arange(h, dtype=np.float32) + 0.5) / h
+    x = (np.arange(w, dtype=np.float32) + 0.5) / w
+    sigma = 1 / 12
+    near_y = sum(np.exp(-((y - t) ** 2) / (2 * sigma ** 2)) for t in (1 / 3, 2 / 3))
+    near_x = sum(np.exp(-((x - t) ** 2) / (2 * sigma ** 2)) for t in (1 / 3, 2 / 3))
+    weights = np.minimum(np.outer(near_y, near_x), 1.0)
+
+    total = saliency.sum()
+    return float((saliency * weights).sum() / total) if total > 0 else 0.0
+
+
+def symmetry(pyramid, axis='vertical'):
+    """
+    Mirror symmetry as the correlation between the image and its reflection.
+
+    Args:
+        pyramid: GaussianPyramid of the image.
+        axis: 'vertical' (left/right mirror) or 'horizontal' (top/bottom).
+
+    Returns:
+        A float between -1.0 and 1.0, 1.0 being perfectly symmetric.
+    """
+    img = pyramid.level(pyramid.level_for(SYMMETRY_MIN_SIDE))
+    mirrored = img[:, ::-1] if axis == 'vertical' else img[::-1, :]
+    a = img - img.mean()
+    b = mirrored - mirrored.mean()
+    denom = np.sqrt((a * a).sum() * (b * b).sum())
+    return float((a * b).sum() / denom) if denom > 0 else 1.0
+
+
+def edge_density(pyramid, grid=3, threshold=0.08):
+    """
+    Fraction of edge pixels overall and in each cell of a grid x grid layout.
+
+    Edges are pixels whose luminance gradient magnitude (central differences)
+    exceeds `threshold` (luminance is in [0, 1]).
+
+    Returns:
+        (overall, cells) where cells is a tuple of grid*grid fractions in
+        row-major order (top-left first).
+    """
+    img = pyramid.level(pyramid.level_for(EDGE_MIN_SIDE))
+    gy, gx = np.gradient(img)
+    edges = np.hypot(gx, gy) > threshold
+
+    h, w = edges.shape
+    rows = np.minimum(np.arange(h) * grid // h, grid - 1)
+    cols = np.minimum(np.arange(w) * grid // w, grid - 1)
+    cell_ids = (rows[:, None] * grid + cols[None, :]).ravel()
+    counts = np.bincount(cell_ids, weights=edges.ravel(), minlength=grid * grid)
+    sizes = np.bincount(cell_ids, minlength=grid * grid)
+    return float(edges.mean()), tuple(float(c) for c in counts / np.maximum(sizes, 1))
+
+
+def detail_energy(pyramid, bands=DETAIL_BANDS):
+    """
+    Multi-scale detail: mean squared Laplacian (band-pass) energy per octave.
+
+    Returns:
+        A tuple of `bands` floats, finest octave first, each the share of the
+        total band energy (NaN for octaves the image is too small for).
+    """
+    available = min(bands, pyramid.max_level())
+    energies = np.full(bands, np.nan)
+    for i in range(available):
+        band = pyramid.laplacian(i)
+        energies[i] = float(np.mean(band * band))
+    total = np.nansum(energies)
+    if total > 0:
+        energies = energies / total
+    return tuple(float(e) for e in energies)
+
+
+def composition_scores(image, max_side=None):
+    """
+    Computes every composition metric of an image from one shared pyramid.
+
+    Args:
+        image: Path to the image file, PIL image or RGB array.
+        max_side: Optional downscale before building the pyramid.
+
+    Returns:
+        A dictionary of metric name -> value, or None on error.
+    """
+    from ..color.color_features import load_rgb
+
+    try:
+        pyramid = GaussianPyramid(load_rgb(image, max_side))
+        overall, cells = edge_density(pyramid)
+        return {
+            'thirds': rule_of_thirds(pyramid),
+            'symmetry': symmetry(pyramid),
+            'symmetry_horizontal': symmetry(pyramid, axis='horizontal'),
+            'edge_density': overall,
+            'edge_density_grid': cells,
+            'detail_energy': detail_energy(pyramid),
+        }
+    except Exception as e:
+        print(f"Error processing image: {e}")
+        return None
+
+
+# Metrics for the batch / streaming extractor (see color.feature_stream). They
+# take an RGB array; metrics computed on the same array share one pyramid.
+COMPOSITION_METRICS = {
+    'thirds': lambda rgb: rule_of_thirds(pyramid_for(rgb)),
+    'symmetry': lambda rgb: symmetry(pyramid_for(rgb)),
+    'edge_density': lambda rgb: edge_density(pyramid_for(rgb))[0],
+    'edge_density_grid': lambda rgb: edge_density(pyramid_for(rgb))[1],
+    'detail_energy': lambda rgb: detail_energy(pyramid_for(rgb)),
+}
+
+
+if __name__ == '__main__':
+    import os
+    from ..paths import COLOR_SAMPLES_DIR
+
+    print(composition_scores(os.path.join(COLOR_SAMPLES_DIR, 'original.jpg')))
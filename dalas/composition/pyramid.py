@@ -0,0 +1,93 @@
+import threading
+
+import numpy as np
+
+# 5-tap binomial kernel (Burt & Adelson), a cheap separable Gaussian approximation.
+KERNEL = np.array([1, 4, 6, 4, 1], dtype=np.float32) / 16
+
+
+def luminance(rgb):
+    """(height, width) float32 luminance in [0, 1] of an RGB uint8 array."""
+    rgb = np.asarray(rgb)
+    return (rgb[..., 0] * np.float32(0.299 / 255) + rgb[..., 1] * np.float32(0.587 / 255)
+            + rgb[..., 2] * np.float32(0.114 / 255)).astype(np.float32)
+
+
+def blur(img):
+    """Separable 5-tap binomial blur with reflected borders (shifted views, no Python loops over pixels)."""
+    padded = np.pad(img, 2, mode='reflect')
+    rows = sum(w * padded[i:i + img.shape[0], :] for i, w in enumerate(KERNEL))
+    return sum(w * rows[:, i:i + img.shape[1]] for i, w in enumerate(KERNEL))
+
+
+def expand(img, shape):
+    """Upsamples a pyramid level by 2 to `shape` (nearest neighbour, then blurred)."""
+    up = np.repeat(np.repeat(img, 2, axis=0), 2, axis=1)[:shape[0], :shape[1]]
+    if up.shape != tuple(shape):  # Odd sizes: repeat the last row / column
+        up = np.pad(up, ((0, shape[0] - up.shape[0]), (0, shape[1] - up.shape[1])), mode='edge')
+    return blur(up)
+
+
+class GaussianPyramid:
+    """
+    Gaussian image pyramid of the luminance, built lazily level by level.
+
+    Level 0 is the full resolution image, each next level is blurred and
+    decimated by 2. Metrics pick the coarsest level that still has enough
+    pixels for them (level_for), so most work runs on small arrays.
+    """
+
+    def __init__(self, rgb, min_side=8):
+        self.levels = [luminance(rgb)]
+        self.min_side = min_side
+
+    @property
+    def shape(self):
+        return self.levels[0].shape
+
+    def level(self, i):
+        """Returns level i (0 = finest), building missing levels on demand."""
+        while len(self.levels) <= i:
+            top = self.levels[-1]
+            if min(top.shape) < 2 * self.min_side:
+                raise IndexError(f"Pyramid level {i} would be smaller than {self.min_side} px")
+            self.levels.append(blur(top)[::2, ::2])
+        return self.levels[i]
+
+    def max_level(self):
+        """Index of the coarsest level that can be built."""
+        h, w = self.shape
+        n = 0
+        while min(h, w) >= 2 * self.min_side:
+            h, w = (h + 1) // 2, (w + 1) // 2
+            n += 1
+        return n
+
+    def level_for(self, min_side):
+        """Index of the coarsest level whose shorter side is still >= min_side (0 if none)."""
+        h, w = self.shape
+        n, top = 0, self.max_level()
+        while n < top and min((h + 1) // 2, (w + 1) // 2) >= min_side:
+            h, w = (h + 1) // 2, (w + 1) // 2
+            n += 1
+        return n
+
+    def laplacian(self, i):
+        """Band-pass detail of level i: level(i) - expand(level(i + 1))."""
+        fine = self.level(i)
+        return fine - expand(self.level(i + 1), fine.shape)
+
+
+_last = threading.local()
+
+
+def pyramid_for(rgb):
+    """
+    Returns the GaussianPyramid of an RGB array, reusing the one built for the
+    same array object by the previous call (one slot per thread). This is how
+    several composition metrics computed on the same image share one pyramid.
+    """
+    if getattr(_last, 'rgb', None) is not rgb:
+        _last.rgb = rgb
+        _last.pyramid = GaussianPyramid(rgb)
+    return _last.pyramid
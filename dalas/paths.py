@@ -0,0 +1,23 @@
+import os
+
+# Locations of the data shipped with the repository. Functions use these as
+# defaults so they work from any working directory.
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COLOR_SAMPLES_DIR = os.path.join(REPO_ROOT, "2.1_Color", "Color")
+ARTIST_SAMPLES_DIR = os.path.join(REPO_ROOT, "3.1_Artist")
+
+ARTSPER_DIR = os.path.join(REPO_ROOT, "Data", "Artsper")
+PAINTINGS_DIR = os.path.join(ARTSPER_DIR, "Paintings")
+GRAPHS_DIR = os.path.join(ARTSPER_DIR, "Graphs")
+ARTWORK_CSV = os.path.join(ARTSPER_DIR, "artwork_data.csv")
+ARTWORK_LINKS_CSV = os.path.join(ARTSPER_DIR, "artwork_links.csv")
+ARTWORK_DB = os.path.join(ARTSPER_DIR, "artworks.sqlite")
+BIOGRAPHY_FEATURES_DIR = os.path.join(ARTSPER_DIR, "biography_features")
+SNAPSHOTS_DIR = os.path.join(ARTSPER_DIR, "snapshots")
+
+FACE_MODELS_DIR = os.path.join(REPO_ROOT, "Data", "Models", "face_detection")
+
+REDDIT_DIR = os.path.join(REPO_ROOT, "Data", "Reddit")
+REDDIT_CSV = os.path.join(REDDIT_DIR, "reddit_art.csv")
+REDDIT_IMAGES_DIR = os.path.join(REDDIT_DIR, "Images")
@@ -0,0 +1,318 @@
+"""
+Sampling profiler for corpus runs (python -m dalas <command> --profile DIR).
+
+A background thread samples the Python stacks of the running threads every
+few milliseconds (sys._current_frames). Time spent in C code (PIL decoding,
+convolutions, socket reads) is attributed to the Python function that
+called it, which is what matters to find the slow stage.
+
+Worker processes sample their own jobs (wrap the job with ProfiledCall):
+the samples of each job travel back with its result and are merged in the
+parent. The merged profile is written as:
+- profile.collapsed: "frame;frame;...;frame count" lines (flamegraph.pl, speedscope, inferno)
+- profile.speedscope.json: one sampled profile per worker (https://www.speedscope.app)
+- profile_top.txt: the top functions of each stage (decode, color metrics,
+  gradients, face detection, I/O), also printed.
+"""
+import json
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import NamedTuple
+
+from .paths import REPO_ROOT
+
+DEFAULT_INTERVAL = 0.005  # Seconds between samples
+MAX_DEPTH = 256
+
+# Stages, checked in order against every frame from the innermost outwards:
+# the first frame matching a pattern (a substring of "path:function") gives
+# the stage of the sample. Function-specific patterns come before the
+# directory-wide ones they would otherwise fall under.
+STAGE_RULES = [
+    ('face detection', ('dalas/artist/face_detection.py', 'dalas/artist/profilepic.py')),
+    ('gradients', (':gradient_stats', 'dalas/color/texture.py', 'dalas/color/color_gradients.py',
+                   'scipy/signal', 'dalas/composition/')),
+    ('decode', ('PIL/', ':load_rgb', ':imread', 'dalas/color/pixel_cache.py', 'dalas/analysis/derivatives.py')),
+    ('color metrics', ('dalas/color/',)),
+    ('I/O', ('socket.py', 'ssl.py', 'http/client.py', 'urllib3/', 'requests/', 'aiohttp/', 'asyncio/',
+             'csv.py', 'dalas/scrape/http_client.py', 'dalas/scrape/storage.py', 'dalas/analysis/store.py',
+             'sqlite3/')),
+]
+
+# Waits that are not work: a pool thread waiting for a job, the parent
+# waiting for its workers, a prefetcher blocked on a full queue. A sample is
+# idle when its innermost frame is one of IDLE_FRAMES and its innermost dalas
+# frame (if any) is one of IDLE_CALLERS.
+IDLE_FRAMES = ('queue.py:get', 'queue.py:put', 'threading.py:wait', 'concurrent/futures/_base.py:wait',
+               'selectors.py:select', 'multiprocessing/connection.py:wait')
+IDLE_CALLERS = ('dalas/analysis/scheduler.py', 'dalas/scrape/engine.py:run', 'dalas/color/feature_stream.py',
+                'dalas/analysis/derivatives.py:close', 'dalas/profiling.py')
+
+
+def _short_path(filename):
+    """Path shown in frames: relative to site-packages, the repository or the standard library."""
+    filename = filename.replace(os.sep, '/')
+    for marker in ('site-packages/', 'dist-packages/'):
+        if marker in filename:
+            return filename.split(marker, 1)[1]
+    root = REPO_ROOT.replace(os.sep, '/') + '/'
+    if filename.startswith(root):
+        return filename[len(root):]
+    if '/lib/python' in filename:
+        return filename.split('/lib/python', 1)[1].split('/', 1)[-1]
+    return filename
+
+
+_paths = {}
+
+
+def _stack(frame):
+    """(name, path, line) tuples of a frame's stack, outermost first."""
+    stack = []
+    while frame is not None and len(stack) < MAX_DEPTH:
+        code = frame.f_code
+        path = _paths.get(code.co_filename)
+        if path is None:
+            path = _paths[code.co_filename] = _short_path(code.co_filename)
+        stack.append((getattr(code, 'co_qualname', code.co_name), path, code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+class StackSampler:
+    """
+    Samples thread stacks of this process into Counters of stacks.
+
+    Args:
+        interval: Seconds between samples.
+        all_threads: Sample every thread (in-process runs); otherwise only
+            the threads between begin() and end() (worker jobs).
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, all_threads=False):
+        self.interval = interval
+        self.all_threads = all_threads
+        self.counts = Counter()   # all_threads mode
+        self._jobs = {}           # thread id -> Counter of the job running on it
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="dalas-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def begin(self):
+        """Starts recording the calling thread (a job)."""
+        with self._lock:
+            self._jobs[threading.get_ident()] = Counter()
+
+    def end(self):
+        """Stops recording the calling thread. Returns the Counter of its samples."""
+        with self._lock:
+            return self._jobs.pop(threading.get_ident(), Counter())
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                if self.all_threads:
+                    for thread_id, frame in frames.items():
+                        if thread_id != own:
+                            self.counts[_stack(frame)] += 1
+                else:
+                    for thread_id, counts in self._jobs.items():
+                        frame = frames.get(thread_id)
+                        if frame is not None:
+                            counts[_stack(frame)] += 1
+
+
+_worker_sampler = None
+_worker_lock = threading.Lock()
+
+
+class Sampled(NamedTuple):
+    """What a ProfiledCall returns: the job's result and the samples taken while it ran."""
+    worker: str
+    stacks: Counter
+    result: object
+
+
+class ProfiledCall:
+    """
+    Picklable wrapper sampling a worker job: calling it runs func(*args) and
+    returns a Sampled (worker id, Counter of stacks, result). Each worker
+    process starts its own sampler on its first job.
+    """
+
+    def __init__(self, func, interval=DEFAULT_INTERVAL):
+        self.func = func
+        self.interval = interval
+
+    def __call__(self, *args):
+        global _worker_sampler
+        with _worker_lock:
+            if _worker_sampler is None:
+                _worker_sampler = StackSampler(self.interval).start()
+        _worker_sampler.begin()
+        try:
+            result = self.func(*args)
+        finally:
+            stacks = _worker_sampler.end()
+        return Sampled(f"pid {os.getpid()}", stacks, result)
+
+
+def stage_of(stack):
+    """Stage of a sampled stack (see STAGE_RULES): a name, 'idle' or 'other'."""
+    keys = [f"{path}:{name.rsplit('.', 1)[-1]}" for name, path, _ in reversed(stack)]
+    if keys and any(pattern in keys[0] for pattern in IDLE_FRAMES):
+        caller = next((key for key in keys if key.startswith('dalas/')), None)
+        if caller is None or any(pattern in caller for pattern in IDLE_CALLERS):
+            return 'idle'
+    for key in keys:
+        for stage, patterns in STAGE_RULES:
+            if any(pattern in key for pattern in patterns):
+                return stage
+    return 'other'
+
+
+def _label(frame):
+    name, path, line = frame
+    return f"{name} ({path}:{line})"
+
+
+class Profile:
+    """
+    Sampled stacks of a run, per worker, with their reports.
+
+    Use profile.sample() around in-process work, ProfiledCall for worker
+    processes (then add() their samples), and save() at the end.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.workers = {}  # worker id -> Counter of stacks
+
+    def add(self, worker, stacks):
+        self.workers.setdefault(worker, Counter()).update(stacks)
+
+    def unwrap(self, worker_result):
+        """
+        Records the samples of a ProfiledCall result and returns the job's own
+        result. Anything else (an exception yielded by SizeAwareScheduler.map
+        when the job raised or its worker died) is passed through unchanged.
+        """
+        if not isinstance(worker_result, Sampled):
+            return worker_result
+        worker, stacks, result = worker_result
+        self.add(worker, stacks)
+        return result
+
+    @contextmanager
+    def sample(self, worker="main"):
+        """Samples every thread of this process while the block runs."""
+        sampler = StackSampler(self.interval, all_threads=True).start()
+        try:
+            yield self
+        finally:
+            sampler.stop()
+            self.add(worker, sampler.counts)
+
+    def merged(self, include_idle=False):
+        total = Counter()
+        for stacks in self.workers.values():
+            total.update(stacks)
+        if not include_idle:
+            total = Counter({stack: n for stack, n in total.items() if stage_of(stack) != 'idle'})
+        return total
+
+    def write_collapsed(self, path):
+        """Brendan Gregg's collapsed format, stages as root frames."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, n in sorted(self.merged().items(), key=lambda item: -item[1]):
+                labels = [stage_of(stack)] + [_label(frame).replace(';', ',') for frame in stack]
+                f.write(f"{';'.join(labels)} {n}\n")
+
+    def write_speedscope(self, path):
+        """speedscope's file format: one sampled profile per worker, weights in seconds."""
+        frames, frame_ids = [], {}
+        profiles = []
+        for worker, stacks in sorted(self.workers.items()):
+            samples, weights = [], []
+            for stack, n in stacks.items():
+                if stage_of(stack) == 'idle':
+                    continue
+                ids = []
+                for frame in stack:
+                    if frame not in frame_ids:
+                        frame_ids[frame] = len(frames)
+                        frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+                    ids.append(frame_ids[frame])
+                samples.append(ids)
+                weights.append(n * self.interval)
+            profiles.append({'type': 'sampled', 'name': worker, 'unit': 'seconds', 'startValue': 0,
+                             'endValue': sum(weights), 'samples': samples, 'weights': weights})
+        document = {'$schema': 'https://www.speedscope.app/file-format-schema.json', 'exporter': 'dalas',
+                    'name': 'dalas profile', 'activeProfileIndex': 0,
+                    'shared': {'frames': frames}, 'profiles': profiles}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+
+    def stage_table(self, top=10):
+        """
+        Text table: time per stage, then its top functions by self time
+        (innermost frame) and by total time (anywhere in the stack).
+        """
+        merged = self.merged()
+        total = sum(merged.values())
+        if not total:
+            return "No samples (the run was shorter than the sampling interval?)"
+        by_stage = {}
+        for stack, n in merged.items():
+            by_stage.setdefault(stage_of(stack), Counter())[stack] += n
+        lines = [f"{total} samples, {total * self.interval:.2f}s of thread time, "
+                 f"{len(self.workers)} worker(s)"]
+        for stage, stacks in sorted(by_stage.items(), key=lambda item: -sum(item[1].values())):
+            n_stage = sum(stacks.values())
+            self_time, total_time = Counter(), Counter()
+            for stack, n in stacks.items():
+                self_time[stack[-1]] += n
+                for frame in set(stack):
+                    total_time[frame] += n
+            lines.append("")
+            lines.append(f"== {stage}: {n_stage * self.interval:.2f}s ({n_stage / total:.0%})")
+            lines.append(f"   {'self':>7} {'total':>7}  function")
+            for frame, n in self_time.most_common(top):
+                lines.append(f"   {n / total:7.1%} {total_time[frame] / total:7.1%}  {_label(frame)}")
+        return "\n".join(lines)
+
+    def save(self, output_dir, top=10):
+        """Writes the three reports to output_dir and prints the stage table."""
+        os.makedirs(output_dir, exist_ok=True)
+        self.write_collapsed(os.path.join(output_dir, "profile.collapsed"))
+        self.write_speedscope(os.path.join(output_dir, "profile.speedscope.json"))
+        table = self.stage_table(top)
+        with open(os.path.join(output_dir, "profile_top.txt"), 'w', encoding='utf-8') as f:
+            f.write(table + "\n")
+        print(table)
+        print(f"\nProfile written to {output_dir} (open profile.speedscope.json in https://www.speedscope.app)")
+
+
+if __name__ == '__main__':
+    from .analysis.scheduler import score_corpus
+    from .paths import PAINTINGS_DIR
+
+    profile = Profile()
+    with profile.sample():
+        score_corpus(PAINTINGS_DIR, os.devnull, ['warmth', 'colorfulness', 'texture'], workers=2,
+                     max_side=1024, profile=profile)
+    profile.save("profile")
@@ -0,0 +1,252 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .paths import PAINTINGS_DIR
+
+# Scores the three README pillars (Technique & Skill, Beauty & Aesthetics,
+# Story & Concept) from a configurable weighted graph:
+#
+#   signals  raw per-artwork values: image metrics (one decode per image for
+#            all of them), dimensions, techniques, biography, profile picture
+#   nodes    a transform of one signal to a 0-100 score (e.g. a Gaussian around
+#            a target brightness), with its parameters
+#   weights  aggregates (pillars, 'total') as weighted averages of nodes or
+#            other aggregates
+#
+# Only the signals reachable through non-zero weights are computed, each once;
+# re-weighting only redoes the weighted averages.
+
+
+# --- 1. Transforms (vectorised over the batch, NaN = missing) ---
+
+def gaussian(x, target, std):
+    """100 at target, falling off as a Gaussian (the 2.1.4 / 2.1.5 scoring)."""
+    return 100 * np.exp(-((x - target) ** 2) / (2 * std ** 2))
+
+
+def scaled(x, low, high):
+    """Linear map of [low, high] to [0, 100], clipped."""
+    return 100 * np.clip((x - low) / (high - low), 0, 1)
+
+
+def log_scaled(x, high):
+    """log(1 + x) mapped to [0, 100], reaching 100 at high. For counts and lengths."""
+    return 100 * np.clip(np.log1p(np.maximum(x, 0)) / np.log1p(high), 0, 1)
+
+
+def percentile(x):
+    """Percentile rank within the batch (0-100)."""
+    return pd.Series(x).rank(pct=True).to_numpy() * 100
+
+
+TRANSFORMS = {'gaussian': gaussian, 'scaled': scaled, 'log_scaled': log_scaled, 'percentile': percentile}
+
+
+# --- 2. Record signals (computed from the artworks DataFrame) ---
+
+def _dimension(df, axis):
+    """Width (0) or height (1) in cm, from width_cm / height_cm (store) or the scraped text."""
+    column = ('width_cm', 'height_cm')[axis]
+    if column in df.columns:
+        return df[column].to_numpy(dtype=float)
+    from .analysis.parsing import parse_artworks
+    return parse_artworks(df)[column].to_numpy(dtype=float)
+
+
+def _n_techniques(df):
+    from .analysis.tag_index import split_terms
+    return df['techniques'].map(lambda value: len(split_terms(value)) or np.nan).to_numpy(dtype=float)
+
+
+def _bio_length(df):
+    return df['biography'].map(
+        lambda text: len(text) if isinstance(text, str) and text != "N/A" else np.nan).to_numpy(dtype=float)
+
+
+def _face(df):
+    from .artist.profilepic import detect_face
+    # Artworks by the same artist share one picture: detect once per unique path
+    paths = df['profile_picture']
+    found = {path: detect_face(path) for path in paths.dropna().unique() if isinstance(path, str)}
+    return np.array([np.nan if found.get(path) is None else float(found[path]) for path in paths])
+
+
+# Signal name -> (function of the DataFrame, columns it needs)
+RECORD_SIGNALS = {
+    'area_cm2': (lambda df: _dimension(df, 0) * _dimension(df, 1), ()),
+    'n_techniques': (_n_techniques, ('techniques',)),
+    'bio_length': (_bio_length, ('biography',)),
+    'face': (_face, ('profile_picture',)),
+}
+
+# Node name -> (transform, signal, transform parameters). Any scalar metric of
+# feature_stream.METRICS can be used as a signal.
+DEFAULT_NODES = {
+    'brightness_fit': ('gaussian', 'brightness', {'target': 0.65, 'std': 0.25}),
+    'saturation_fit': ('gaussian', 'saturation', {'target': 0.6, 'std': 0.25}),
+    'colorfulness_score': ('scaled', 'colorfulness', {'low': 0, 'high': 110}),  # 109+ = "extremely colorful"
+    'harmony_score': ('scaled', 'harmony', {'low': 0, 'high': 1}),  # 0 = no better than a uniform hue spread
+    'thirds_score': ('scaled', 'thirds', {'low': 0, 'high': 1}),
+    'detail_score': ('percentile', 'gradient', {}),
+    'size_score': ('log_scaled', 'area_cm2', {'high': 20000}),
+    'technique_score': ('scaled', 'n_techniques', {'low': 1, 'high': 4}),
+    'bio_score': ('log_scaled', 'bio_length', {'high': 3000}),
+    'face_score': ('scaled', 'face', {'low': 0, 'high': 1}),
+}
+
+DEFAULT_WEIGHTS = {
+    'technique': {'detail_score': 1.0, 'size_score': 1.0, 'technique_score': 1.0},
+    'beauty': {'brightness_fit': 1.0, 'saturation_fit': 1.0, 'colorfulness_score': 1.0,
+               'harmony_score': 1.0, 'thirds_score': 1.0},
+    'story': {'bio_score': 1.0, 'face_score': 0.5},
+    'total': {'technique': 1.0, 'beauty': 1.0, 'story': 1.0},
+}
+
+
+class DalasScorer:
+    """
+    Scores a batch of artworks on the three pillars and a total.
+
+    Args:
+        artworks: DataFrame with one row per artwork: 'image_filename' (or
+            'image_path'), and as available 'Unframed Dimensions' or
+            width_cm / height_cm, 'techniques', 'biography', 'profile_picture'.
+            Signals whose columns are missing are NaN.
+        weights: Aggregate name -> {child: weight}; children are nodes or other
+            aggregates. Default: DEFAULT_WEIGHTS.
+        nodes: Node definitions (see DEFAULT_NODES), merged over the defaults.
+        image_dir: Directory of the image files.
+        max_side: Images are downscaled to this longest side for the image metrics.
+        cache: Optional PixelCache for the image decodes.
+
+    Example:
+        scorer = DalasScorer(df)
+        scores = scorer.score()                          # computes what the weights need
+        scorer.score({**DEFAULT_WEIGHTS, 'total': {'beauty': 1.0}})   # no recomputation
+    """
+
+    def __init__(self, artworks, weights=None, nodes=None, image_dir=PAINTINGS_DIR, max_side=512, cache=None):
+        self.artworks = artworks.reset_index(drop=True)
+        self.weights = weights or DEFAULT_WEIGHTS
+        self.nodes = {**DEFAULT_NODES, **(nodes or {})}
+        self.image_dir = image_dir
+        self.max_side = max_side
+        self.cache = cache
+        self.signals = {}       # signal name -> array (memoized)
+        self.node_values = {}   # (transform, signal, params) -> array (memoized)
+        self.errors = {}        # image path -> {metric: error}
+
+    def _image_paths(self):
+        if 'image_path' in self.artworks.columns:
+            return self.artworks['image_path'].tolist()
+        return [os.path.join(self.image_dir, name) if isinstance(name, str) else ''
+                for name in self.artworks['image_filename']]
+
+    def _compute_signals(self, names):
+        """Computes the missing signals; all image metrics come from one decode per image."""
+        from .color.feature_stream import METRICS as IMAGE_METRICS, iter_features
+
+        missing = [name for name in dict.fromkeys(names) if name not in self.signals]
+        image_metrics = [name for name in missing if name in IMAGE_METRICS]
+        n = len(self.artworks)
+        for name in missing:
+            if name in image_metrics:
+                continue
+            if name not in RECORD_SIGNALS:
+                raise ValueError(f"Unknown signal: {name}")
+            func, columns = RECORD_SIGNALS[name]
+            if all(column in self.artworks.columns for column in columns):
+                self.signals[name] = np.asarray(func(self.artworks), dtype=float)
+            else:
+                self.signals[name] = np.full(n, np.nan)
+
+        if image_metrics:
+            columns = {name: np.full(n, np.nan) for name in image_metrics}
+            results = iter_features(self._image_paths(), image_metrics, max_side=self.max_side, cache=self.cache)
+            for i, result in enumerate(results):
+                for name, value in result.values.items():
+                    if np.isscalar(value):
+                        columns[name][i] = value
+                if result.errors:
+                    self.errors[result.path] = result.errors
+            self.signals.update(columns)
+
+    def _node(self, name):
+        transform, signal, params = self.nodes[name]
+        key = (transform, signal, tuple(sorted(params.items())))
+        if key not in self.node_values:
+            self.node_values[key] = TRANSFORMS[transform](self.signals[signal], **params)
+        return self.node_values[key]
+
+    def required_nodes(self, weights=None, root='total'):
+        """Nodes reachable from root through non-zero weights (raises on unknown names or cycles)."""
+        weights = self.weights if weights is None else weights
+        needed, stack = [], []
+
+        def visit(name):
+            if name in self.nodes:
+                needed.append(name)
+                return
+            if name not in weights:
+                raise ValueError(f"'{name}' is neither a node nor an aggregate")
+            if name in stack:
+                raise ValueError(f"Cycle in the weight graph: {' -> '.join(stack + [name])}")
+            stack.append(name)
+            for child, weight in weights[name].items():
+                if weight:
+                    visit(child)
+            stack.pop()
+
+        visit(root)
+        return list(dict.fromkeys(needed))
+
+    def score(self, weights=None, root='total'):
+        """
+        Scores the batch (0-100). Missing values are left out of each weighted
+        average (the remaining weights are renormalised per artwork).
+
+        Args:
+            weights: Weight graph to use for this call (default: self.weights).
+                Only new signals or nodes are computed; the rest is reused.
+            root: Aggregate to evaluate (with every aggregate below it).
+
+        Returns:
+            A DataFrame with one column per aggregate, aligned with the artworks.
+        """
+        weights = self.weights if weights is None else weights
+        needed = self.required_nodes(weights, root)
+        self._compute_signals(self.nodes[name][1] for name in needed)
+
+        aggregates = {}
+
+        def value(name):
+            if name in self.nodes:
+                return self._node(name)
+            if name not in aggregates:
+                children = [(child, w) for child, w in weights[name].items() if w]
+                stacked = np.vstack([value(child) for child, _ in children])
+                w = np.array([w for _, w in children], dtype=float)[:, None] * ~np.isnan(stacked)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    aggregates[name] = np.nansum(stacked * w, axis=0) / w.sum(axis=0)
+            return aggregates[name]
+
+        value(root)
+        return pd.DataFrame(aggregates, index=self.artworks.index)
+
+    def node_scores(self):
+        """The computed 0-100 node scores as a DataFrame (for inspecting a score)."""
+        return pd.DataFrame({name: self._node(name) for name, (_, signal, _) in self.nodes.items()
+                             if signal in self.signals}, index=self.artworks.index)
+
+
+if __name__ == '__main__':
+    from .analysis.eda import load_artworks
+
+    df = load_artworks()
+    if df is not None:
+        df = df.drop_duplicates().reset_index(drop=True)
+        scorer = DalasScorer(df)
+        print(pd.concat([df[['title', 'artist']], scorer.score()], axis=1).sort_values('total', ascending=False).head(10))
+        print(scorer.score({**DEFAULT_WEIGHTS, 'total': {'beauty': 1.0}}).head())
@@ -0,0 +1,24 @@
+"""Artsper and Reddit /r/Art scrapers, the source-adapter crawl engine and the shared HTTP client."""
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'scrape_artwork_links': 'artworks_links',
+    'scrape_and_save_artwork_data': 'one_painting',
+    'process_artwork_range': 'process_artworks',
+    'scrape_artsper_with_selenium': 'selenium_scraper',
+    'scrape_subreddit': 'reddit',
+    'SourceAdapter': 'adapters',
+    'get_adapter': 'adapters',
+    'ArtsperAdapter': 'artsper',
+    'RedditAdapter': 'reddit',
+    'CrawlEngine': 'engine',
+    'WarcArchive': 'replay',
+    'replay_client': 'replay',
+    'HttpClient': 'http_client',
+    'AsyncHttpClient': 'http_client',
+    'get_client': 'http_client',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,85 @@
+import re
+
+# Characters that are not allowed in file names (as in one_painting.py).
+UNSAFE_FILENAME_RE = re.compile(r'[\\/*?:"<>|]')
+
+
+class SourceAdapter:
+    """
+    What a marketplace needs to tell the crawl engine (engine.CrawlEngine):
+    where its listings start, how to read listing and detail pages, and
+    where the image is. Everything else (concurrency, page cache, retries,
+    image download, storage) is shared.
+
+    Adapters never touch the network, so they can be tested offline against
+    saved pages: adapter.parse_detail(url, adapter.parse(open(...).read())).
+
+    Sources whose listing pages already hold the whole records (JSON APIs
+    such as Reddit's) set records_in_listing and implement
+    parse_listing_records() instead of parse_listing() / parse_detail():
+    the engine then only fetches listing pages and images.
+    """
+
+    name = None
+    records_in_listing = False
+    key_field = 'url'   # Column identifying a saved record, to resume a crawl
+    headers = None      # Request headers the source asks for (default: the client's)
+
+    def first_listing_url(self):
+        """URL of the first listing page of the crawl."""
+        raise NotImplementedError
+
+    def parse(self, content):
+        """Parses a downloaded page (bytes or str) into the document passed to the methods below."""
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(content, 'html.parser')
+
+    def parse_listing(self, url, doc):
+        """
+        Reads a listing page.
+
+        Returns:
+            (detail_urls, next_listing_url or None).
+        """
+        raise NotImplementedError
+
+    def parse_listing_records(self, url, doc):
+        """
+        Reads a listing page of a records_in_listing source.
+
+        Returns:
+            ([(record, image_url)], next_listing_url or None).
+        """
+        raise NotImplementedError
+
+    def parse_detail(self, url, doc):
+        """Reads a detail page into a record with the storage.ARTWORK_FIELDS keys."""
+        raise NotImplementedError
+
+    def image_url(self, url, doc):
+        """URL of the artwork image on a detail page, or None."""
+        raise NotImplementedError
+
+    def image_filename(self, record):
+        """File name the image is saved under: "<title>_<artist>_<year>.jpg"."""
+        parts = (UNSAFE_FILENAME_RE.sub("", str(record.get(key, ''))) for key in ('title', 'artist', 'year'))
+        return "_".join(parts) + ".jpg"
+
+
+# Adapters by name, filled by the modules defining them (see get_adapter).
+ADAPTERS = {}
+
+
+def register(adapter_cls):
+    """Class decorator adding an adapter to ADAPTERS under its name."""
+    ADAPTERS[adapter_cls.name] = adapter_cls
+    return adapter_cls
+
+
+def get_adapter(name, **kwargs):
+    """Instantiates a registered adapter by name ('artsper', ...)."""
+    from . import artsper, reddit  # noqa: F401  (registers the built-in adapters)
+
+    if name not in ADAPTERS:
+        raise ValueError(f"Unknown source: {name}. Available: {sorted(ADAPTERS)}")
+    return ADAPTERS[name](**kwargs)
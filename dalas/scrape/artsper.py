@@ -0,0 +1,126 @@
+import re
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+from .adapters import SourceAdapter, register
+
+ARTSPER_URL = "https://www.artsper.com"
+PAINTINGS_LISTING_URL = f"{ARTSPER_URL}/fr/oeuvres-d-art-contemporain/peinture"
+ARTWORK_LINK_RE = re.compile(r'/fr/oeuvres-d-art-contemporain/peinture/\d+/.+')
+
+
+@register
+class ArtsperAdapter(SourceAdapter):
+    """
+    Artsper paintings (the selectors of the original one_painting.py scraper).
+
+    Listing pages are "<listing_url>?page=N"; the crawl stops at the first
+    page without artwork links (Artsper answers 404 past the last page).
+    """
+
+    name = 'artsper'
+
+    def __init__(self, listing_url=PAINTINGS_LISTING_URL):
+        self.listing_url = listing_url
+
+    def first_listing_url(self):
+        return f"{self.listing_url}?page=1"
+
+    def parse_listing(self, url, doc):
+        links = list(dict.fromkeys(f"{ARTSPER_URL}{a['href']}" if a['href'].startswith('/') else a['href']
+                                   for a in doc.find_all('a', href=ARTWORK_LINK_RE)))
+        if not links:
+            return [], None
+        parts = urlsplit(url)
+        query = parse_qs(parts.query)
+        page = int(query.get('page', ['1'])[0])
+        query['page'] = [str(page + 1)]
+        return links, urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
+
+    def image_url(self, url, doc):
+        img_tag = doc.find('img', id='img-viar')
+        return img_tag.get('data-src') if img_tag else None
+
+    def parse_detail(self, url, doc):
+        artwork_data = {}  # Dictionary to store the scraped data
+
+        # --- 1. Title, Artist, and Year ---
+        title_tag = doc.find("title")
+        if title_tag:
+            title_text = title_tag.text.strip()
+            try:
+                # Attempt to extract year
+                year_part = title_text.split(",")[-1].split("|")[0].strip()
+                artwork_data['year'] = year_part if year_part.isdigit() else "Year Not Found"
+
+                name = title_text.split(",")[0].split('par')[0]
+                artwork_data['title'] = re.sub(r"[^a-zA-Z0-9\s]", "", name).strip()
+
+                artwork_data['artist'] = title_text.split(",")[0].split('par')[1].strip()
+            except (IndexError, ValueError):
+                artwork_data['year'] = "Year Extraction Failed"
+                artwork_data['title'] = "Title Extraction Failed"
+                artwork_data['artist'] = "Artist Extraction Failed"
+        else:
+            artwork_data['year'] = "Year Not Found"
+            artwork_data['title'] = "Title Not Found"
+            artwork_data['artist'] = "Artist Not Found"
+
+        # --- 2. Price ---
+        price_element = doc.select_one('div.top-information__price span.price.price__current.typography--bold')
+        artwork_data['price'] = price_element.text.strip() if price_element else "Price Not Found"
+
+        # --- 3. Techniques ---
+        techniques = []
+        for a_tag in doc.find_all('a', class_='pointer'):
+            if a_tag.get('data-infos') and 'peinturestcdsq' in a_tag['data-infos']:
+                if "Peinture" not in a_tag.text:  # Avoid the "Peinture:" label
+                    techniques.append(a_tag.text.strip().rstrip(','))
+        artwork_data['techniques'] = ", ".join(techniques) if techniques else "Techniques Not Found"
+
+        # --- 4. Dimensions, Support and Encadrement ---
+        artwork_data['Unframed Dimensions'] = 'Not Found'
+        for item in doc.find_all('div', class_='about__block__item'):
+            title_tag = item.find('p', class_='about__block__item__title')
+            if not title_tag:
+                continue
+            title = title_tag.get_text(strip=True)
+            description_tag = item.find('div', class_='about__block__item__description')
+            if "Dimensions" in title and description_tag:
+                cm_span = description_tag.find('span', class_='measure--cm')
+                if cm_span:
+                    artwork_data['Unframed Dimensions'] = cm_span.get_text(strip=True)
+                in_span = description_tag.find('span', class_='measure--inch')
+                if in_span:
+                    artwork_data['Unframed Dimensions (inch)'] = in_span.get_text(strip=True)
+            elif "Support" in title and description_tag:
+                a_tag = description_tag.find('a', class_='pointer',
+                                             attrs={'data-infos': lambda x: x and 'support-toile' in x})
+                artwork_data['support'] = a_tag.get_text(strip=True) if a_tag else 'Not Found'
+            elif "Encadrement" in title:
+                artwork_data['encadrement'] = description_tag.get_text(strip=True) if description_tag else 'Not Found'
+
+        # --- 5. Tags ---
+        tags = []
+        for tag in doc.find_all(['a', 'span'], class_='button'):
+            if tag.get('data-category') == 'Interaction' and tag.get('data-label') == 'Tags':
+                h3_tag = tag.find('h3', class_='typography__text')
+                if h3_tag:
+                    tags.append(h3_tag.get_text(strip=True))
+        artwork_data['tags'] = ", ".join(tags) if tags else "No Tags Found"
+
+        artwork_data['source'] = self.name
+        artwork_data['url'] = url
+        return artwork_data
+
+
+if __name__ == '__main__':
+    import os
+    from ..paths import ARTSPER_DIR
+
+    # Offline check against the saved artwork page
+    adapter = ArtsperAdapter()
+    with open(os.path.join(ARTSPER_DIR, 'tessts.txt'), encoding='utf-8') as f:
+        page = adapter.parse(f.read())
+    record = adapter.parse_detail(PAINTINGS_LISTING_URL + "/2300112/evasion", page)
+    print(record)
+    print(adapter.image_url(None, page), adapter.image_filename(record))
@@ -1,26 +1,35 @@
-import requests
-from bs4 import BeautifulSoup
 import csv
 import os
-import re
 import time
 
+from ..paths import ARTWORK_LINKS_CSV
 
-def scrape_artwork_links(base_url, output_csv="artwork_links.csv"):
+
+def scrape_artwork_links(base_url, output_csv=ARTWORK_LINKS_CSV, max_failed_pages=3):
     """
     Scrapes artwork links from a given Artsper base URL,
     incrementing the page number until a 404 error is encountered,
     saves the links to a CSV file after *each* page, and includes
     a delay between requests.
 
+    Transient errors are retried by the shared HTTP client; a page that still
+    fails is skipped, and the crawl stops after max_failed_pages failures in a row.
+
     Args:
         base_url: The base URL of the Artsper page to scrape.
         output_csv: The name of the CSV file.
+        max_failed_pages: Consecutive failed pages before giving up.
 
     Returns:
         None.
     """
+    import requests
+    from .artsper import ArtsperAdapter
+    from .http_client import CircuitOpenError, get_client
 
+    client = get_client()
+    adapter = ArtsperAdapter(base_url)
+    failed_pages = 0
     all_artworks = []  # List to store *all* scraped artwork links
     page_num = 1
     more_pages = True
@@ -43,22 +52,31 @@ def scrape_artwork_links(base_url, output_csv="artwork_links.csv"):
         print(f"Scraping page: {url}")
 
         try:
-            response = requests.get(url, timeout=10)
+            response = client.get(url)
             response.raise_for_status()
+            failed_pages = 0
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 print("404 Page Not Found. Stopping.")
                 more_pages = False
                 break
-            else:
-                print(f"Error fetching URL {url}: {e}")
-                return
-        except requests.exceptions.RequestException as e:
             print(f"Error fetching URL {url}: {e}")
+            failed_pages += 1
+        except CircuitOpenError as e:
+            print(f"Stopping: {e}")
             return
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching URL {url}: {e}")
+            failed_pages += 1
+        if failed_pages:
+            if failed_pages >= max_failed_pages:
+                print(f"{failed_pages} pages failed in a row. Stopping.")
+                return
+            print(f"  Skipping page {page_num} after retries.")
+            page_num += 1
+            continue
 
-        soup = BeautifulSoup(response.content, 'html.parser')
-        artwork_links = soup.find_all('a', href=re.compile(r'/fr/oeuvres-d-art-contemporain/peinture/\d+/.+'))
+        artwork_links, _ = adapter.parse_listing(url, adapter.parse(response.content))
 
         if not artwork_links:
             print("No more artwork links found.  Stopping.")
@@ -67,9 +85,7 @@ def scrape_artwork_links(base_url, output_csv="artwork_links.csv"):
 
         # --- Process and save links *for the current page* ---
         page_artworks = []  # List for *current page* links
-        for link in artwork_links:
-            href = link['href']
-            full_url = f"https://www.artsper.com{href}"
+        for full_url in artwork_links:
             page_artworks.append({'Link': full_url})
 
         if page_artworks:
@@ -90,6 +106,7 @@ def scrape_artwork_links(base_url, output_csv="artwork_links.csv"):
         time.sleep(2)  # 2-second delay (adjust as needed)
 
 
-# --- Example Usage ---
-base_url = "https://www.artsper.com/fr/oeuvres-d-art-contemporain/peinture"
-scrape_artwork_links(base_url)
\ No newline at end of file
+if __name__ == '__main__':
+    # --- Example Usage ---
+    base_url = "https://www.artsper.com/fr/oeuvres-d-art-contemporain/peinture"
+    scrape_artwork_links(base_url)
@@ -0,0 +1,264 @@
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from .storage import ARTWORK_FIELDS, SOURCE_FIELDS, append_records, existing_values
+
+
+class CrawlEngine:
+    """
+    Runs a SourceAdapter: follows its listing pages, scrapes detail pages on
+    a thread pool, downloads the images and appends the records to a CSV.
+
+    Requests go through the shared HttpClient (pooled connections, retries
+    with backoff, circuit breaker, global concurrency limit). Pages can be
+    cached on disk so re-parsing a crawl (e.g. after fixing a selector)
+    doesn't download anything again. Listing pages are never cached, since
+    they change as artworks are added and sold.
+
+    Sources whose listings hold the whole records (adapter.records_in_listing,
+    e.g. Reddit) skip the detail pages: crawl() then runs
+    crawl_listing_records() on an AsyncHttpClient instead.
+
+    Args:
+        adapter: A SourceAdapter.
+        output_csv: CSV the records are appended to.
+        image_dir: Directory the images are saved to.
+        workers: Detail pages scraped in parallel (requests in flight for
+            records_in_listing sources).
+        delay: Seconds each worker waits after a page (politeness).
+        cache_dir: Directory of cached pages (None = no cache).
+        client: HttpClient to use (default: the shared one).
+        fieldnames: Columns of a new output CSV.
+        derivatives: Optional analysis.derivatives.DerivativeWriter; every
+            saved image is queued to it (thumbnails etc. are made while the
+            crawl goes on). The caller closes it.
+    """
+
+    def __init__(self, adapter, output_csv, image_dir, workers=4, delay=0.0, cache_dir=None, client=None,
+                 fieldnames=ARTWORK_FIELDS + SOURCE_FIELDS, derivatives=None):
+        from .http_client import get_client
+
+        self.adapter = adapter
+        self.output_csv = output_csv
+        self.image_dir = image_dir
+        self.workers = workers
+        self.delay = delay
+        self.cache_dir = cache_dir
+        self.client = client or get_client()
+        self.fieldnames = fieldnames
+        self.derivatives = derivatives
+
+    def fetch(self, url, use_cache=True):
+        """
+        Page content (bytes), from the cache when possible.
+
+        Raises:
+            requests.exceptions.RequestException once retries are exhausted.
+        """
+        cache_path = None
+        if self.cache_dir and use_cache:
+            cache_path = os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + ".html")
+            if os.path.exists(cache_path):
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+        response = self.client.get(url)
+        response.raise_for_status()
+        if cache_path:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(f"{cache_path}.part", 'wb') as f:
+                f.write(response.content)
+            os.replace(f"{cache_path}.part", cache_path)
+        return response.content
+
+    def discover(self, max_pages=None, start_url=None):
+        """
+        Follows the listing pages and yields detail page URLs (each once).
+        Stops at the last page, on an HTTP error (Artsper answers 404 past the
+        end) or after max_pages pages.
+        """
+        import requests
+
+        url, n_pages, seen = start_url or self.adapter.first_listing_url(), 0, set()
+        while url and (max_pages is None or n_pages < max_pages):
+            try:
+                links, url = self.adapter.parse_listing(url, self.adapter.parse(self.fetch(url, use_cache=False)))
+            except requests.exceptions.RequestException as e:
+                print(f"Stopping discovery at {url}: {e}")
+                return
+            n_pages += 1
+            for link in links:
+                if link not in seen:
+                    seen.add(link)
+                    yield link
+            if self.delay:
+                time.sleep(self.delay)
+
+    def scrape_detail(self, url):
+        """
+        Scrapes one detail page and downloads its image (skipped if the file exists).
+
+        Returns:
+            The record, with 'image_filename' set to the saved file or to an
+            error marker, or None if the page itself could not be fetched.
+        """
+        import requests
+
+        try:
+            doc = self.adapter.parse(self.fetch(url))
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching URL {url}: {e}")
+            return None
+        record = self.adapter.parse_detail(url, doc)
+        image_url = self.adapter.image_url(url, doc)
+        if not image_url:
+            record['image_filename'] = "Image URL Not Found"
+        else:
+            image_filename = self.adapter.image_filename(record)
+            image_path = os.path.join(self.image_dir, image_filename)
+            try:
+                if not os.path.exists(image_path):
+                    os.makedirs(self.image_dir, exist_ok=True)
+                    self.client.download(image_url, image_path)
+                record['image_filename'] = image_filename
+                if self.derivatives is not None:
+                    self.derivatives.submit(image_path)
+            except requests.exceptions.RequestException as e:
+                print(f"Error downloading image: {e}")
+                record['image_filename'] = "Image Download Failed"
+            except OSError as e:
+                print(f"Error saving image: {e}")
+                record['image_filename'] = "Image Save Failed"
+        if self.delay:
+            time.sleep(self.delay)
+        return record
+
+    def run(self, urls, skip_existing=True):
+        """
+        Scrapes detail pages in parallel and appends each record as soon as it is done.
+
+        URLs are consumed lazily: at most two pages per worker are in flight,
+        so a long (or interrupted) crawl keeps everything finished so far.
+
+        Args:
+            urls: Iterable of detail page URLs (e.g. discover()).
+            skip_existing: Skip URLs already in the output CSV's 'url' column.
+
+        Returns:
+            (n_saved, n_failed). A page that can't be fetched or parsed counts
+            as failed and doesn't stop the crawl.
+        """
+        done = existing_values(self.output_csv, 'url') if skip_existing else set()
+        pending_urls = (url for url in urls if url not in done)
+        n_saved = n_failed = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            in_flight = {pool.submit(self.scrape_detail, url): url
+                         for url in islice(pending_urls, 2 * self.workers)}
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    url = in_flight.pop(future)
+                    try:
+                        record = future.result()
+                    except Exception as e:  # e.g. a parse error on a changed page layout
+                        print(f"Error scraping {url}: {e!r}")
+                        record = None
+                    if record is None:
+                        n_failed += 1
+                    else:
+                        append_records([record], self.output_csv, self.fieldnames)  # Only this thread writes
+                        n_saved += 1
+                        print(f"Saved {url}")
+                for url in islice(pending_urls, len(finished)):
+                    in_flight[pool.submit(self.scrape_detail, url)] = url
+        return n_saved, n_failed
+
+    async def _iter_listing_records(self, client, max_pages=None):
+        """
+        Follows the listing pages of a records_in_listing source (like discover()).
+
+        Yields:
+            The (record, image_url) pairs of each page.
+        """
+        import requests
+
+        url, n_pages = self.adapter.first_listing_url(), 0
+        while url and (max_pages is None or n_pages < max_pages):
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                items, url = self.adapter.parse_listing_records(url, self.adapter.parse(response.content))
+            except requests.exceptions.RequestException as e:
+                print(f"Stopping discovery at {url}: {e}")
+                return
+            n_pages += 1
+            yield items
+            if self.delay:
+                await asyncio.sleep(self.delay)
+
+    async def _save_record(self, client, record, image_url):
+        """Downloads one image, then appends its record (records are only written for saved images)."""
+        import requests
+
+        record['image_filename'] = self.adapter.image_filename(record)
+        image_path = os.path.join(self.image_dir, record['image_filename'])
+        if not os.path.exists(image_path):
+            try:
+                response = await client.get(image_url)
+                response.raise_for_status()
+                with open(f"{image_path}.part", 'wb') as f:
+                    f.write(response.content)
+                os.replace(f"{image_path}.part", image_path)
+            except (requests.exceptions.RequestException, OSError) as e:
+                print(f"Error downloading {image_url}: {e}")
+                return False
+        if self.derivatives is not None:
+            self.derivatives.submit(image_path)
+        append_records([record], self.output_csv, self.fieldnames)  # Only the event loop's thread writes
+        return True
+
+    async def crawl_listing_records(self, max_pages=None, skip_existing=True):
+        """
+        Crawls a records_in_listing source: while the images of one listing
+        page download concurrently, the next page is already being fetched.
+
+        Args:
+            max_pages: Listing pages to follow (default: all).
+            skip_existing: Skip records whose adapter.key_field value is
+                already in the output CSV.
+
+        Returns:
+            (n_saved, n_failed). A record whose image can't be saved counts as
+            failed and is not written, so resuming retries it.
+        """
+        from .http_client import AsyncHttpClient
+
+        os.makedirs(self.image_dir, exist_ok=True)
+        key = self.adapter.key_field
+        done = existing_values(self.output_csv, key) if skip_existing else set()
+        tasks = []
+        async with AsyncHttpClient(max_concurrency=self.workers, headers=self.adapter.headers) as client:
+            async for items in self._iter_listing_records(client, max_pages):
+                for record, image_url in items:
+                    if record[key] not in done:
+                        done.add(record[key])
+                        tasks.append(asyncio.create_task(self._save_record(client, record, image_url)))
+                print(f"Listed {len(tasks)} new records")
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):  # A failed record never stops the others
+                print(f"Error saving a record: {type(result).__name__}: {result}")
+        n_saved = sum(result is True for result in results)
+        return n_saved, len(results) - n_saved
+
+    def crawl(self, max_pages=None):
+        """
+        discover() then run(), or crawl_listing_records() for records_in_listing
+        sources: the whole source in one call. Returns (n_saved, n_failed).
+        """
+        if self.adapter.records_in_listing:
+            return asyncio.run(self.crawl_listing_records(max_pages))
+        return self.run(self.discover(max_pages))
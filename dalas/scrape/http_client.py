@@ -0,0 +1,419 @@
+"""
+Shared HTTP layer for the scrapers: one pooled session with retries,
+jittered exponential backoff (honouring Retry-After), a circuit breaker per
+host, a global concurrency limit and a response size limit.
+
+Errors are requests exceptions, so the scrapers' existing
+`except requests.exceptions.RequestException` handlers keep working, for the
+async client too.
+"""
+import asyncio
+import email.utils
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Statuses worth retrying: rate limiting and transient server errors.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; dalas-research-scraper)'}
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024  # Largest page or image we accept
+CHUNK_SIZE = 64 * 1024
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without touching the network while a host's circuit is open."""
+
+
+class ResponseTooLargeError(requests.exceptions.RequestException):
+    """The response body is larger than the client's max_bytes."""
+
+
+def backoff_delay(attempt, base=0.5, cap=30.0):
+    """'Full jitter' exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def retry_after(headers, cap=120.0):
+    """
+    Parses a Retry-After header (seconds or HTTP date).
+
+    Returns:
+        The delay in seconds (capped), or None if the header is absent or invalid.
+    """
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+    try:
+        return min(cap, max(0.0, float(value)))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+        return min(cap, max(0.0, when.timestamp() - time.time()))
+    except (TypeError, ValueError):
+        return None
+
+
+def _host(url):
+    return urlsplit(url).netloc.lower()
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After `threshold` consecutive failures (connection errors, 429 and 5xx)
+    a host's circuit opens and calls to it fail immediately for
+    `reset_timeout` seconds. Then one trial call is let through (half-open):
+    success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, threshold=5, reset_timeout=60.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._failures = {}   # host -> consecutive failures
+        self._opened = {}     # host -> time the circuit opened
+        self._trial = set()   # hosts with a half-open trial call running
+        self._lock = threading.Lock()
+
+    def allow(self, host):
+        """True if a call to host may go ahead (claims the trial slot when half-open)."""
+        with self._lock:
+            opened = self._opened.get(host)
+            if opened is None:
+                return True
+            if time.monotonic() - opened < self.reset_timeout or host in self._trial:
+                return False
+            self._trial.add(host)
+            return True
+
+    def record(self, host, success):
+        with self._lock:
+            self._trial.discard(host)
+            if success:
+                self._failures.pop(host, None)
+                self._opened.pop(host, None)
+                return
+            self._failures[host] = self._failures.get(host, 0) + 1
+            if self._failures[host] >= self.threshold:
+                self._opened[host] = time.monotonic()
+
+    def is_open(self, host):
+        with self._lock:
+            return host in self._opened
+
+
+class HttpClient:
+    """
+    Thread-safe pooled HTTP client.
+
+    Args:
+        max_retries: Retries after the first attempt (on RETRY_STATUSES and connection errors).
+        timeout: Per request timeout in seconds (or (connect, read)).
+        max_concurrency: Requests in flight across all threads.
+        max_bytes: Largest accepted response body.
+        backoff_base, backoff_cap: Backoff parameters (see backoff_delay).
+        breaker: A CircuitBreaker (a new one by default).
+    """
+
+    def __init__(self, max_retries=4, timeout=10, max_concurrency=8, max_bytes=DEFAULT_MAX_BYTES,
+                 backoff_base=0.5, backoff_cap=30.0, breaker=None, headers=None):
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_bytes = max_bytes
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.breaker = breaker or CircuitBreaker()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _check_size(self, response):
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit() and int(length) > self.max_bytes:
+            response.close()
+            raise ResponseTooLargeError(f"{response.url}: {length} bytes > {self.max_bytes}",
+                                        response=response)
+
+    def _iter_body(self, response):
+        """Streams the body, failing as soon as it exceeds max_bytes."""
+        received = 0
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            received += len(chunk)
+            if received > self.max_bytes:
+                response.close()
+                raise ResponseTooLargeError(f"{response.url}: more than {self.max_bytes} bytes",
+                                            response=response)
+            yield chunk
+
+    @contextmanager
+    def _open(self, method, url, **kwargs):
+        """
+        Sends a request with retries and yields the streaming response (the
+        body is not read yet), holding a concurrency slot until the block
+        ends, so body transfers count against max_concurrency too.
+        Non-retryable HTTP errors are yielded, not raised; the caller decides
+        with raise_for_status().
+
+        Every attempt is recorded in the circuit breaker: errors other than
+        connection errors and timeouts (too many redirects, invalid URL...)
+        count as failures and are raised at once.
+        """
+        host = _host(url)
+        kwargs.setdefault('timeout', self.timeout)
+        attempt = 0
+        while True:
+            if not self.breaker.allow(host):
+                raise CircuitOpenError(f"Circuit open for {host}: too many consecutive failures")
+            delay = None
+            self._slots.acquire()
+            try:
+                response = self.session.request(method, url, stream=True, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self._slots.release()
+                self.breaker.record(host, success=False)
+                if attempt >= self.max_retries:
+                    raise
+            except ResponseTooLargeError:
+                self._slots.release()
+                self.breaker.record(host, success=True)  # The host answered (see replay.record)
+                raise
+            except BaseException:
+                self._slots.release()
+                self.breaker.record(host, success=False)  # Frees a half-open trial slot too
+                raise
+            else:
+                failed = response.status_code in RETRY_STATUSES
+                self.breaker.record(host, success=not failed)
+                if not failed or attempt >= self.max_retries:
+                    try:
+                        self._check_size(response)
+                        yield response
+                    finally:
+                        response.close()
+                        self._slots.release()
+                    return
+                delay = retry_after(response.headers)
+                response.close()
+                self._slots.release()
+            if delay is None:
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_cap)
+            time.sleep(delay)
+            attempt += 1
+
+    def request(self, method, url, **kwargs):
+        """
+        Sends a request with retries and reads the whole body (within max_bytes).
+
+        Returns:
+            A requests.Response. Call raise_for_status() as with requests.get.
+
+        Raises:
+            requests.exceptions.RequestException (including CircuitOpenError and
+            ResponseTooLargeError) once the retries are exhausted.
+        """
+        with self._open(method, url, **kwargs) as response:
+            response._content = b"".join(self._iter_body(response))
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def download(self, url, path, **kwargs):
+        """
+        Streams a GET response to a file (within max_bytes). The file is written
+        to a temporary name first, so a failed download never leaves a truncated file.
+
+        Returns:
+            The number of bytes written.
+
+        Raises:
+            requests.exceptions.RequestException (HTTP errors included), OSError.
+        """
+        tmp_path = f"{path}.part"
+        try:
+            with self._open('GET', url, **kwargs) as response:
+                response.raise_for_status()
+                written = 0
+                with open(tmp_path, 'wb') as f:
+                    for chunk in self._iter_body(response):
+                        f.write(chunk)
+                        written += len(chunk)
+            os.replace(tmp_path, path)
+            return written
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncResponse(NamedTuple):
+    """Fully read response of AsyncHttpClient."""
+    url: str
+    status_code: int
+    headers: dict
+    content: bytes
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        import json
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+def _as_requests_error(url, error):
+    """The requests exception matching an aiohttp.ClientError (other than connection errors)."""
+    import aiohttp
+
+    message = f"{url}: {type(error).__name__}: {error}"
+    if isinstance(error, aiohttp.ClientPayloadError):
+        return requests.exceptions.ChunkedEncodingError(message)
+    if isinstance(error, aiohttp.TooManyRedirects):
+        return requests.exceptions.TooManyRedirects(message)
+    if isinstance(error, aiohttp.InvalidURL):
+        return requests.exceptions.InvalidURL(message)
+    if isinstance(error, aiohttp.ClientResponseError):
+        return requests.exceptions.HTTPError(message)
+    return requests.exceptions.RequestException(message)
+
+
+class AsyncHttpClient:
+    """
+    asyncio counterpart of HttpClient (needs aiohttp), with the same retry,
+    backoff, circuit breaking and size rules. Use as `async with AsyncHttpClient() as client`.
+    """
+
+    def __init__(self, max_retries=4, timeout=10, max_concurrency=8, max_bytes=DEFAULT_MAX_BYTES,
+                 backoff_base=0.5, backoff_cap=30.0, breaker=None, headers=None):
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_bytes = max_bytes
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.breaker = breaker or CircuitBreaker()
+        self.headers = headers or DEFAULT_HEADERS
+        self.session = None
+        self._slots = None
+
+    async def __aenter__(self):
+        import aiohttp
+
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self.session = aiohttp.ClientSession(
+            headers=self.headers, timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency))
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    async def _read(self, response):
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit() and int(length) > self.max_bytes:
+            raise ResponseTooLargeError(f"{response.url}: {length} bytes > {self.max_bytes}")
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            body += chunk
+            if len(body) > self.max_bytes:
+                raise ResponseTooLargeError(f"{response.url}: more than {self.max_bytes} bytes")
+        return bytes(body)
+
+    async def request(self, method, url, **kwargs):
+        """
+        Sends a request with retries and reads the body (within the
+        concurrency slot, like HttpClient).
+
+        Returns:
+            An AsyncResponse (call raise_for_status() on it).
+
+        Raises:
+            requests.exceptions.RequestException subclasses only: HTTPError,
+            CircuitOpenError, ResponseTooLargeError, the conversions of
+            aiohttp errors (see _as_requests_error) and, once the retries are
+            exhausted, requests.exceptions.ConnectionError.
+        """
+        import aiohttp
+
+        host = _host(url)
+        attempt = 0
+        while True:
+            if not self.breaker.allow(host):
+                raise CircuitOpenError(f"Circuit open for {host}: too many consecutive failures")
+            delay = None
+            try:
+                async with self._slots:
+                    async with self.session.request(method, url, **kwargs) as response:
+                        failed = response.status in RETRY_STATUSES
+                        if failed and attempt < self.max_retries:
+                            delay = retry_after(response.headers)
+                        else:
+                            result = AsyncResponse(str(response.url), response.status,
+                                                   dict(response.headers), await self._read(response))
+                self.breaker.record(host, success=not failed)
+                if not failed or attempt >= self.max_retries:
+                    return result
+            except ResponseTooLargeError:
+                self.breaker.record(host, success=not failed)  # The host answered, as in HttpClient
+                raise
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self.breaker.record(host, success=False)
+                if attempt >= self.max_retries:
+                    raise requests.exceptions.ConnectionError(f"{url}: {type(e).__name__}: {e}") from e
+            except aiohttp.ClientError as e:  # Payload, redirect, invalid URL...: not retried
+                self.breaker.record(host, success=False)
+                raise _as_requests_error(url, e) from e
+            except BaseException:
+                self.breaker.record(host, success=False)  # Frees a half-open trial slot too
+                raise
+            if delay is None:
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_cap)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_client():
+    """The process-wide HttpClient shared by the scrapers (created on first use)."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
+
+
+if __name__ == '__main__':
+    response = get_client().get("https://www.artsper.com/fr/oeuvres-d-art-contemporain/peinture")
+    print(response.status_code, len(response.content), "bytes")
@@ -0,0 +1,36 @@
+from ..paths import ARTWORK_CSV, PAINTINGS_DIR
+
+
+def scrape_and_save_artwork_data(url, output_csv=ARTWORK_CSV, image_dir=PAINTINGS_DIR):
+    """
+    Scrapes artwork data from an Artsper URL, saves it to a CSV file,
+    and downloads the associated image.
+
+    The page selectors live in artsper.ArtsperAdapter and the fetching,
+    download and storage in engine.CrawlEngine; this is the one-page entry point.
+
+    Args:
+        url: The URL of the artwork page on Artsper.
+        output_csv: The name of the CSV file to save the data to.
+        image_dir: The name of the directory to save the images to.
+
+    Returns:
+        None.  Prints status messages to the console.
+    """
+    from .artsper import ArtsperAdapter
+    from .engine import CrawlEngine
+    from .storage import append_records
+
+    record = CrawlEngine(ArtsperAdapter(), output_csv, image_dir).scrape_detail(url)
+    if record is None:
+        return
+    try:
+        append_records([record], output_csv)
+        print(f"Data appended to: {output_csv}")
+    except OSError as e:
+        print(f"Unable to write csv file: {e}")
+
+if __name__ == '__main__':
+    # Example usage (you would loop over a list of URLs in a real application)
+    scrape_and_save_artwork_data("https://www.artsper.com/fr/oeuvres-d-art-contemporain/peinture/2300112/evasion") #Example 1
+    # scrape_and_save_artwork_data("https://www.artsper.com/fr/oeuvres-d-art-contemporain/peinture/2272663/discogolf")  # Example 2
@@ -1,15 +1,16 @@
 import csv
 import os
-import time  # Import the time module
-# Assuming scrape_and_save_artwork_data is in a separate file called 'scraper.py'
-import one_painting  # Import your scraping function
 
+from ..paths import ARTWORK_CSV, ARTWORK_LINKS_CSV, PAINTINGS_DIR
 
-def process_artwork_range(csv_file, start_index, end_index, output_csv="artwork_data.csv", image_dir="Paintings"):
+
+def process_artwork_range(csv_file, start_index, end_index, output_csv=ARTWORK_CSV, image_dir=PAINTINGS_DIR,
+                          workers=1, delay=2.0):
     """
     Processes a range of artwork links from a CSV file, scraping data for each
-    link and saving it using the scrape_and_save_artwork_data function, with
-    a delay between processing each artwork.
+    link with the shared crawl engine (engine.CrawlEngine + artsper.ArtsperAdapter),
+    with a delay between processing each artwork. Links already in output_csv
+    are skipped, so an interrupted range can be resumed.
 
     Args:
         csv_file: Path to the CSV file containing artwork links.
@@ -17,6 +18,8 @@ def process_artwork_range(csv_file, start_index, end_index, output_csv="artwork_
         end_index: The ending index (inclusive) of the links to process.
         output_csv: The CSV for output.
         image_dir: The image directory
+        workers: Artworks scraped in parallel.
+        delay: Seconds each worker waits between artworks.
 
     Returns:
         None. Prints status messages.
@@ -41,11 +44,13 @@ def process_artwork_range(csv_file, start_index, end_index, output_csv="artwork_
         end_index = min(end_index, len(links))
 
 
-        for i in range(start_index - 1, end_index):  # Adjust indices for 0-based list
-            url = links[i]
-            print(f"Processing artwork {i + 1} of {end_index}: {url}")
-            one_painting.scrape_and_save_artwork_data(url, output_csv, image_dir)  # Call scraper function
-            time.sleep(2)  # Add a 2-second delay (adjust as needed)
+        from .artsper import ArtsperAdapter
+        from .engine import CrawlEngine
+
+        print(f"Processing artworks {start_index} to {end_index}")
+        engine = CrawlEngine(ArtsperAdapter(), output_csv, image_dir, workers=workers, delay=delay)
+        n_saved, n_failed = engine.run(links[start_index - 1:end_index])  # Adjust indices for 0-based list
+        print(f"Saved {n_saved} artworks ({n_failed} failed) to {output_csv}")
 
 
     except FileNotFoundError:
@@ -56,10 +61,7 @@ def process_artwork_range(csv_file, start_index, end_index, output_csv="artwork_
         print(f"An unexpected error occurred {e}")
 
 
-
-# --- Example Usage ---
-# Assuming you have a file named 'artwork_links.csv'
-# and 'scraper.py' contains the scrape_and_save_artwork_data function.
-
-#Create the scraper.py and put def scrape_and_save_artwork_data(url, output_csv="artwork_data.csv", image_dir="Paintings"): from the previous response
-process_artwork_range('artwork_links.csv', 1, 1000)  # Process the first 5 artworks
\ No newline at end of file
+if __name__ == '__main__':
+    # --- Example Usage ---
+    # Assuming you have scraped the links into artwork_links.csv (see artworks_links.py)
+    process_artwork_range(ARTWORK_LINKS_CSV, 1, 1000)  # Process the first 1000 artworks
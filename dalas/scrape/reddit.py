@@ -0,0 +1,152 @@
+import asyncio
+import html
+import json
+import os
+import re
+from urllib.parse import urlencode
+
+from .adapters import SourceAdapter, register
+from ..paths import REDDIT_CSV, REDDIT_IMAGES_DIR
+
+REDDIT_URL = "https://www.reddit.com"
+USER_AGENT = "python:dalas-art-research:v1.0 (research scraper)"  # Reddit asks for a descriptive agent
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+# /r/Art titles follow the rule "Title, Artist, Medium, Year" (the medium may contain commas).
+TITLE_RE = re.compile(r"^\s*(?P<title>[^,]+),\s*(?P<artist>[^,]+),\s*(?P<medium>.+),\s*(?P<year>\d{4})\s*$")
+
+
+def image_url(post):
+    """Direct image URL of a listing post, or None (videos, galleries, links)."""
+    url = post.get('url_overridden_by_dest') or post.get('url') or ''
+    if post.get('is_video') or post.get('is_gallery'):
+        return None
+    if url.lower().split('?')[0].endswith(IMAGE_EXTENSIONS):
+        return url
+    try:  # Fall back to the full size preview Reddit generates
+        return html.unescape(post['preview']['images'][0]['source']['url'])
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def parse_post(post):
+    """
+    Converts a /r/Art listing post (the 'data' of a listing child) to an
+    artwork record with the artwork_data.csv columns plus source columns.
+
+    Returns:
+        A dictionary, or None if the post has no image.
+    """
+    url = image_url(post)
+    if not url:
+        return None
+    match = TITLE_RE.match(html.unescape(post.get('title', '')))
+    fields = match.groupdict() if match else {'title': html.unescape(post.get('title', '')).strip(),
+                                              'artist': '', 'medium': '', 'year': ''}
+    artist = fields['artist'].strip()
+    if not artist or artist.lower() in ('me', 'myself', 'i', 'moi'):
+        artist = post.get('author', '')
+    extension = os.path.splitext(url.split('?')[0])[1].lower() or '.jpg'
+    score = int(post.get('score') or 0)
+    return {
+        'year': fields['year'],
+        'title': fields['title'].strip(),
+        'artist': artist,
+        'techniques': fields['medium'].strip(),
+        'tags': post.get('link_flair_text') or '',
+        'image_filename': f"{score}_{post['id']}{extension}",  # Named by upvote count
+        'source': 'reddit',
+        'source_id': post['id'],
+        'url': url,
+        'upvotes': score,
+    }
+
+
+@register
+class RedditAdapter(SourceAdapter):
+    """
+    Image posts of a subreddit, from Reddit's JSON listing API ('after'
+    cursor). Listings hold the whole posts, so there are no detail pages;
+    records are keyed by post id and images named by upvote count.
+
+    Args:
+        subreddit: Subreddit name.
+        sort: Listing ('top', 'hot', 'new', ...).
+        time_filter: Period of 'top' listings ('all', 'year', 'month', ...).
+        limit: Posts per listing page (at most 100).
+        base_url: Reddit root URL (point it to a local stand-in server for tests).
+    """
+
+    name = 'reddit'
+    records_in_listing = True
+    key_field = 'source_id'
+    headers = {'User-Agent': USER_AGENT}
+
+    def __init__(self, subreddit="Art", sort="top", time_filter="all", limit=100, base_url=REDDIT_URL):
+        self.subreddit = subreddit
+        self.sort = sort
+        self.time_filter = time_filter
+        self.limit = limit
+        self.base_url = base_url
+
+    def _listing_url(self, after=None):
+        params = {'limit': self.limit, 't': self.time_filter, 'raw_json': 1}
+        if after:
+            params['after'] = after
+        return f"{self.base_url}/r/{self.subreddit}/{self.sort}.json?{urlencode(params)}"
+
+    def first_listing_url(self):
+        return self._listing_url()
+
+    def parse(self, content):
+        return json.loads(content)
+
+    def parse_listing_records(self, url, doc):
+        listing = doc['data']
+        records = (parse_post(child['data']) for child in listing.get('children', []))
+        after = listing.get('after')
+        return [(record, record['url']) for record in records if record], after and self._listing_url(after)
+
+    def image_filename(self, record):
+        return record['image_filename']
+
+
+async def scrape_subreddit_async(subreddit="Art", sort="top", time_filter="all", pages=5,
+                                 output_csv=REDDIT_CSV, image_dir=REDDIT_IMAGES_DIR,
+                                 base_url=REDDIT_URL, max_concurrency=8, derivatives=None):
+    """
+    Scrapes image posts of a subreddit with their upvote counts: RedditAdapter
+    run by CrawlEngine.crawl_listing_records().
+
+    While the images of one listing page download concurrently, the next page
+    is already being fetched. Posts already in output_csv are skipped, so an
+    interrupted crawl can be resumed.
+
+    Args:
+        subreddit, sort, time_filter, base_url: See RedditAdapter.
+        pages: Maximum number of listing pages (100 posts each).
+        output_csv: CSV the records are appended to (artwork_data.csv columns
+            plus source, source_id, url and upvotes).
+        image_dir: Directory the images are saved to, as "<upvotes>_<post id>.<ext>".
+        max_concurrency: Requests in flight at once.
+        derivatives: Optional analysis.derivatives.DerivativeWriter each saved
+            image is queued to (closed by the caller).
+
+    Returns:
+        (n_saved, n_failed).
+    """
+    from .engine import CrawlEngine
+
+    adapter = RedditAdapter(subreddit, sort, time_filter, base_url=base_url)
+    engine = CrawlEngine(adapter, output_csv, image_dir, workers=max_concurrency, derivatives=derivatives)
+    return await engine.crawl_listing_records(pages)
+
+
+def scrape_subreddit(*args, **kwargs):
+    """Synchronous wrapper of scrape_subreddit_async (same arguments)."""
+    return asyncio.run(scrape_subreddit_async(*args, **kwargs))
+
+
+if __name__ == '__main__':
+    n_saved, n_failed = scrape_subreddit("Art", sort="top", time_filter="month", pages=2)
+    print(f"Saved {n_saved} posts ({n_failed} failed) to {REDDIT_CSV}")
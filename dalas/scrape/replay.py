@@ -0,0 +1,381 @@
+"""
+Record / replay of scraper traffic, for testing and load-testing the
+scrapers without touching the live sites.
+
+- WarcArchive: HTTP responses (pages and images) stored as WARC 1.0
+  'response' records in one append-only file, readable by standard WARC tools.
+- RecordingAdapter: a requests transport adapter that saves every response
+  it receives to an archive (mount it with record()).
+- ReplayAdapter: a transport adapter serving the archive instead of the
+  network, with configurable latency, injected HTTP errors and dropped
+  connections (see replay_client()).
+- serve(): the same replay as a local HTTP server, for clients that don't
+  use requests (aiohttp, a browser) or run in other processes.
+
+Faults are drawn from a seeded generator, so a replayed crawl with errors
+is reproducible.
+"""
+import io
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.client import responses as HTTP_REASONS
+from urllib.parse import urlsplit
+
+# Headers that describe the transfer, not the stored (already decoded) body.
+_TRANSFER_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection'}
+
+
+def _request_target(url):
+    """Path and query of a URL (what a server sees in its request line)."""
+    parts = urlsplit(url)
+    return (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+
+class WarcArchive:
+    """
+    Append-only archive of HTTP responses in WARC 1.0 format.
+
+    The index (URL -> position of its last record) is built by one scan of
+    the file and kept up to date by write(), so lookups never rescan.
+    Writes from several threads are serialized.
+
+    Args:
+        path: Archive file (created on the first write).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._index = None
+
+    def _scan(self):
+        index = {}
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return index
+        with f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                if not line.startswith(b'WARC/'):
+                    raise ValueError(f"{self.path}: no WARC record at offset {offset}")
+                headers = {}
+                for line in iter(f.readline, b'\r\n'):
+                    if not line:
+                        raise ValueError(f"{self.path}: truncated record at offset {offset}")
+                    name, _, value = line.decode('utf-8').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers['content-length'])
+                if headers.get('warc-type') == 'response':
+                    index[headers['warc-target-uri']] = (f.tell(), length)
+                f.seek(length + 4, io.SEEK_CUR)  # Block, then the record's closing \r\n\r\n
+        return index
+
+    @property
+    def index(self):
+        with self._lock:
+            if self._index is None:
+                self._index = self._scan()
+            return self._index
+
+    def urls(self):
+        return list(self.index)
+
+    def __contains__(self, url):
+        return url in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def write(self, url, status, headers, body, reason=None):
+        """
+        Appends a response record (a later record of the same URL replaces it).
+
+        Args:
+            url: Requested URL.
+            status: HTTP status code.
+            headers: Response headers (mapping); transfer headers are dropped
+                since the stored body is already decoded.
+            body: Response body (bytes).
+            reason: Reason phrase (default: the standard one).
+        """
+        lines = [f"HTTP/1.1 {status} {reason or HTTP_REASONS.get(status, '')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items() if name.lower() not in _TRANSFER_HEADERS]
+        lines.append(f"Content-Length: {len(body)}")
+        block = ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1', errors='replace') + body
+        record_headers = (
+            "WARC/1.0\r\n"
+            "WARC-Type: response\r\n"
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+            f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            "Content-Type: application/http; msgtype=response\r\n"
+            f"Content-Length: {len(block)}\r\n\r\n"
+        ).encode('utf-8')
+        index = self.index
+        with self._lock:
+            with open(self.path, 'ab') as f:
+                offset = f.tell() + len(record_headers)
+                f.write(record_headers + block + b"\r\n\r\n")
+            index[url] = (offset, len(block))
+
+    def read(self, url):
+        """
+        Returns:
+            (status, reason, headers dict, body) of the URL's last record, or None.
+        """
+        position = self.index.get(url)
+        if position is None:
+            return None
+        offset, length = position
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            block = f.read(length)
+        head, _, body = block.partition(b"\r\n\r\n")
+        status_line, *header_lines = head.decode('latin-1').split("\r\n")
+        _, status, reason = (status_line.split(' ', 2) + [''])[:3]
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(':')
+            headers[name.strip()] = value.strip()
+        return int(status), reason, headers, body
+
+
+# --- 1. Recording ---
+
+def _recording_adapter_class():
+    from requests.adapters import HTTPAdapter
+
+    class RecordingAdapter(HTTPAdapter):
+        """HTTPAdapter saving every response it receives to a WarcArchive (within the client's max_bytes)."""
+
+        def __init__(self, archive, client, **kwargs):
+            self.archive = archive
+            self.client = client
+            super().__init__(**kwargs)
+
+        def send(self, request, **kwargs):
+            response = super().send(request, **kwargs)
+            # Reading the body here keeps it in memory for the caller: iter_content()
+            # then serves the read bytes. The client's size checks apply, so an
+            # oversized body raises ResponseTooLargeError before it is buffered.
+            self.client._check_size(response)
+            response._content = b"".join(self.client._iter_body(response))
+            self.archive.write(request.url, response.status_code, response.headers, response.content,
+                               response.reason)
+            return response
+
+    return RecordingAdapter
+
+
+def record(client, archive_path):
+    """
+    Makes an HttpClient save every response to a WARC archive (appending).
+    Retried attempts are recorded too; the last one wins on replay.
+    Bodies over the client's max_bytes raise ResponseTooLargeError and are not recorded.
+
+    Returns:
+        The WarcArchive.
+    """
+    archive = WarcArchive(archive_path)
+    adapter = _recording_adapter_class()(archive, client, pool_connections=client.max_concurrency,
+                                         pool_maxsize=client.max_concurrency)
+    client.session.mount('http://', adapter)
+    client.session.mount('https://', adapter)
+    return archive
+
+
+# --- 2. Replay ---
+
+class FaultInjector:
+    """
+    Latency and failures of a replay, drawn from a seeded generator.
+
+    Args:
+        latency: Seconds added to every response.
+        jitter: Extra latency, uniform in [0, jitter].
+        error_rate: Probability of answering error_status instead of the record.
+        error_status: Injected HTTP status (503 exercises the clients' retries).
+        drop_rate: Probability of a dropped connection.
+        seed: Seed of the generator (None = not reproducible).
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, drop_rate=0.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.drop_rate = drop_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {'served': 0, 'missing': 0, 'errors': 0, 'dropped': 0}
+
+    def draw(self):
+        """Sleeps the latency, then returns 'drop', 'error' or None (serve the record)."""
+        with self._lock:
+            delay = self.latency + self.jitter * self._random.random()
+            roll = self._random.random()
+        if delay:
+            time.sleep(delay)
+        if roll < self.drop_rate:
+            return 'drop'
+        if roll < self.drop_rate + self.error_rate:
+            return 'error'
+        return None
+
+    def count(self, outcome):
+        with self._lock:
+            self.stats[outcome] += 1
+
+
+def _lookup(archive, faults, url):
+    """(status, reason, headers, body) to answer for a URL, or None for a dropped connection."""
+    outcome = faults.draw()
+    if outcome == 'drop':
+        faults.count('dropped')
+        return None
+    if outcome == 'error':
+        faults.count('errors')
+        return faults.error_status, HTTP_REASONS.get(faults.error_status, ''), {'Retry-After': '0'}, b''
+    entry = archive.read(url)
+    if entry is None:
+        faults.count('missing')
+        return 404, 'Not Found', {'Content-Type': 'text/plain'}, b'Not in archive'
+    faults.count('served')
+    return entry
+
+
+def _replay_adapter_class():
+    import requests
+    from requests.adapters import BaseAdapter
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+
+    class ReplayAdapter(BaseAdapter):
+        """requests transport adapter answering from a WarcArchive (see FaultInjector for the options)."""
+
+        def __init__(self, archive, faults):
+            super().__init__()
+            self.archive = archive
+            self.faults = faults
+
+        def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+            entry = _lookup(self.archive, self.faults, request.url)
+            if entry is None:
+                raise requests.exceptions.ConnectionError(f"Injected dropped connection: {request.url}",
+                                                          request=request)
+            status, reason, headers, body = entry
+            response = requests.Response()
+            response.status_code = status
+            response.reason = reason
+            response.headers = CaseInsensitiveDict(headers)
+            response.headers['Content-Length'] = str(len(body))
+            response.encoding = get_encoding_from_headers(response.headers)
+            response.raw = io.BytesIO(body)
+            response.url = request.url
+            response.request = request
+            response.connection = self
+            return response
+
+        def close(self):
+            pass
+
+    return ReplayAdapter
+
+
+def replay_client(archive_path, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, drop_rate=0.0,
+                  seed=0, **client_kwargs):
+    """
+    An HttpClient answering from a WARC archive instead of the network.
+    URLs missing from the archive get a 404.
+
+    Args:
+        archive_path: Archive written by record().
+        latency, jitter, error_rate, error_status, drop_rate, seed: See FaultInjector.
+        **client_kwargs: HttpClient arguments (e.g. backoff_base=0 for fast retries).
+
+    Returns:
+        The client; its fault statistics are in client.faults.stats.
+    """
+    from .http_client import HttpClient
+
+    client = HttpClient(**client_kwargs)
+    client.faults = FaultInjector(latency, jitter, error_rate, error_status, drop_rate, seed)
+    adapter = _replay_adapter_class()(WarcArchive(archive_path), client.faults)
+    client.session.mount('http://', adapter)
+    client.session.mount('https://', adapter)
+    return client
+
+
+def serve(archive_path, host='127.0.0.1', port=8000, latency=0.0, jitter=0.0, error_rate=0.0,
+          error_status=503, drop_rate=0.0, seed=0):
+    """
+    Starts an HTTP server replaying a WARC archive (in a background thread).
+
+    Requests are matched on path and query only, so records of several hosts
+    (e.g. pages and media servers) are served from one address; point the
+    scraper's base URL to it. A dropped connection closes the socket without
+    answering.
+
+    Returns:
+        The server (server.faults.stats, server.shutdown()).
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    archive = WarcArchive(archive_path)
+    targets = {_request_target(url): url for url in archive.urls()}
+    faults = FaultInjector(latency, jitter, error_rate, error_status, drop_rate, seed)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            entry = _lookup(archive, faults, targets.get(self.path, self.path))
+            if entry is None:
+                self.close_connection = True
+                return
+            status, reason, headers, body = entry
+            self.send_response(status, reason)
+            for name, value in headers.items():
+                if name.lower() not in _TRANSFER_HEADERS:
+                    self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.faults = faults
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    import os
+    import tempfile
+    from .artsper import ArtsperAdapter
+    from .engine import CrawlEngine
+    from ..paths import ARTSPER_DIR
+
+    # Replay the saved artwork page through the crawl engine, with 20% injected 503s
+    url = "https://www.artsper.com/fr/oeuvres-d-art-contemporain/peinture/2300112/evasion"
+    work_dir = tempfile.mkdtemp()
+    archive = WarcArchive(os.path.join(work_dir, "artsper.warc"))
+    with open(os.path.join(ARTSPER_DIR, 'tessts.txt'), 'rb') as f:
+        archive.write(url, 200, {'Content-Type': 'text/html; charset=utf-8'}, f.read())
+    archive.write("https://media.artsper.com/artwork/2300112_1_l.jpg", 200, {'Content-Type': 'image/jpeg'},
+                  b'\xff\xd8\xff\xe0 not a real image')
+
+    client = replay_client(archive.path, latency=0.05, error_rate=0.2, backoff_base=0.01)
+    engine = CrawlEngine(ArtsperAdapter(), os.path.join(work_dir, "data.csv"), work_dir, client=client)
+    print(engine.scrape_detail(url))
+    print(client.faults.stats)
@@ -1,8 +1,3 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import re
 import json
 
@@ -16,6 +11,14 @@ def scrape_artsper_with_selenium(url):
     Returns:
         A dictionary containing the artwork details, or None on failure.
     """
+    # Imported here: selenium (and bs4) are slow to import and only this scraper needs them.
+    from bs4 import BeautifulSoup
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
     driver = webdriver.Chrome()  # Or webdriver.Firefox(), etc.
     try:
         driver.get(url)
@@ -141,11 +144,12 @@ def scrape_artsper_with_selenium(url):
     finally:
         driver.quit()
 
-# --- Example Usage ---
-artsper_url = "https://www.artsper.com/fr/oeuvres-d-art-contemporain/peinture/2300112/evasion"
-result = scrape_artsper_with_selenium(artsper_url)
+if __name__ == '__main__':
+    # --- Example Usage ---
+    artsper_url = "https://www.artsper.com/fr/oeuvres-d-art-contemporain/peinture/2300112/evasion"
+    result = scrape_artsper_with_selenium(artsper_url)
 
-if result:
-    print(result)
-else:
-    print("Could not extract information from the URL.")
\ No newline at end of file
+    if result:
+        print(result)
+    else:
+        print("Could not extract information from the URL.")
@@ -0,0 +1,64 @@
+import csv
+import os
+
+# Columns of artwork_data.csv, as written by one_painting.py.
+ARTWORK_FIELDS = ['year', 'title', 'artist', 'price', 'techniques', 'Unframed Dimensions',
+                  'Unframed Dimensions (inch)', 'tags', 'support', 'encadrement', 'image_filename']
+
+# Extra columns of sources with popularity data (e.g. Reddit upvotes).
+SOURCE_FIELDS = ['source', 'source_id', 'url', 'upvotes']
+
+
+def _add_columns(output_csv, header, columns):
+    """Rewrites a CSV with extra (empty) columns at the end of its header. Returns the new header."""
+    header = header + columns
+    tmp = f"{output_csv}.part"
+    with open(output_csv, 'r', newline='', encoding='utf-8') as src, \
+            open(tmp, 'w', newline='', encoding='utf-8') as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst)
+        next(reader)
+        writer.writerow(header)
+        for row in reader:
+            writer.writerow(row + [''] * (len(header) - len(row)))
+    os.replace(tmp, output_csv)
+    return header
+
+
+def append_records(records, output_csv, fieldnames=ARTWORK_FIELDS + SOURCE_FIELDS):
+    """
+    Appends artwork records to a CSV, writing the header if the file is new.
+    An existing file keeps its own columns, but columns of fieldnames that
+    the records fill and the file lacks (e.g. the source columns of an older
+    artwork_data.csv) are added to it first, existing rows getting empty
+    values: 'url' must be stored for a crawl to be resumed. Keys missing
+    from a record are left empty, keys outside fieldnames are ignored.
+
+    Returns:
+        The number of records written.
+    """
+    records = list(records)
+    if not records:
+        return 0
+    os.makedirs(os.path.dirname(os.path.abspath(output_csv)), exist_ok=True)
+    write_header = not os.path.isfile(output_csv) or os.path.getsize(output_csv) == 0
+    if not write_header:
+        with open(output_csv, 'r', newline='', encoding='utf-8') as csvfile:
+            header = next(csv.reader(csvfile))
+        missing = [name for name in fieldnames
+                   if name not in header and any(record.get(name) not in (None, '') for record in records)]
+        fieldnames = _add_columns(output_csv, header, missing) if missing else header
+    with open(output_csv, 'a', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore', restval='')
+        if write_header:
+            writer.writeheader()
+        writer.writerows(records)
+    return len(records)
+
+
+def existing_values(output_csv, field):
+    """Values of one column of an existing CSV (to skip records already scraped)."""
+    if not os.path.isfile(output_csv):
+        return set()
+    with open(output_csv, 'r', newline='', encoding='utf-8') as csvfile:
+        return {row[field] for row in csv.DictReader(csvfile) if row.get(field)}
@@ -0,0 +1,39 @@
+"""
+The vectorised parsers of the scraped text columns: python -m pytest tests
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from dalas.analysis.parsing import parse_dimensions, parse_prices
+
+
+class ParsePricesTest(unittest.TestCase):
+
+    def test_plain_and_grouped_amounts(self):
+        texts = ["2500 €", "1500", "12345 €", "1 200 €", "€1,200.50", "1.200,50 EUR", "CHF 1'500", "$ 950",
+                 "1500.5", "Prix sur demande"]
+        prices = parse_prices(pd.Series(texts))
+        np.testing.assert_array_equal(prices['price'],
+                                      [2500, 1500, 12345, 1200, 1200.5, 1200.5, 1500, 950, 1500.5, np.nan])
+        self.assertEqual(list(prices['currency'][:8]), ['EUR'] * 6 + ['CHF', 'USD'])
+
+
+class ParseDimensionsTest(unittest.TestCase):
+
+    def test_trailing_unit(self):
+        dims = parse_dimensions(pd.Series(["60 x 40 x 1.5 cm", "60-80 x 40 cm", "600 x 400 mm", "Unknown"]))
+        np.testing.assert_array_equal(dims['width_cm'], [60, 70, 60, np.nan])
+        np.testing.assert_array_equal(dims['height_cm'], [40, 40, 40, np.nan])
+        self.assertEqual(list(dims['n_dims']), [3, 2, 2, 0])
+
+    def test_unit_after_each_value(self):
+        dims = parse_dimensions(pd.Series(["1.5 m x 2 m", "10 in x 20 in", "60 cm x 40 x 2"]))
+        np.testing.assert_allclose(dims['width_cm'], [150, 25.4, 60])
+        np.testing.assert_allclose(dims['height_cm'], [200, 50.8, 40])
+        self.assertEqual(list(dims['n_dims']), [2, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+The Reddit scraper against a local stand-in for Reddit's JSON API and image
+host (no network): python -m pytest tests
+"""
+import csv
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from dalas.scrape.adapters import get_adapter
+from dalas.scrape.engine import CrawlEngine
+from dalas.scrape.reddit import scrape_subreddit
+
+IMAGE = b"\xff\xd8 not really a jpeg \xff\xd9"
+
+
+def _post(post_id, title, score, url):
+    return {'kind': 't3', 'data': {'id': post_id, 'title': title, 'score': score, 'author': 'painter',
+                                   'url': url, 'link_flair_text': 'Painting'}}
+
+
+class StandInReddit(BaseHTTPRequestHandler):
+    """Two listing pages; images that download, 404, or are cut off mid-body."""
+
+    base = None  # Set once the server has a port
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type='application/json', length=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body) if length is None else length))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path == '/r/Art/top.json':
+            if 'after' not in parse_qs(parts.query):
+                children = [_post('p1', 'Dawn, Ana Silva, Oil on canvas, 2021', 1500, f"{self.base}/img/p1.jpg"),
+                            _post('p2', 'Broken, Bo Lee, Acrylic, 2020', 900, f"{self.base}/img/truncated.jpg"),
+                            _post('p3', 'A link, not an image', 800, "https://example.com/article")]
+                listing = {'after': 't3_p3', 'children': children}
+            else:
+                children = [_post('p4', 'Dusk, me, Watercolor, 2022', 700, f"{self.base}/img/p4.png"),
+                            _post('p5', 'Gone, Cy Doe, Ink, 2019', 600, f"{self.base}/img/missing.jpg"),
+                            _post('p1', 'Dawn, Ana Silva, Oil on canvas, 2021', 1500, f"{self.base}/img/p1.jpg")]
+                listing = {'after': None, 'children': children}
+            self._send(200, json.dumps({'kind': 'Listing', 'data': listing}).encode())
+        elif parts.path in ('/img/p1.jpg', '/img/p4.png'):
+            self._send(200, IMAGE, 'image/jpeg')
+        elif parts.path == '/img/truncated.jpg':
+            self._send(200, IMAGE[:5], 'image/jpeg', length=10_000)  # Connection closes mid-body
+            self.close_connection = True
+        else:
+            self._send(404, b'{"error": 404}')
+
+
+class RedditScraperTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInReddit)
+        StandInReddit.base = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_csv = os.path.join(self.tmp.name, "reddit_art.csv")
+        self.image_dir = os.path.join(self.tmp.name, "Images")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def scrape(self):
+        return scrape_subreddit("Art", pages=5, output_csv=self.output_csv, image_dir=self.image_dir,
+                                base_url=StandInReddit.base, max_concurrency=4)
+
+    def rows(self):
+        with open(self.output_csv, newline='', encoding='utf-8') as f:
+            return {row['source_id']: row for row in csv.DictReader(f)}
+
+    def test_saves_image_posts_and_counts_failures(self):
+        # p3 has no image, p1 is listed twice; p2 is cut off and p5 is a 404
+        self.assertEqual(self.scrape(), (2, 2))
+        rows = self.rows()
+        self.assertEqual(set(rows), {'p1', 'p4'})
+        self.assertEqual(rows['p1']['artist'], 'Ana Silva')
+        self.assertEqual(rows['p1']['techniques'], 'Oil on canvas')
+        self.assertEqual(rows['p1']['upvotes'], '1500')
+        self.assertEqual(rows['p4']['artist'], 'painter')  # "me" -> the post's author
+        self.assertEqual(sorted(os.listdir(self.image_dir)), ['1500_p1.jpg', '700_p4.png'])
+        with open(os.path.join(self.image_dir, '1500_p1.jpg'), 'rb') as f:
+            self.assertEqual(f.read(), IMAGE)
+
+    def test_resume_skips_saved_posts(self):
+        self.scrape()
+        self.assertEqual(self.scrape(), (0, 2))  # Only the failed posts are tried again
+        self.assertEqual(len(self.rows()), 2)
+
+    def test_crawl_as_source_adapter(self):
+        # What `python -m dalas crawl --source reddit` runs
+        engine = CrawlEngine(get_adapter('reddit', base_url=StandInReddit.base), self.output_csv, self.image_dir)
+        self.assertEqual(engine.crawl(max_pages=1), (1, 1))  # p1 saved, p2 cut off, p3 not an image
+        self.assertEqual(set(self.rows()), {'p1'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+Recording HttpClient responses to a WARC archive, against a local stand-in
+server, and replaying archives through the crawl engine with injected
+faults (no network): python -m pytest tests
+"""
+import csv
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from dalas.scrape.adapters import SourceAdapter
+from dalas.scrape.engine import CrawlEngine
+from dalas.scrape.http_client import HttpClient, ResponseTooLargeError
+from dalas.scrape.replay import WarcArchive, record, replay_client, serve
+
+SMALL = b"<html>a page</html>"
+LARGE = b"x" * 4096
+
+
+class StandInSite(BaseHTTPRequestHandler):
+    """A small page, a large one, and a large one sent without Content-Length."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = SMALL if self.path == '/small' else LARGE
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        if self.path != '/chunked':
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = self.path == '/chunked'
+
+
+class RecordTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInSite)
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = HttpClient(max_retries=0, max_bytes=1024)
+        self.archive = record(self.client, os.path.join(self.tmp.name, "pages.warc"))
+
+    def tearDown(self):
+        self.client.close()
+        self.tmp.cleanup()
+
+    def test_records_responses(self):
+        self.assertEqual(self.client.get(f"{self.base}/small").content, SMALL)
+        self.assertIn(f"{self.base}/small", self.archive)
+
+    def test_oversized_bodies_are_not_recorded(self):
+        for path in ('/large', '/chunked'):  # Rejected by Content-Length, then while streaming
+            with self.assertRaises(ResponseTooLargeError):
+                self.client.get(f"{self.base}{path}")
+            self.assertNotIn(f"{self.base}{path}", self.archive)
+
+
+BASE = "https://gallery.example"
+PAGES = [f"{BASE}/artwork/{i}" for i in range(4)]
+IMAGE = b"\xff\xd8 not really a jpeg \xff\xd9"
+
+
+class PlainAdapter(SourceAdapter):
+    """Detail pages are "title|artist|image URL" lines (no HTML parser needed)."""
+
+    name = 'plain'
+
+    def parse(self, content):
+        return content.decode('utf-8').split('|')
+
+    def parse_detail(self, url, doc):
+        return {'title': doc[0], 'artist': doc[1], 'year': '2024', 'url': url, 'source': self.name}
+
+    def image_url(self, url, doc):
+        return doc[2]
+
+
+class ReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive = WarcArchive(os.path.join(self.tmp.name, "gallery.warc"))
+        for i, url in enumerate(PAGES):
+            page = f"Work {i}|Painter {i}|{BASE}/media/{i}.jpg"
+            self.archive.write(url, 200, {'Content-Type': 'text/plain; charset=utf-8'}, page.encode())
+            self.archive.write(f"{BASE}/media/{i}.jpg", 200, {'Content-Type': 'image/jpeg'}, IMAGE)
+        self.output_csv = os.path.join(self.tmp.name, "data.csv")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def crawl(self, workers=2, **faults):
+        client = replay_client(self.archive.path, max_retries=0, **faults)
+        engine = CrawlEngine(PlainAdapter(), self.output_csv, os.path.join(self.tmp.name, "Images"),
+                             workers=workers, client=client)
+        return engine.run(PAGES), client.faults.stats
+
+    def rows(self):
+        if not os.path.exists(self.output_csv):
+            return []
+        with open(self.output_csv, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    def test_lookups_and_misses(self):
+        client = replay_client(self.archive.path, max_retries=0)
+        response = client.get(PAGES[0])
+        self.assertEqual((response.status_code, response.text), (200, f"Work 0|Painter 0|{BASE}/media/0.jpg"))
+        self.assertEqual(response.headers['Content-Type'], 'text/plain; charset=utf-8')
+        self.assertEqual(client.get(f"{BASE}/artwork/404").status_code, 404)
+        self.assertEqual(client.faults.stats, {'served': 1, 'missing': 1, 'errors': 0, 'dropped': 0})
+
+    def test_replayed_crawl(self):
+        (n_saved, n_failed), stats = self.crawl()
+        self.assertEqual((n_saved, n_failed), (4, 0))
+        self.assertEqual(stats['served'], 8)  # Pages and images
+        rows = self.rows()
+        self.assertEqual(sorted(row['url'] for row in rows), PAGES)
+        self.assertEqual({row['image_filename'] for row in rows}, {f"Work {i}_Painter {i}_2024.jpg" for i in range(4)})
+
+    def test_latency(self):
+        start = time.perf_counter()
+        self.assertEqual(self.crawl(latency=0.05)[0], (4, 0))
+        self.assertGreaterEqual(time.perf_counter() - start, 8 * 0.05 / 2)  # 8 requests on 2 workers
+
+    def test_injected_errors_fail_pages(self):
+        (n_saved, n_failed), stats = self.crawl(error_rate=1.0)
+        self.assertEqual((n_saved, n_failed), (0, 4))
+        self.assertEqual(stats['errors'], 4)
+        self.assertEqual(self.rows(), [])
+
+    def test_dropped_connections_fail_pages(self):
+        (n_saved, n_failed), stats = self.crawl(drop_rate=1.0)
+        self.assertEqual((n_saved, n_failed), (0, 4))
+        self.assertEqual(stats['dropped'], 4)
+        self.assertEqual(self.rows(), [])
+
+    def test_partial_faults_are_reproducible(self):
+        runs = []
+        for _ in range(2):
+            counts, stats = self.crawl(workers=1, error_rate=0.3, seed=1)  # One worker: draws in a fixed order
+            runs.append((counts, stats, sorted((row['url'], row['image_filename']) for row in self.rows())))
+            os.remove(self.output_csv)
+            shutil.rmtree(os.path.join(self.tmp.name, "Images"), ignore_errors=True)
+        self.assertEqual(runs[0], runs[1])
+        (n_saved, n_failed), stats, rows = runs[0]
+        self.assertEqual(n_saved + n_failed, 4)
+        self.assertEqual(len(rows), n_saved)
+        # Every injected error is a failed page or an image marked as failed
+        failed_images = sum(image == "Image Download Failed" for _, image in rows)
+        self.assertEqual(stats['errors'], n_failed + failed_images)
+        self.assertGreater(stats['errors'], 0)
+
+    def test_serve(self):
+        server = serve(self.archive.path, port=0)
+        dropping = serve(self.archive.path, port=0, drop_rate=1.0)
+        try:
+            client = HttpClient(max_retries=0)
+            local = f"http://127.0.0.1:{server.server_port}"
+            response = client.get(f"{local}/media/2.jpg")  # Matched on path and query
+            self.assertEqual((response.status_code, response.content), (200, IMAGE))
+            self.assertEqual(client.get(f"{local}/nowhere").status_code, 404)
+            self.assertEqual(server.faults.stats['served'], 1)
+            self.assertEqual(server.faults.stats['missing'], 1)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                client.get(f"http://127.0.0.1:{dropping.server_port}/media/2.jpg")
+            self.assertEqual(dropping.faults.stats['dropped'], 1)
+        finally:
+            for s in (server, dropping):
+                s.shutdown()
+                s.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main()